@@ -0,0 +1,175 @@
+"""
+Anytime Repairing A* (ARA*)
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+ARA* menjalankan weighted A* dengan f = g + epsilon * h. Dengan epsilon > 1
+jalur pertama ditemukan jauh lebih cepat dan cost-nya paling banyak epsilon
+kali cost optimal. Selama waktu atau budget ekspansi masih tersisa, epsilon
+diturunkan dan search diperbaiki: nilai g dan parent dari iterasi sebelumnya
+dipakai lagi, hanya node di OPEN dan node yang nilai g-nya turun setelah
+ditutup (INCONS) yang diproses ulang. Setiap hasil melaporkan batas
+suboptimalitas (cost / batas bawah cost optimal); 1.0 berarti optimal.
+
+Batas hanya berlaku jika heuristik admissible dan konsisten.
+"""
+
+import heapq
+import itertools
+import time
+from search_result import SearchResult
+
+INF = float('inf')
+
+
+class AnytimeResult(SearchResult):
+    def __init__(self, goal, cost, parents, expanded, epsilon, bound):
+        """
+        epsilon: heuristic weight of the iteration that produced the result
+        bound: cost is at most bound times the optimal cost (1.0: optimal)
+        expanded: expansions of all iterations so far
+        """
+        super().__init__(goal, cost, parents, expanded)
+        self.epsilon = epsilon
+        self.bound = bound
+
+    @property
+    def optimal(self):
+        return self.bound <= 1.0
+
+    def __repr__(self):
+        return (f"AnytimeResult(path={self.path}, cost={self.cost}, expanded={self.expanded}, "
+                f"epsilon={self.epsilon}, bound={self.bound:.3f})")
+
+
+def ara_star(graph, start, goal, heuristic, epsilon=3.0, step=0.5, time_limit=None, max_expansions=None):
+    """
+    Generator of AnytimeResult for start -> goal, one per finished iteration,
+    each with a cost and bound no worse than the previous one
+    graph: weighted adjacency (dict or CSRGraph), edge costs >= 0
+    heuristic: h(node) estimating the cost to goal
+    epsilon: initial heuristic weight (>= 1), lowered by step after every iteration
+    time_limit: seconds for the whole search, max_expansions: expansion budget;
+                when either runs out the generator stops after the last finished
+                iteration (nothing is yielded if the first one did not finish)
+    Stops after yielding an optimal result, or without yielding if goal is unreachable
+    """
+    if epsilon < 1:
+        raise ValueError("epsilon must be at least 1")
+    if step <= 0:
+        raise ValueError("step must be positive")
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    counter = itertools.count()
+
+    g = {start: 0}
+    parents = {}
+    via_cost = {}       # node -> cost of the edge from parents[node]
+    h_cost = {}         # heuristic values, computed once per node
+    open_nodes = {start}
+    incons = set()      # nodes whose g dropped after they were closed
+    expanded = 0
+
+    def h(node):
+        value = h_cost.get(node)
+        if value is None:
+            value = h_cost[node] = heuristic(node)
+        return value
+
+    while True:
+        # Re-key OPEN plus INCONS for the current epsilon and search again
+        open_nodes |= incons
+        incons = set()
+        closed = set()
+        pq = [(g[node] + epsilon * h(node), next(counter), node) for node in open_nodes]
+        heapq.heapify(pq)
+
+        # Improve the path: expand while some open node could beat the goal's f value
+        while pq:
+            key, _, node = pq[0]
+            if node not in open_nodes or key != g[node] + epsilon * h_cost[node]:
+                heapq.heappop(pq)
+                continue
+            if g.get(goal, INF) + epsilon * h(goal) <= key:
+                break
+            if max_expansions is not None and expanded >= max_expansions:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            heapq.heappop(pq)
+            open_nodes.discard(node)
+            closed.add(node)
+            expanded += 1
+
+            cost = g[node]
+            for neighbor, edge_cost in graph.get(node, ()):
+                new_cost = cost + edge_cost
+                if new_cost < g.get(neighbor, INF):
+                    g[neighbor] = new_cost
+                    parents[neighbor] = node
+                    via_cost[neighbor] = edge_cost
+                    if neighbor in closed:
+                        incons.add(neighbor)
+                    else:
+                        open_nodes.add(neighbor)
+                        heapq.heappush(pq, (new_cost + epsilon * h(neighbor), next(counter), neighbor))
+
+        if goal not in g:
+            return
+
+        # Only the path is kept: later iterations keep changing the parent map
+        path_parents = {}
+        path_cost = 0
+        node = goal
+        while node != start:
+            path_parents[node] = parents[node]
+            path_cost += via_cost[node]
+            node = parents[node]
+
+        # Every cheaper path still has to pass through OPEN or INCONS
+        lower_bound = min((g[node] + h_cost[node] for node in open_nodes | incons), default=INF)
+        bound = 1.0 if path_cost <= lower_bound else min(epsilon, path_cost / lower_bound)
+        yield AnytimeResult(goal, path_cost, path_parents, expanded, epsilon, bound)
+
+        if bound <= 1.0:
+            return
+        epsilon = max(1.0, min(epsilon - step, bound))
+
+
+# Example usage and test
+if __name__ == "__main__":
+    import random
+    from astar import AStarGraph
+    from graph_data import get_test_nodes
+
+    start_node, goal_node = get_test_nodes()
+    ag = AStarGraph()
+
+    print("Anytime Repairing A* (ARA*) Test")
+    print("=" * 50)
+    for result in ara_star(ag.graph, start_node, goal_node, ag.heuristic_function(goal_node)):
+        print(result)
+    print(f"A*: {ag.astar(start_node, goal_node)}")
+
+    # 300 x 300 grid with weights 1..9 and Manhattan distance as heuristic
+    size = 300
+    rng = random.Random(0)
+    grid = {}
+    for x in range(size):
+        for y in range(size):
+            grid[(x, y)] = [((x + dx, y + dy), rng.randint(1, 9)) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                            if 0 <= x + dx < size and 0 <= y + dy < size]
+    grid_graph = AStarGraph(grid)
+    grid_graph.heuristics = {(x, y): (size - 1 - x) + (size - 1 - y) for (x, y) in grid}
+    start, goal = (0, 0), (size - 1, size - 1)
+
+    print(f"\nGrid {size}x{size}:")
+    began = time.perf_counter()
+    for result in ara_star(grid_graph.graph, start, goal, grid_graph.heuristic_function(goal)):
+        print(f"  {time.perf_counter() - began:.3f}s epsilon={result.epsilon} cost={result.cost} "
+              f"bound={result.bound:.3f} expanded={result.expanded}")
+    began = time.perf_counter()
+    optimal = grid_graph.astar(start, goal)
+    print(f"  A*: {time.perf_counter() - began:.3f}s cost={optimal.cost} expanded={optimal.expanded}")
+    for budget in ({"max_expansions": 20000}, {"time_limit": 1.0}):
+        result = grid_graph.anytime_astar(start, goal, **budget)
+        print(f"  {budget}: cost={result.cost} bound={result.bound:.3f} epsilon={result.epsilon}")
@@ -5,18 +5,130 @@ NIM: 32602500023
 """
 
 import heapq
+import itertools
 import math
+from anytime_search import ara_star
+from bidirectional import add_reverse_edge, bidirectional_search, build_reverse_graph, set_edge_weight
+from csr_graph import CSRGraph, ensure_mutable
 from graph_data import get_weighted_graph_data, get_heuristics_data, get_test_nodes, get_grid_data
+from incremental_search import LPAStarPlanner
+from landmarks import LandmarkHeuristic
+from search_result import SearchResult, path_parents, reconstruct_path
+from search_stats import traced_search
+
+
+class _BoundedNode:
+    def __init__(self, state, g_cost, f_cost, parent):
+        """Search tree node kept in memory by sma_star"""
+        self.state = state
+        self.g_cost = g_cost
+        self.f_cost = f_cost
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.successors = None  # [(state, edge_cost)], filled on first expansion
+        self.generated = 0      # successors[:generated] have been generated at least once
+        self.children = {}      # state -> _BoundedNode, successors currently in memory
+        self.forgotten = {}     # state -> backed-up f_cost of dropped successors
+        self.seq = -1
+        self.in_open = False
+    
+    def path_states(self):
+        node, states = self, set()
+        while node is not None:
+            states.add(node.state)
+            node = node.parent
+        return states
+    
+    def open_key(self):
+        """f_cost of the next successor this node would generate"""
+        if self.generated < len(self.successors):
+            return self.f_cost
+        return min(self.forgotten.values())
+    
+    def backup(self):
+        """f_cost = min over all successors once every successor has been generated"""
+        node = self
+        while node is not None and node.generated == len(node.successors):
+            costs = [child.f_cost for child in node.children.values()]
+            costs.extend(node.forgotten.values())
+            f_cost = min(costs, default=float('inf'))
+            if f_cost == node.f_cost:
+                break
+            node.f_cost = f_cost
+            node = node.parent
+    
+    def parents(self):
+        """came_from dict for the path from the root to this node"""
+        came_from = {}
+        node = self
+        while node.parent is not None:
+            came_from[node.state] = node.parent.state
+            node = node.parent
+        return came_from
+
 
 class AStarGraph:
-    def __init__(self):
-        self.graph = get_weighted_graph_data()
-        self.heuristics = get_heuristics_data()
+    def __init__(self, graph=None):
+        if graph is None:
+            # Private copy: edge updates must not leak into graph_data or other instances
+            graph = {node: list(edges) for node, edges in get_weighted_graph_data().items()}
+        self.graph = graph
+        self.reverse_graph = None
+        self.heuristics = dict(get_heuristics_data())
+        self.landmarks = None
+        self.num_landmarks = 0
+        self.listeners = []
     
     def add_edge(self, u, v, weight):
+        ensure_mutable(self.graph)
         if u not in self.graph:
             self.graph[u] = []
         self.graph[u].append((v, weight))
+        if self.reverse_graph is not None:
+            add_reverse_edge(self.reverse_graph, u, v, weight)
+        # New edges can shorten distances, so landmark bounds must be recomputed
+        self.landmarks = None
+    
+    def update_edge(self, u, v, weight):
+        """Change the weight of the edge u -> v (every parallel copy), KeyError if there is none"""
+        ensure_mutable(self.graph)
+        if not set_edge_weight(self.graph, u, v, weight):
+            raise KeyError((u, v))
+        if self.reverse_graph is not None:
+            set_edge_weight(self.reverse_graph, v, u, weight)
+        # Changed weights invalidate the landmark bounds as well
+        self.landmarks = None
+    
+    def remove_edge(self, u, v):
+        """Delete the edge u -> v (every parallel copy), KeyError if there is none"""
+        ensure_mutable(self.graph)
+        if not set_edge_weight(self.graph, u, v):
+            raise KeyError((u, v))
+        if self.reverse_graph is not None:
+            set_edge_weight(self.reverse_graph, v, u)
+        # Removed edges invalidate the landmark bounds as well
+        self.landmarks = None
+    
+    def compact(self):
+        """Convert the adjacency dict to a read-only CSRGraph to save memory"""
+        if not isinstance(self.graph, CSRGraph):
+            self.graph = CSRGraph.from_adjacency(self.graph)
+            self.reverse_graph = None
+            self.landmarks = None
+        return self
+    
+    def add_listener(self, listener):
+        """Attach a SearchListener (e.g. SearchStats) that receives every step of astar()"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+    
+    def get_reverse_graph(self):
+        """Reverse adjacency used by the backward half of bidirectional search"""
+        if self.reverse_graph is None:
+            self.reverse_graph = build_reverse_graph(self.graph)
+        return self.reverse_graph
     
     def set_heuristic(self, node, value):
         """Set heuristic value for a node"""
@@ -26,6 +138,27 @@ class AStarGraph:
         """Set heuristic values for multiple nodes"""
         self.heuristics.update(heuristic_dict)
     
+    def use_landmarks(self, num_landmarks=4):
+        """
+        Use ALT landmark heuristics instead of the heuristics table
+        Works for any goal; pass 0 to go back to the heuristics table
+        """
+        self.num_landmarks = num_landmarks
+        self.landmarks = None
+    
+    def get_landmarks(self):
+        """Landmark heuristic, (re)built lazily after the graph changes"""
+        if self.landmarks is None and self.num_landmarks > 0:
+            self.landmarks = LandmarkHeuristic(self.graph, self.get_reverse_graph(), self.num_landmarks)
+        return self.landmarks
+    
+    def heuristic_function(self, goal):
+        """Return h(node) estimating the cost from node to goal"""
+        landmarks = self.get_landmarks()
+        if landmarks is not None:
+            return landmarks.heuristic_to(goal)
+        return lambda node: self.heuristics.get(node, 0)
+    
     def calculate_euclidean_distance(self, node1_pos, node2_pos):
         """Calculate Euclidean distance between two points"""
         x1, y1 = node1_pos
@@ -38,44 +171,293 @@ class AStarGraph:
         x2, y2 = node2_pos
         return abs(x2 - x1) + abs(y2 - y1)
     
-    def astar(self, start, goal):
+    def astar(self, start, goal, bidirectional=False):
         """
         A* implementation using priority queue
-        Returns (path, total_cost) from start to goal if found, None otherwise
+        bidirectional: forward A* plus a backward search from goal, stopping
+        where they meet (the backward side uses landmarks if enabled, else no heuristic)
+        Attached listeners see every step of the one-directional search
+        Returns SearchResult (unpacks as (path, total_cost)) if found, None otherwise
         """
-        # Priority queue: (f_cost, g_cost, node, path)
+        heuristic = self.heuristic_function(goal)
+        
+        if bidirectional:
+            landmarks = self.get_landmarks()
+            reverse_heuristic = landmarks.heuristic_from(start) if landmarks is not None else None
+            return bidirectional_search(
+                self.graph, self.get_reverse_graph(), start, goal,
+                heuristic=heuristic, reverse_heuristic=reverse_heuristic
+            )
+        
+        if self.listeners:
+            return traced_search(self.graph, start, goal, self.listeners, heuristic)
+        
+        graph = self.graph
+        if isinstance(graph, CSRGraph) and start in graph.node_index and goal in graph.node_index:
+            goal_id = graph.node_index[goal]
+            found = self._astar_ids(graph.node_index[start], goal_id, heuristic)
+            if found is None:
+                return None
+            g_cost, came_from, expanded = found
+            return SearchResult(goal, g_cost, graph.parent_names(came_from, goal_id), expanded)
+        
+        # Priority queue: (f_cost, g_cost, node, parent)
         # f_cost = g_cost + h_cost
-        pq = [(self.heuristics.get(start, 0), 0, start, [start])]
+        pq = [(heuristic(start), 0, start, None)]
         visited = set()
+        came_from = {}
         
         while pq:
-            (f_cost, g_cost, node, path) = heapq.heappop(pq)
+            (f_cost, g_cost, node, parent) = heapq.heappop(pq)
             
             if node in visited:
                 continue
             
             visited.add(node)
+            if parent is not None:
+                came_from[node] = parent
             
             if node == goal:
-                return (path, g_cost)
+                return SearchResult(goal, g_cost, path_parents(came_from, goal), len(visited))
             
             if node in self.graph:
                 for neighbor, edge_cost in self.graph[node]:
                     if neighbor not in visited:
                         new_g_cost = g_cost + edge_cost
-                        h_cost = self.heuristics.get(neighbor, 0)
+                        h_cost = heuristic(neighbor)
                         f_cost = new_g_cost + h_cost
-                        heapq.heappush(pq, (f_cost, new_g_cost, neighbor, path + [neighbor]))
+                        heapq.heappush(pq, (f_cost, new_g_cost, neighbor, node))
+        
+        return None
+    
+    def _astar_ids(self, start, goal, heuristic):
+        """
+        The heapq loop of astar on the integer ids of a CSRGraph (heuristic still
+        takes names); returns (cost, parent ids, expanded) or None
+        """
+        names = self.graph.node_names
+        neighbors = self.graph.weighted_neighbor_ids
+        visited = bytearray(self.graph.node_count())
+        came_from = {}
+        expanded = 0
+        pq = [(heuristic(names[start]), 0, start, -1)]
+        
+        while pq:
+            (f_cost, g_cost, node, parent) = heapq.heappop(pq)
+            if visited[node]:
+                continue
+            
+            visited[node] = 1
+            expanded += 1
+            if parent >= 0:
+                came_from[node] = parent
+            if node == goal:
+                return g_cost, came_from, expanded
+            
+            for neighbor, edge_cost in neighbors(node):
+                if not visited[neighbor]:
+                    new_g_cost = g_cost + edge_cost
+                    heapq.heappush(pq, (new_g_cost + heuristic(names[neighbor]), new_g_cost, neighbor, node))
+        
+        return None
+    
+    def anytime_astar(self, start, goal, epsilon=3.0, step=0.5, time_limit=None, max_expansions=None):
+        """
+        ARA* (see anytime_search.py): weighted A* with heuristic weight epsilon,
+        then lowered by step and repaired while the budget lasts
+        time_limit: seconds, max_expansions: expansions over all iterations
+        Returns the best AnytimeResult found within the budget (result.bound is
+        its suboptimality bound, 1.0 when optimal), None if none was found
+        """
+        best = None
+        for best in ara_star(self.graph, start, goal, self.heuristic_function(goal),
+                             epsilon, step, time_limit, max_expansions):
+            pass
+        return best
+    
+    def incremental_planner(self, start, goal):
+        """
+        LPA* planner for start -> goal (see incremental_search.py)
+        After edge changes made through the planner, plan() repairs the previous
+        search instead of starting over; uses the heuristics table, not landmarks
+        """
+        return LPAStarPlanner(self, start, goal)
+    
+    def ida_star(self, start, goal):
+        """
+        IDA*: depth-first search bounded by f_cost, raising the bound to the
+        smallest f_cost that exceeded it until goal is reached
+        Memory is O(depth): only the current path and its edge iterators are stored,
+        but states reachable along many paths are searched again in every iteration
+        Returns SearchResult (unpacks as (path, total_cost)) if found, None otherwise
+        """
+        heuristic = self.heuristic_function(goal)
+        bound = heuristic(start)
+        expanded = 0
+        
+        while True:
+            expanded += 1
+            if start == goal:
+                return SearchResult(goal, 0, {}, expanded)
+            
+            # Explicit stack instead of recursion: path[i] is expanded via edges[i]
+            path = [start]
+            g_costs = [0]
+            edges = [iter(self.graph.get(start, ()))]
+            on_path = {start}
+            next_bound = float('inf')
+            
+            while edges:
+                edge = next(edges[-1], None)
+                if edge is None:
+                    edges.pop()
+                    g_costs.pop()
+                    on_path.discard(path.pop())
+                    continue
+                
+                neighbor, edge_cost = edge
+                if neighbor in on_path:
+                    continue
+                g_cost = g_costs[-1] + edge_cost
+                f_cost = g_cost + heuristic(neighbor)
+                if f_cost > bound:
+                    next_bound = min(next_bound, f_cost)
+                    continue
+                
+                if neighbor == goal:
+                    path.append(neighbor)
+                    came_from = {path[i + 1]: path[i] for i in range(len(path) - 1)}
+                    return SearchResult(goal, g_cost, came_from, expanded)
+                
+                expanded += 1
+                path.append(neighbor)
+                g_costs.append(g_cost)
+                edges.append(iter(self.graph.get(neighbor, ())))
+                on_path.add(neighbor)
+            
+            if next_bound == float('inf'):
+                return None
+            bound = next_bound
+    
+    def sma_star(self, start, goal, memory_limit=10000):
+        """
+        Simplified memory-bounded A* (SMA*)
+        Successors are generated one at a time and at most memory_limit search
+        nodes are kept. When memory is full the worst leaf (highest f_cost,
+        shallowest) is dropped; its f_cost is remembered by its parent, which
+        stays in the open list so the branch can be regenerated later. A successor
+        already in memory with a lower or equal g_cost is not generated twice
+        Optimal if the cheapest path has fewer than memory_limit nodes
+        Returns SearchResult (unpacks as (path, total_cost)) if found, None otherwise
+        """
+        if memory_limit < 2:
+            raise ValueError("memory_limit must be at least 2")
+        heuristic = self.heuristic_function(goal)
+        counter = itertools.count()
+        # Open list kept in two heaps with lazy deletion: best first (deepest on
+        # ties) and worst first (shallowest on ties)
+        best = []
+        worst = []
+        
+        def push(node, key):
+            nonlocal best, worst
+            node.seq = next(counter)
+            node.in_open = True
+            heapq.heappush(best, (key, -node.depth, node.seq, node))
+            heapq.heappush(worst, (-key, node.depth, node.seq, node))
+            if len(best) > 4 * memory_limit:
+                # Drop stale entries so the heaps stay within the memory bound
+                best = [entry for entry in best if entry[3].in_open and entry[3].seq == entry[2]]
+                worst = [entry for entry in worst if entry[3].in_open and entry[3].seq == entry[2]]
+                heapq.heapify(best)
+                heapq.heapify(worst)
+        
+        root = _BoundedNode(start, 0, heuristic(start), None)
+        push(root, root.f_cost)
+        in_memory = {start: [root]}  # state -> nodes for that state currently in memory
+        stored = 1
+        expanded = 0
+        
+        while best:
+            (key, _, seq, node) = heapq.heappop(best)
+            if not node.in_open or seq != node.seq:
+                continue
+            node.in_open = False
+            if key == float('inf'):
+                return None
+            if node.state == goal:
+                return SearchResult(goal, node.g_cost, node.parents(), expanded)
+            
+            if node.successors is None:
+                expanded += 1
+                on_path = node.path_states()
+                edge_costs = {}
+                for neighbor, edge_cost in self.graph.get(node.state, ()):
+                    if neighbor not in on_path and edge_cost < edge_costs.get(neighbor, float('inf')):
+                        edge_costs[neighbor] = edge_cost
+                node.successors = list(edge_costs.items())
+                if not node.successors:
+                    node.backup()  # dead end: f_cost becomes inf, first in line to be forgotten
+                    push(node, node.f_cost)
+                    continue
+            
+            # Next successor: a new one, or else the best forgotten one
+            if node.generated < len(node.successors):
+                neighbor, edge_cost = node.successors[node.generated]
+                node.generated += 1
+                g_cost = node.g_cost + edge_cost
+                if any(other.g_cost <= g_cost and other.depth <= node.depth + 1
+                       for other in in_memory.get(neighbor, ())):
+                    # Dominated by a node for the same state that is already in memory
+                    node.forgotten[neighbor] = float('inf')
+                    node.backup()
+                    if len(node.children) < len(node.successors):
+                        push(node, node.open_key())
+                    continue
+                if neighbor != goal and node.depth + 2 >= memory_limit:
+                    f_cost = float('inf')  # no room left for a path through it
+                else:
+                    f_cost = max(node.f_cost, g_cost + heuristic(neighbor))
+            else:
+                neighbor = min(node.forgotten, key=node.forgotten.get)
+                f_cost = node.forgotten.pop(neighbor)
+                g_cost = node.g_cost + dict(node.successors)[neighbor]
+            child = _BoundedNode(neighbor, g_cost, f_cost, node)
+            node.children[neighbor] = child
+            in_memory.setdefault(neighbor, []).append(child)
+            stored += 1
+            node.backup()
+            
+            # Forget the worst leaves (the new child is not in the open list yet)
+            kept = []
+            while stored > memory_limit and worst:
+                entry = heapq.heappop(worst)
+                victim = entry[3]
+                if not victim.in_open or entry[2] != victim.seq:
+                    continue
+                parent = victim.parent
+                if victim.children or parent is None:
+                    kept.append(entry)
+                    continue
+                victim.in_open = False
+                del parent.children[victim.state]
+                in_memory[victim.state].remove(victim)
+                parent.forgotten[victim.state] = victim.f_cost
+                stored -= 1
+                if parent is not node:
+                    push(parent, parent.open_key())
+            for entry in kept:
+                heapq.heappush(worst, entry)
+            
+            push(child, child.f_cost)
+            if len(node.children) < len(node.successors):
+                push(node, node.open_key())
         
         return None
     
     def reconstruct_path(self, came_from, current):
         """Helper method to reconstruct path from came_from dictionary"""
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
-        return path[::-1]  # Reverse to get from start to goal
+        return reconstruct_path(came_from, current)
 
 
 # Example usage and test
@@ -116,6 +498,25 @@ if __name__ == "__main__":
     else:
         print(f"No path found from {start_node} to {goal_node}")
     
+    # Landmark heuristics work for any goal, not only the one in HEURISTICS_DATA
+    print("\n--- A* with Landmark (ALT) Heuristics ---")
+    alt_graph = AStarGraph()
+    alt_graph.use_landmarks(3)
+    print(f"Landmarks: {alt_graph.get_landmarks().landmarks}")
+    for goal in (goal_node, 'G'):
+        print(f"{start_node} -> {goal}: {alt_graph.astar(start_node, goal)}")
+    
+    # Memory-bounded variants return the same (path, cost) result
+    print("\n--- Memory-bounded A* ---")
+    print(f"IDA*: {astar_graph.ida_star(start_node, goal_node)}")
+    for limit in (4, 5, 20):
+        print(f"SMA* (memory_limit={limit}): {astar_graph.sma_star(start_node, goal_node, limit)}")
+    
+    # Anytime A*: first a path within epsilon of optimal, then refined while the budget lasts
+    print("\n--- Anytime A* (ARA*) ---")
+    for budget in (2, 100):
+        print(f"max_expansions={budget}: {astar_graph.anytime_astar(start_node, goal_node, max_expansions=budget)}")
+    
     # Example with grid-based heuristic using centralized data
     print("\n--- Grid-based A* Example ---")
     grid_graph = AStarGraph()
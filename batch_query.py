@@ -0,0 +1,213 @@
+"""
+Parallel Batch Shortest-Path Queries
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Menjawab banyak query (start, goal) sekaligus dengan sebuah process pool.
+Graf dikirim ke worker tanpa pickle adjacency dict: graf hasil
+CSRGraph.load dibuka ulang dari file (mmap), graf lain disalin sekali ke
+shared memory lalu setiap worker memetakan blok yang sama. Query dengan
+start yang sama dikelompokkan sehingga cukup satu UCS dari start tersebut
+(WeightedGraph.shortest_path_tree) untuk menjawab semua goal-nya. Hasil
+dikembalikan sesuai urutan query.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from astar import AStarGraph
+from csr_graph import CSRGraph
+from ucs import WeightedGraph
+
+_worker_graph = None
+_worker_heuristics = None
+_worker_searchers = None  # {"ucs": WeightedGraph, "astar": AStarGraph} reused by every query
+
+
+def _open_graph(source):
+    kind, value = source
+    if kind == "file":
+        return CSRGraph.load(value)
+    if kind == "shared_memory":
+        return CSRGraph.attach_shared_memory(value)
+    return value
+
+
+def _init_worker(source, heuristics):
+    """Attach to the shared graph once per worker process"""
+    global _worker_graph, _worker_heuristics, _worker_searchers
+    _worker_graph = _open_graph(source)
+    _worker_heuristics = heuristics
+    astar_searcher = AStarGraph(_worker_graph)
+    astar_searcher.heuristics = heuristics or {}
+    _worker_searchers = {"ucs": WeightedGraph(_worker_graph), "astar": astar_searcher}
+
+
+def single_source_results(graph, start, goals):
+    """
+    One UCS from start that stops once every goal is settled
+    graph: WeightedGraph (reuse one for many calls) or a weighted adjacency
+    Returns a SearchResult (or None if unreachable) per goal, in goals order
+    """
+    searcher = graph if isinstance(graph, WeightedGraph) else WeightedGraph(graph)
+    tree = searcher.shortest_path_tree(start, targets=goals)
+    return [tree.result(goal) for goal in goals]
+
+
+def run_groups(groups, method):
+    """
+    Answer a chunk of grouped queries in a worker
+    groups: [(start, [(query index, goal), ...]), ...]
+    Returns [(query index, SearchResult or None), ...]
+    """
+    answers = []
+    for start, targets in groups:
+        indices = [index for index, _ in targets]
+        goals = [goal for _, goal in targets]
+        if method == "ucs":
+            results = single_source_results(_worker_searchers["ucs"], start, goals)
+        else:
+            searcher = _worker_searchers["astar"]
+            results = [searcher.astar(start, goal) for goal in goals]
+        answers.extend(zip(indices, results))
+    return answers
+
+
+def run_query(start, goal, method):
+    """Answer a single query in a worker"""
+    return run_groups([(start, [(0, goal)])], method)[0][1]
+
+
+class BatchQueryExecutor:
+    METHODS = ("ucs", "astar")
+
+    def __init__(self, graph, workers=None, heuristics=None):
+        """
+        graph: WeightedGraph, AStarGraph, CSRGraph or weighted adjacency dict
+        workers: number of processes (default: CPU count), 1 runs in this process
+        heuristics: heuristic table for method='astar' (default: the AStarGraph's table)
+        """
+        if heuristics is None:
+            heuristics = getattr(graph, "heuristics", None)
+        graph = getattr(graph, "graph", graph)
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_adjacency(graph)
+        self.graph = graph
+        self.heuristics = heuristics
+        self.workers = workers or os.cpu_count() or 1
+        self.block = None
+        self.pool = None
+        self.thread = None
+
+    def _graph_source(self):
+        """How workers reach the graph: file, shared memory block or (last resort) a pickled copy"""
+        if self.graph.filename is not None:
+            return ("file", self.graph.filename)
+        if self.graph.shared_memory is not None:
+            return ("shared_memory", self.graph.shared_memory.name)
+        try:
+            self.block = self.graph.to_shared_memory()
+        except TypeError:
+            # Node names that are not strings cannot go into the binary format
+            return ("graph", self.graph)
+        return ("shared_memory", self.block.name)
+
+    def _start(self):
+        if self.workers == 1:
+            _init_worker(("graph", self.graph), self.heuristics)
+        elif self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                            initargs=(self._graph_source(), self.heuristics))
+
+    def run(self, queries, method="ucs"):
+        """
+        queries: iterable of (start, goal)
+        Returns a list with a SearchResult (or None) per query, in query order
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        groups = {}
+        count = 0
+        for index, (start, goal) in enumerate(queries):
+            groups.setdefault(start, []).append((index, goal))
+            count += 1
+
+        # Chunks of whole groups, about 4 per worker so slow chunks even out
+        target_size = max(1, count // (4 * self.workers))
+        chunks, chunk, size = [], [], 0
+        for start, targets in groups.items():
+            chunk.append((start, targets))
+            size += len(targets)
+            if size >= target_size:
+                chunks.append(chunk)
+                chunk, size = [], 0
+        if chunk:
+            chunks.append(chunk)
+
+        self._start()
+        results = [None] * count
+        if self.pool is None:
+            answers = (run_groups(chunk, method) for chunk in chunks)
+        else:
+            answers = self.pool.map(run_groups, chunks, [method] * len(chunks))
+        for chunk_answers in answers:
+            for index, result in chunk_answers:
+                results[index] = result
+        return results
+
+    def submit(self, start, goal, method="ucs"):
+        """
+        Queue a single query without waiting for it
+        Returns a concurrent.futures.Future of its SearchResult (or None)
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        self._start()
+        if self.pool is not None:
+            return self.pool.submit(run_query, start, goal, method)
+        # workers=1: one background thread so the caller is not blocked
+        if self.thread is None:
+            self.thread = ThreadPoolExecutor(1)
+        return self.thread.submit(run_query, start, goal, method)
+
+    def close(self):
+        """Stop the workers and release the shared memory block"""
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        if self.thread is not None:
+            self.thread.shutdown()
+            self.thread = None
+        if self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def batch_query(graph, queries, method="ucs", workers=None):
+    """Run one batch of (start, goal) queries and shut the workers down"""
+    with BatchQueryExecutor(graph, workers) as executor:
+        return executor.run(queries, method)
+
+
+# Example usage and test
+if __name__ == "__main__":
+    wg = WeightedGraph()
+    nodes = list(wg.graph)
+    queries = [(start, goal) for start in nodes for goal in nodes]
+
+    print("Parallel Batch Query Test")
+    print("=" * 50)
+    with BatchQueryExecutor(wg, workers=2) as executor:
+        results = executor.run(queries)
+    mismatches = sum(1 for (start, goal), result in zip(queries, results)
+                     if result != wg.ucs(start, goal))
+    print(f"{len(queries)} queries from {len(nodes)} sources, mismatches with ucs: {mismatches}")
+    for (start, goal), result in zip(queries, results):
+        if start == 'A' and result is not None:
+            print(f"{start} -> {goal}: {result}")
@@ -0,0 +1,407 @@
+"""
+Benchmark Suite
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Mengukur waktu, puncak memori (tracemalloc) dan jumlah node yang diekspansi
+untuk dfs, dfs_recursive, ucs, astar dan get_all_paths_cost pada graf
+sintetis (random sparse, grid, scale-free, road-like) berbagai ukuran,
+serta throughput inferensi FuzzySystem. Hasil ditulis sebagai JSON sehingga
+dapat dibandingkan antar-run dengan --compare.
+
+Contoh:
+    python benchmark.py --sizes 1000 10000 --output baseline.json
+    python benchmark.py --sizes 1000 10000 --compare baseline.json
+
+Setiap node graf punya koordinat 2D dan bobot edge tidak pernah lebih kecil
+dari jarak Euclidean antar ujungnya, sehingga jarak garis lurus ke goal
+adalah heuristik yang admissible dan konsisten untuk A*.
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from astar import AStarGraph
+from dfs import Graph
+from fuzzy_sugeno import fit_sugeno
+from fuzzy_tip_system import FuzzySystem, FuzzySystemBuilder
+from ucs import WeightedGraph
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _edge_weight(coords, u, v, rng):
+    """Euclidean length times a detour factor in [1, 1.5), rounded up so it never drops below the length"""
+    return math.ceil(math.dist(coords[u], coords[v]) * rng.uniform(1.0, 1.5) * 1000) / 1000
+
+
+def random_sparse_graph(n, degree=4, seed=0):
+    """
+    Directed graph with about degree random out-edges per node
+    Returns (adjacency, coords)
+    """
+    rng = random.Random(seed)
+    coords = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+    graph = {u: [] for u in range(n)}
+    for u in range(n):
+        for v in rng.sample(range(n), min(degree, n)):
+            if v != u:
+                graph[u].append((v, _edge_weight(coords, u, v, rng)))
+    return graph, coords
+
+
+def grid_graph(n, seed=0):
+    """
+    4-connected square grid with about n nodes, both edge directions
+    Returns (adjacency, coords)
+    """
+    rng = random.Random(seed)
+    width = max(1, math.isqrt(n))
+    coords = [(i % width, i // width) for i in range(width * width)]
+    graph = {u: [] for u in range(width * width)}
+    for u in range(width * width):
+        x, y = coords[u]
+        for v in ((u + 1) if x + 1 < width else None, (u + width) if y + 1 < width else None):
+            if v is not None:
+                weight = _edge_weight(coords, u, v, rng)
+                graph[u].append((v, weight))
+                graph[v].append((u, weight))
+    return graph, coords
+
+
+def scale_free_graph(n, m=2, seed=0):
+    """
+    Barabasi-Albert preferential attachment: every new node links to m
+    existing nodes chosen proportionally to their degree, both edge directions
+    Returns (adjacency, coords)
+    """
+    rng = random.Random(seed)
+    coords = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+    graph = {u: [] for u in range(n)}
+    endpoints = []  # every node appears once per incident edge
+    for u in range(n):
+        targets = set()
+        while len(targets) < min(m, u):
+            targets.add(rng.choice(endpoints) if endpoints else rng.randrange(u))
+        for v in targets:
+            weight = _edge_weight(coords, u, v, rng)
+            graph[u].append((v, weight))
+            graph[v].append((u, weight))
+            endpoints.extend((u, v))
+    return graph, coords
+
+
+def road_graph(n, k=3, seed=0):
+    """
+    Road-like network: random points joined to their k nearest neighbours
+    (found through a bucket grid), both edge directions
+    Returns (adjacency, coords)
+    """
+    rng = random.Random(seed)
+    side = math.sqrt(n)
+    coords = [(rng.random() * side, rng.random() * side) for _ in range(n)]
+    buckets = {}
+    for u, (x, y) in enumerate(coords):
+        buckets.setdefault((int(x), int(y)), []).append(u)
+
+    graph = {u: [] for u in range(n)}
+    linked = set()
+    for u, (x, y) in enumerate(coords):
+        cx, cy = int(x), int(y)
+        radius = 1
+        while True:
+            candidates = [v for bx in range(cx - radius, cx + radius + 1)
+                          for by in range(cy - radius, cy + radius + 1)
+                          for v in buckets.get((bx, by), ()) if v != u]
+            if len(candidates) >= k or radius > side:
+                break
+            radius += 1
+        candidates.sort(key=lambda v: math.dist(coords[u], coords[v]))
+        for v in candidates[:k]:
+            if (min(u, v), max(u, v)) not in linked:
+                linked.add((min(u, v), max(u, v)))
+                weight = _edge_weight(coords, u, v, rng)
+                graph[u].append((v, weight))
+                graph[v].append((u, weight))
+    return graph, coords
+
+
+GENERATORS = {
+    "sparse": random_sparse_graph,
+    "grid": grid_graph,
+    "scale_free": scale_free_graph,
+    "road": road_graph,
+}
+
+SEARCH_ALGORITHMS = ("dfs", "dfs_recursive", "ucs", "astar", "get_all_paths_cost")
+
+
+def euclidean_heuristics(coords, goal):
+    """Straight-line distance to goal for every node"""
+    gx, gy = coords[goal]
+    return {u: math.hypot(x - gx, y - gy) for u, (x, y) in enumerate(coords)}
+
+
+def random_fuzzy_system(inputs=30, rules=400, seed=0):
+    """
+    Mamdani system with inputs variables of three triangular sets each, one output
+    with six sets and rules of 1-3 random antecedents joined by AND or OR
+    """
+    rng = random.Random(seed)
+    builder = FuzzySystemBuilder()
+    for index in range(inputs):
+        builder.variable(f"x{index}", 0, 10, Low=(0, 0, 5), Mid=(0, 5, 10), High=(5, 10, 10))
+    builder.variable("y", 0, 100, **{f"o{k}": (20 * k - 20, 20 * k, 20 * k + 20) for k in range(6)})
+    for _ in range(rules):
+        antecedents = [(f"x{rng.randrange(inputs)}", rng.choice(("Low", "Mid", "High")))
+                       for _ in range(rng.randint(1, 3))]
+        builder.rule(antecedents, ("y", f"o{rng.randrange(6)}"), rng.choice(("AND", "OR")))
+    return builder.build()
+
+
+def measure(function, repeat=3):
+    """
+    Run function repeat times, then once more under tracemalloc
+    Returns (last return value, timing/memory record)
+    """
+    times = []
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = function()
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, {"time": min(times), "median_time": statistics.median(times), "memory_peak": peak}
+
+
+def benchmark_search(kind, size, queries=20, repeat=3, k_paths=3, path_queries=3, seed=0,
+                     algorithms=SEARCH_ALGORITHMS):
+    """
+    Time every search algorithm on one generated graph for the same random queries
+    Returns a list of result records
+    """
+    graph, coords = GENERATORS[kind](size, seed=seed)
+    edges = sum(len(neighbors) for neighbors in graph.values())
+    unweighted = Graph({u: [v for v, _ in neighbors] for u, neighbors in graph.items()})
+    weighted = WeightedGraph(graph)
+    astar_graph = AStarGraph(graph)
+    rng = random.Random(seed + 1)
+    pairs = [(rng.randrange(len(graph)), rng.randrange(len(graph))) for _ in range(queries)]
+    heuristics = [euclidean_heuristics(coords, goal) for _, goal in pairs]
+
+    def run_astar():
+        results = []
+        for (start, goal), table in zip(pairs, heuristics):
+            astar_graph.heuristics = table
+            results.append(astar_graph.astar(start, goal))
+        return results
+
+    runners = {
+        "dfs": (pairs, lambda: [unweighted.dfs(start, goal) for start, goal in pairs]),
+        "dfs_recursive": (pairs, lambda: [unweighted.dfs_recursive(start, goal) for start, goal in pairs]),
+        "ucs": (pairs, lambda: [weighted.ucs(start, goal) for start, goal in pairs]),
+        "astar": (pairs, run_astar),
+        "get_all_paths_cost": (pairs[:path_queries], lambda: [
+            weighted.get_all_paths_cost(start, goal, k_paths) for start, goal in pairs[:path_queries]]),
+    }
+
+    records = []
+    for algorithm in algorithms:
+        query_pairs, function = runners[algorithm]
+        record = {"benchmark": "search", "graph": kind, "size": size, "nodes": len(graph),
+                  "edges": edges, "algorithm": algorithm, "queries": len(query_pairs), "seed": seed}
+        try:
+            results, timing = measure(function, repeat)
+        except RecursionError:
+            record["error"] = "RecursionError"
+            records.append(record)
+            continue
+        record.update(timing)
+        record["time_per_query"] = timing["time"] / max(len(query_pairs), 1)
+        record["found"] = sum(1 for result in results if result)
+        expanded = [result.expanded for result in results if hasattr(result, "expanded")]
+        record["expanded"] = sum(expanded) if expanded else None
+        if algorithm == "get_all_paths_cost":
+            record["k"] = k_paths
+        records.append(record)
+    return records
+
+
+def benchmark_fuzzy(samples=10000, repeat=3, seed=0):
+    """
+    Tip inference throughput (inputs per second) for the scalar, vectorized,
+    analytic, compiled, surface and fitted Sugeno variants of the tip system,
+    plus interpreted vs compiled inference on a 30-input / 400-rule system
+    (samples / 10 inputs); compiled records carry their speedup
+    Returns a list of result records
+    """
+    rng = random.Random(seed)
+    food = [rng.uniform(0, 10) for _ in range(samples)]
+    service = [rng.uniform(0, 10) for _ in range(samples)]
+    pairs = list(zip(food, service))
+
+    system = FuzzySystem()
+    analytic = FuzzySystem(analytic=True)
+    compiled = system.compile()
+    surface = system.compile_surface()
+    sugeno, _ = fit_sugeno(system)
+
+    methods = {
+        "mamdani_scalar": lambda: [system.calculate_tip(f, s) for f, s in pairs],
+        "analytic_scalar": lambda: [analytic.calculate_tip(f, s) for f, s in pairs],
+        "compiled_scalar": lambda: [compiled.calculate_tip(f, s) for f, s in pairs],
+        "surface_scalar": lambda: [surface.calculate_tip(f, s) for f, s in pairs],
+        "sugeno_scalar": lambda: [sugeno.calculate_tip(f, s) for f, s in pairs],
+    }
+    if np is not None:
+        methods["mamdani_vectorized"] = lambda: system.calculate_tips(food, service)
+        methods["surface_vectorized"] = lambda: surface.calculate_tips(food, service)
+        methods["sugeno_vectorized"] = lambda: sugeno.calculate_tips(food, service)
+    method_samples = dict.fromkeys(methods, samples)
+
+    large = random_fuzzy_system(seed=seed)
+    large_compiled = large.compile()
+    names = large.input_variables()
+    large_inputs = [{name: rng.uniform(0, 10) for name in names} for _ in range(max(samples // 10, 1))]
+    methods["mamdani_large_scalar"] = lambda: [large.infer(inputs) for inputs in large_inputs]
+    methods["compiled_large_scalar"] = lambda: [large_compiled.infer(inputs) for inputs in large_inputs]
+    method_samples["mamdani_large_scalar"] = method_samples["compiled_large_scalar"] = len(large_inputs)
+    interpreted = {"compiled_scalar": "mamdani_scalar", "compiled_large_scalar": "mamdani_large_scalar"}
+
+    records = {}
+    for method, function in methods.items():
+        _, timing = measure(function, repeat)
+        count = method_samples[method]
+        record = {"benchmark": "fuzzy", "method": method, "samples": count, "seed": seed}
+        record.update(timing)
+        record["throughput"] = count / timing["time"] if timing["time"] else None
+        baseline = records.get(interpreted.get(method))
+        if baseline is not None and timing["time"]:
+            record["speedup"] = baseline["time"] / timing["time"]
+        records[method] = record
+    return list(records.values())
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record_key(record):
+    """Fields that identify what a record measured (used to match runs)"""
+    if record["benchmark"] == "fuzzy":
+        return ("fuzzy", record["method"], record["samples"])
+    return ("search", record["graph"], record["size"], record["algorithm"], record["queries"])
+
+
+def compare(results, baseline, threshold=1.2):
+    """
+    Match records of two runs and report time ratios
+    Returns (report lines, number of records slower than threshold x baseline)
+    """
+    previous = {record_key(record): record for record in baseline["results"]}
+    lines = []
+    regressions = 0
+    for record in results["results"]:
+        old = previous.get(record_key(record))
+        if old is None or "time" not in record or "time" not in old or not old["time"]:
+            continue
+        ratio = record["time"] / old["time"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        name = " ".join(str(part) for part in record_key(record)[1:])
+        lines.append(f"{name:<50} {old['time']:.6f}s -> {record['time']:.6f}s  x{ratio:.2f}{flag}")
+    return lines, regressions
+
+
+def run(graphs=tuple(GENERATORS), sizes=(1000,), queries=20, repeat=3, k_paths=3, path_queries=3,
+        samples=10000, seed=0, algorithms=SEARCH_ALGORITHMS, fuzzy=True, progress=None):
+    """Run the whole suite, returns {"meta": ..., "results": [...]}"""
+    results = []
+    for kind in graphs:
+        for size in sizes:
+            if progress:
+                progress(f"search: {kind} {size}")
+            results.extend(benchmark_search(kind, size, queries, repeat, k_paths, path_queries,
+                                            seed, algorithms))
+    if fuzzy:
+        if progress:
+            progress(f"fuzzy: {samples} samples")
+        results.extend(benchmark_fuzzy(samples, repeat, seed))
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "commit": _git_commit(),
+        "recursion_limit": sys.getrecursionlimit(),
+    }
+    return {"meta": meta, "results": results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the search algorithms and the fuzzy tip system")
+    parser.add_argument("--graphs", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000], help="approximate node counts")
+    parser.add_argument("--algorithms", nargs="+", choices=SEARCH_ALGORITHMS, default=list(SEARCH_ALGORITHMS))
+    parser.add_argument("--queries", type=int, default=20, help="random (start, goal) pairs per graph")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark (best is reported)")
+    parser.add_argument("--k-paths", type=int, default=3, help="k for get_all_paths_cost")
+    parser.add_argument("--path-queries", type=int, default=3, help="queries for get_all_paths_cost")
+    parser.add_argument("--samples", type=int, default=10000, help="inputs per fuzzy benchmark")
+    parser.add_argument("--no-fuzzy", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="-", help="JSON results file, '-' for stdout")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="time ratio counted as a regression (exit status 1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.graphs, args.sizes, args.queries, args.repeat, args.k_paths, args.path_queries,
+                  args.samples, args.seed, args.algorithms, not args.no_fuzzy,
+                  progress=lambda message: print(message, file=sys.stderr))
+
+    text = json.dumps(results, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        lines, regressions = compare(results, baseline, args.threshold)
+        for line in lines:
+            print(line, file=sys.stderr)
+        print(f"{regressions} regression(s) above x{args.threshold}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Bidirectional Search (UCS / A*)
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Pencarian maju dari start dan mundur dari goal (di atas reverse adjacency)
+secara bergantian, lalu berhenti ketika kedua pencarian bertemu dan tidak ada
+jalur yang lebih murah yang mungkin ditemukan lagi.
+"""
+
+import heapq
+from csr_graph import CSRGraph
+from search_result import SearchResult, reconstruct_path
+
+
+def build_reverse_graph(graph):
+    """Build the reverse adjacency {node: [(predecessor, weight), ...]}"""
+    if isinstance(graph, CSRGraph):
+        return graph.reversed()
+
+    reverse = {node: [] for node in graph}
+    for node in graph:
+        for neighbor, weight in graph[node]:
+            if neighbor not in reverse:
+                reverse[neighbor] = []
+            reverse[neighbor].append((node, weight))
+    return reverse
+
+
+def add_reverse_edge(reverse_graph, u, v, weight):
+    """Keep a dict reverse adjacency in sync after add_edge(u, v, weight)"""
+    if v not in reverse_graph:
+        reverse_graph[v] = []
+    reverse_graph[v].append((u, weight))
+    if u not in reverse_graph:
+        reverse_graph[u] = []
+
+
+def set_edge_weight(adjacency, u, v, weight=None):
+    """
+    Give every u -> v entry of a dict adjacency the new weight (remove them if weight is None)
+    Used on the reverse adjacency as set_edge_weight(reverse_graph, v, u, weight)
+    Returns the number of entries that matched
+    """
+    edges = adjacency.get(u)
+    if not edges:
+        return 0
+    matched = sum(1 for neighbor, _ in edges if neighbor == v)
+    if matched:
+        if weight is None:
+            edges[:] = [(neighbor, cost) for neighbor, cost in edges if neighbor != v]
+        else:
+            edges[:] = [(neighbor, weight if neighbor == v else cost) for neighbor, cost in edges]
+    return matched
+
+
+def bidirectional_search(graph, reverse_graph, start, goal, heuristic=None, reverse_heuristic=None):
+    """
+    Bidirectional UCS (no heuristics) or bidirectional A*
+    heuristic(node): lower bound of the cost from node to goal
+    reverse_heuristic(node): lower bound of the cost from start to node
+    Returns SearchResult if found, None otherwise
+    """
+    if start == goal:
+        return SearchResult(goal, 0, {}, 0)
+
+    use_heuristics = heuristic is not None or reverse_heuristic is not None
+    h_forward = heuristic or (lambda node: 0)
+    h_backward = reverse_heuristic or (lambda node: 0)
+
+    names = None
+    if (isinstance(graph, CSRGraph) and isinstance(reverse_graph, CSRGraph)
+            and reverse_graph.node_index is graph.node_index
+            and start in graph.node_index and goal in graph.node_index):
+        # Both directions share the node ids: search on ids, names only for the heuristics
+        names = graph.node_names
+        start, goal = graph.node_index[start], graph.node_index[goal]
+        neighbors = (graph.weighted_neighbor_ids, reverse_graph.weighted_neighbor_ids)
+        if heuristic is not None:
+            h_forward = lambda node: heuristic(names[node])
+        if reverse_heuristic is not None:
+            h_backward = lambda node: reverse_heuristic(names[node])
+    else:
+        neighbors = tuple((lambda node, adjacency=adjacency: adjacency[node] if node in adjacency else ())
+                          for adjacency in (graph, reverse_graph))
+
+    # Each side: priority queue of (f_cost, g_cost, node), best g and parent pointers
+    dist = ({start: 0}, {goal: 0})
+    parents = ({}, {})
+    pqs = ([(h_forward(start), 0, start)], [(h_backward(goal), 0, goal)])
+    estimates = (h_forward, h_backward)
+
+    best_cost = float('inf')
+    meeting_node = None
+    expanded = 0
+
+    while pqs[0] and pqs[1]:
+        # Stopping rule: no unexplored path can be cheaper than best_cost
+        if use_heuristics:
+            if max(pqs[0][0][0], pqs[1][0][0]) >= best_cost:
+                break
+        elif pqs[0][0][0] + pqs[1][0][0] >= best_cost:
+            break
+
+        # Expand the side with the smaller frontier
+        side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+        other = 1 - side
+        (f_cost, g_cost, node) = heapq.heappop(pqs[side])
+
+        if g_cost > dist[side][node]:
+            continue  # stale entry
+        expanded += 1
+
+        for neighbor, edge_cost in neighbors[side](node):
+            new_cost = g_cost + edge_cost
+            if new_cost < dist[side].get(neighbor, float('inf')):
+                dist[side][neighbor] = new_cost
+                parents[side][neighbor] = node
+                f_cost = new_cost + estimates[side](neighbor)
+                heapq.heappush(pqs[side], (f_cost, new_cost, neighbor))
+
+                if neighbor in dist[other]:
+                    total = new_cost + dist[other][neighbor]
+                    if total < best_cost:
+                        best_cost = total
+                        meeting_node = neighbor
+
+    if meeting_node is None:
+        return None
+
+    # Forward half start..meeting_node, backward half meeting_node..goal
+    path = reconstruct_path(parents[0], meeting_node)
+    node = meeting_node
+    while node in parents[1]:
+        node = parents[1][node]
+        path.append(node)
+    if names is not None:
+        path = [names[node] for node in path]
+        goal = names[goal]
+
+    came_from = {path[i + 1]: path[i] for i in range(len(path) - 1)}
+    result = SearchResult(goal, best_cost, came_from, expanded)
+    result._path = path
+    return result
@@ -0,0 +1,567 @@
+"""
+Compressed Sparse Row (CSR) Graph Representation
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Representasi graf yang ringkas untuk graf besar. Nama node di-intern menjadi
+id integer, lalu adjacency disimpan dalam tiga array kontigu:
+
+- offsets[i] .. offsets[i + 1] : rentang edge milik node dengan id i
+- targets[k]                   : id node tujuan edge ke-k
+- weights[k]                   : bobot edge ke-k (hanya untuk graf berbobot)
+
+CSRGraph berperilaku seperti dict read-only ({node: [neighbors]}), sehingga
+Graph, WeightedGraph dan AStarGraph dapat berjalan di atasnya tanpa perubahan.
+
+Graf besar dapat dibaca secara streaming dari edge list (CSV/TSV, boleh .gz)
+dengan from_edge_list, lalu disimpan ke format biner dengan save. File biner
+dibuka dengan load memakai mmap: array langsung menunjuk ke page cache
+sehingga startup hampir instan dan beberapa proses berbagi satu salinan.
+"""
+
+import csv
+import gzip
+import io
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import repeat
+
+# Binary format: header, then 8-byte aligned sections (see CSRGraph.save)
+MAGIC = b"CSRG"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIQQ")  # magic, version, flags, reserved, nodes, edges
+FLAG_WEIGHTED = 1
+FLAG_FLOAT_WEIGHTS = 2
+FLAG_WIDE_TARGETS = 4
+FLAG_REVERSE = 8
+
+# Column names that mark the first row of an edge list as a header (case-insensitive)
+EDGE_LIST_COLUMNS = frozenset({
+    "source", "target", "src", "dst", "from", "to", "u", "v", "tail", "head",
+    "node", "neighbor", "start", "end", "source_id", "target_id", "from_id", "to_id",
+})
+
+
+def _int_typecode(max_value):
+    """Pick the smallest signed array typecode able to hold max_value"""
+    return 'i' if max_value < 2 ** 31 else 'q'
+
+
+def _typecode(buffer):
+    """Typecode of an array or of a memoryview cast from the mapped file"""
+    return buffer.typecode if isinstance(buffer, array) else buffer.format
+
+
+def _counting_sort(node_count, sources, targets, weights=None):
+    """
+    Stable sort of edges by source id
+    Returns (offsets, targets, weights) in CSR layout
+    """
+    counts = [0] * (node_count + 1)
+    for s in sources:
+        counts[s + 1] += 1
+    offsets = array('q', [0] * (node_count + 1))
+    for i in range(node_count):
+        offsets[i + 1] = offsets[i] + counts[i + 1]
+
+    cursor = list(offsets[:node_count])
+    sorted_targets = array(_typecode(targets), bytes(targets.itemsize * len(targets)))
+    sorted_weights = None
+    if weights is not None:
+        sorted_weights = array(_typecode(weights), bytes(weights.itemsize * len(weights)))
+    for k, s in enumerate(sources):
+        pos = cursor[s]
+        cursor[s] += 1
+        sorted_targets[pos] = targets[k]
+        if weights is not None:
+            sorted_weights[pos] = weights[k]
+    return offsets, sorted_targets, sorted_weights
+
+
+def _parse_weight(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _open_text(source):
+    if not isinstance(source, str):
+        return source
+    if source.endswith(".gz"):
+        return gzip.open(source, "rt", newline="")
+    return open(source, newline="")
+
+
+def _chain_row(first_row, reader):
+    yield first_row
+    yield from reader
+
+
+class _NameTable(Sequence):
+    """Node names stored as UTF-8 bytes in the mapped file, decoded on access"""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return str(self.data[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def encoded(self, i):
+        return bytes(self.data[self.offsets[i]:self.offsets[i + 1]])
+
+
+class _NameIndex(Mapping):
+    """name -> node id lookup by binary search over ids sorted by name"""
+
+    def __init__(self, names, order):
+        self.names = names
+        self.order = order
+
+    def __getitem__(self, name):
+        if not isinstance(name, str):
+            raise KeyError(name)
+        key = name.encode("utf-8")
+        lo, hi = 0, len(self.order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.names.encoded(self.order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.order) and self.names.encoded(self.order[lo]) == key:
+            return self.order[lo]
+        raise KeyError(name)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+
+class CSRGraph(Mapping):
+    def __init__(self, node_names, offsets, targets, weights=None, node_index=None):
+        """
+        node_names: list of node names, position = node id
+        offsets: array of len(node_names) + 1 edge offsets
+        targets: array of target node ids
+        weights: array of edge weights, or None for an unweighted graph
+        """
+        if node_index is None:
+            node_index = {name: i for i, name in enumerate(node_names)}
+        self.node_names = node_names
+        self.node_index = node_index
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.filename = None  # set by load() for memory-mapped graphs
+        self.shared_memory = None  # set by attach_shared_memory()
+        self._reverse = None
+        self._weight_profile = None
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """
+        Build a CSR graph from the dict format used in graph_data.py
+        Accepts {node: [neighbor, ...]} or {node: [(neighbor, weight), ...]}
+        """
+        node_names = []
+        node_index = {}
+
+        def intern(name):
+            idx = node_index.get(name)
+            if idx is None:
+                idx = node_index[name] = len(node_names)
+                node_names.append(name)
+            return idx
+
+        for node in adjacency:
+            intern(node)
+
+        weighted = any(
+            isinstance(edge, tuple) for edges in adjacency.values() for edge in edges
+        )
+
+        offsets = array('q', [0])
+        target_ids = []
+        weight_values = []
+        for node in list(node_names):
+            for edge in adjacency[node]:
+                if weighted:
+                    neighbor, weight = edge
+                    weight_values.append(weight)
+                else:
+                    neighbor = edge
+                target_ids.append(intern(neighbor))
+            offsets.append(len(target_ids))
+
+        # Nodes that only appear as targets have no outgoing edges
+        while len(offsets) <= len(node_names):
+            offsets.append(len(target_ids))
+
+        targets = array(_int_typecode(len(node_names)), target_ids)
+        weights = None
+        if weighted:
+            all_int = all(isinstance(w, int) and not isinstance(w, bool) for w in weight_values)
+            weights = array('q' if all_int else 'd', weight_values)
+
+        return cls(node_names, offsets, targets, weights, node_index)
+
+    @classmethod
+    def from_edge_list(cls, source, delimiter=None, weighted=None, directed=True, header=None):
+        """
+        Stream an edge list into a CSR graph without building an adjacency dict
+        source: filename (.csv, .tsv, optionally .gz) or an open text stream
+        Each row is: source, target[, weight]; blank lines and '#' comments are skipped
+        delimiter: defaults to tab for .tsv files and lines containing tabs, else ','
+        weighted: None detects a weight column from the first row
+        directed: False adds every edge in both directions
+        header: None skips the first row if its source and target fields are both
+                column names from EDGE_LIST_COLUMNS (e.g. "src,dst") or, for weighted
+                input, if its weight field is not numeric; any other first row is an
+                edge, so pass header=True for unweighted files with other column names
+        """
+        stream = _open_text(source)
+        try:
+            first = stream.readline()
+            while first and (not first.strip() or first.startswith("#")):
+                first = stream.readline()
+            if delimiter is None:
+                name = source if isinstance(source, str) else ""
+                delimiter = "\t" if ".tsv" in name or "\t" in first else ","
+            rows = csv.reader(io.StringIO(first), delimiter=delimiter)
+            first_row = next(rows, [])
+            if weighted is None:
+                weighted = len(first_row) >= 3
+            if header is None:
+                header = len(first_row) >= 2 and all(
+                    field.strip().lower() in EDGE_LIST_COLUMNS for field in first_row[:2])
+                if not header and weighted and len(first_row) >= 3:
+                    try:
+                        _parse_weight(first_row[2])
+                    except ValueError:
+                        header = True
+
+            node_names = []
+            node_index = {}
+            sources = array('q')
+            targets = array('q')
+            weights = array('q') if weighted else None
+
+            def add(u, v, w):
+                nonlocal weights
+                for name in (u, v):
+                    if name not in node_index:
+                        node_index[name] = len(node_names)
+                        node_names.append(name)
+                sources.append(node_index[u])
+                targets.append(node_index[v])
+                if weighted:
+                    if isinstance(w, float) and weights.typecode == 'q':
+                        weights = array('d', weights)
+                    weights.append(w)
+
+            reader = csv.reader(stream, delimiter=delimiter)
+            rows = reader if header else _chain_row(first_row, reader)
+            for row in rows:
+                if not row or row[0].startswith("#"):
+                    continue
+                u, v = row[0], row[1]
+                w = _parse_weight(row[2]) if weighted else None
+                add(u, v, w)
+                if not directed:
+                    add(v, u, w)
+        finally:
+            if stream is not source:
+                stream.close()
+
+        n = len(node_names)
+        offsets, sorted_targets, sorted_weights = _counting_sort(n, sources, targets, weights)
+        if _int_typecode(n) == 'i':
+            sorted_targets = array('i', sorted_targets)
+        return cls(node_names, offsets, sorted_targets, sorted_weights, node_index)
+
+    def _binary_layout(self, include_reverse=False):
+        """
+        Binary format used by save() and to_shared_memory()
+        Returns (size, [(position, bytes-like)]): the header, then each section
+        padded to 8 bytes: offsets, targets, [weights], name offsets, name order,
+        name bytes, and with include_reverse the reversed offsets, targets and [weights]
+        Node names must be strings
+        """
+        if sys.byteorder != "little":
+            raise ValueError("The binary graph format is little-endian only")
+        n = self.node_count()
+        encoded = []
+        for name in self.node_names:
+            if not isinstance(name, str):
+                raise TypeError(f"Node names must be strings to be saved, got {name!r}")
+            encoded.append(name.encode("utf-8"))
+
+        id_code = _int_typecode(max(n, 1))
+        targets = self.targets
+        if _typecode(targets) != id_code:
+            targets = array(id_code, targets)
+        name_offsets = array('q', [0])
+        for raw in encoded:
+            name_offsets.append(name_offsets[-1] + len(raw))
+        name_order = array(id_code, sorted(range(n), key=encoded.__getitem__))
+
+        flags = 0
+        if self.weights is not None:
+            flags |= FLAG_WEIGHTED
+            if _typecode(self.weights) == 'd':
+                flags |= FLAG_FLOAT_WEIGHTS
+        if id_code == 'q':
+            flags |= FLAG_WIDE_TARGETS
+        sections = [self.offsets, targets]
+        if self.weights is not None:
+            sections.append(self.weights)
+        sections += [name_offsets, name_order, b"".join(encoded)]
+        if include_reverse:
+            flags |= FLAG_REVERSE
+            reverse = self.reversed()
+            sections += [reverse.offsets, array(id_code, reverse.targets)]
+            if reverse.weights is not None:
+                sections.append(reverse.weights)
+
+        layout = [(0, HEADER.pack(MAGIC, VERSION, flags, 0, n, self.edge_count()))]
+        position = HEADER.size
+        for section in sections:
+            position += -position % 8
+            data = memoryview(section).cast("B")
+            layout.append((position, data))
+            position += len(data)
+        return position, layout
+
+    def save(self, filename, include_reverse=False):
+        """Write the graph in the binary format read by load()"""
+        _, layout = self._binary_layout(include_reverse)
+        with open(filename, "wb") as f:
+            for position, data in layout:
+                f.write(bytes(position - f.tell()))
+                f.write(data)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Memory-map a file written by save()
+        Arrays are views into the page cache, nothing is copied or parsed
+        """
+        with open(filename, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        graph = cls._from_buffer(memoryview(mapped), filename)
+        graph.filename = filename
+        return graph
+
+    def to_shared_memory(self, include_reverse=False):
+        """
+        Copy the graph into a new SharedMemory block in the binary format
+        Other processes open it with attach_shared_memory(block.name); the caller
+        owns the block and must close() and unlink() it when done
+        """
+        from multiprocessing import shared_memory
+        size, layout = self._binary_layout(include_reverse)
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for position, data in layout:
+            block.buf[position:position + len(data)] = data
+        return block
+
+    @classmethod
+    def attach_shared_memory(cls, name):
+        """Open a graph written by to_shared_memory() without copying it"""
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(name=name)
+        graph = cls._from_buffer(block.buf, name)
+        graph.shared_memory = block  # keeps the mapping alive as long as the graph
+        return graph
+
+    @classmethod
+    def _from_buffer(cls, view, source):
+        """Build a graph whose arrays are views into a buffer in the binary format"""
+        if sys.byteorder != "little":
+            raise ValueError("The binary graph format is little-endian only")
+        magic, version, flags, _, n, m = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{source} is not a CSR graph file (version {VERSION})")
+        position = HEADER.size
+
+        def section(typecode, count):
+            nonlocal position
+            position += -position % 8
+            size = struct.calcsize(typecode) * count
+            data = view[position:position + size].cast(typecode)
+            position += size
+            return data
+
+        id_code = 'q' if flags & FLAG_WIDE_TARGETS else 'i'
+        weight_code = 'd' if flags & FLAG_FLOAT_WEIGHTS else 'q'
+        weighted = flags & FLAG_WEIGHTED
+        offsets = section('q', n + 1)
+        targets = section(id_code, m)
+        weights = section(weight_code, m) if weighted else None
+        name_offsets = section('q', n + 1)
+        name_order = section(id_code, n)
+        names = _NameTable(name_offsets, section('B', name_offsets[n]))
+
+        graph = cls(names, offsets, targets, weights, _NameIndex(names, name_order))
+        if flags & FLAG_REVERSE:
+            reverse_offsets = section('q', n + 1)
+            reverse_targets = section(id_code, m)
+            reverse_weights = section(weight_code, m) if weighted else None
+            graph._reverse = cls(names, reverse_offsets, reverse_targets, reverse_weights, graph.node_index)
+        return graph
+
+    def __reduce__(self):
+        # Memory-mapped graphs are sent to worker processes by filename / block name
+        if self.filename is not None:
+            return (CSRGraph.load, (self.filename,))
+        if self.shared_memory is not None:
+            return (CSRGraph.attach_shared_memory, (self.shared_memory.name,))
+        return (CSRGraph, (self.node_names, self.offsets, self.targets, self.weights, self.node_index))
+
+    @property
+    def weighted(self):
+        return self.weights is not None
+
+    def node_count(self):
+        return len(self.node_names)
+
+    def edge_count(self):
+        return len(self.targets)
+
+    def neighbor_ids(self, node_id):
+        """Return target ids of node_id as a slice of the targets array"""
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def weighted_neighbor_ids(self, node_id):
+        """Return (target_id, weight) pairs of node_id, weight 1 if the graph is unweighted"""
+        lo, hi = self.offsets[node_id], self.offsets[node_id + 1]
+        if self.weights is None:
+            return zip(self.targets[lo:hi], repeat(1, hi - lo))
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def node_ids(self, nodes):
+        """Set of the ids of nodes, names that are not in the graph are skipped"""
+        index = self.node_index
+        return {index[node] for node in nodes if node in index}
+
+    def parent_names(self, parent_ids, node_id):
+        """{node: parent} by name along the path ending at node_id, from an id -> parent id map"""
+        names = self.node_names
+        parents = {}
+        while node_id in parent_ids:
+            parent_id = parent_ids[node_id]
+            parents[names[node_id]] = names[parent_id]
+            node_id = parent_id
+        return parents
+
+    def reversed(self):
+        """Return a new CSRGraph with every edge direction flipped"""
+        if self._reverse is not None:
+            return self._reverse
+        sources = array(_typecode(self.targets), bytes(self.targets.itemsize * len(self.targets)))
+        for node_id in range(len(self.node_names)):
+            for k in range(self.offsets[node_id], self.offsets[node_id + 1]):
+                sources[k] = node_id
+        offsets, targets, weights = _counting_sort(len(self.node_names), self.targets, sources, self.weights)
+        return CSRGraph(self.node_names, offsets, targets, weights, self.node_index)
+
+    def to_dict(self):
+        """Convert back to the dict format used in graph_data.py"""
+        return {node: self[node] for node in self.node_names}
+
+    def nbytes(self):
+        """Approximate memory used by the edge arrays in bytes"""
+        total = self.offsets.itemsize * len(self.offsets)
+        total += self.targets.itemsize * len(self.targets)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def weight_profile(self):
+        """
+        (all weights are non-negative integers, largest weight), see frontier.py
+        Computed once: the graph is read-only
+        """
+        if self._weight_profile is None:
+            weights = self.weights
+            if weights is None or not len(weights):
+                self._weight_profile = (True, 0)
+            else:
+                typecode = weights.format if isinstance(weights, memoryview) else weights.typecode
+                if typecode in ('d', 'f') or min(weights) < 0:
+                    self._weight_profile = (False, None)
+                else:
+                    self._weight_profile = (True, max(weights))
+        return self._weight_profile
+
+    # Read-only dict interface so the search classes can use it directly
+    def __getitem__(self, node):
+        node_id = self.node_index[node]
+        lo, hi = self.offsets[node_id], self.offsets[node_id + 1]
+        names = self.node_names
+        if self.weights is None:
+            return [names[t] for t in self.targets[lo:hi]]
+        return [(names[t], w) for t, w in zip(self.targets[lo:hi], self.weights[lo:hi])]
+
+    def __contains__(self, node):
+        return node in self.node_index
+
+    def __iter__(self):
+        return iter(self.node_names)
+
+    def __len__(self):
+        return len(self.node_names)
+
+    def __repr__(self):
+        kind = "weighted" if self.weighted else "unweighted"
+        return f"CSRGraph({kind}, nodes={self.node_count()}, edges={self.edge_count()})"
+
+
+def load_graph(filename):
+    """Open a binary graph file, or stream an edge list (.csv/.tsv[.gz]) into a CSRGraph"""
+    with open(filename, "rb") as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return CSRGraph.load(filename)
+    return CSRGraph.from_edge_list(filename)
+
+
+def ensure_mutable(graph):
+    """Raise TypeError when trying to add edges to a read-only CSR graph"""
+    if isinstance(graph, CSRGraph):
+        raise TypeError("CSRGraph is read-only; add edges before calling compact()")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        # Convert an edge list to the binary format: python csr_graph.py edges.csv.gz graph.csrg
+        graph = CSRGraph.from_edge_list(sys.argv[1])
+        graph.save(sys.argv[2], include_reverse=True)
+        print(f"{graph} written to {sys.argv[2]}")
+        sys.exit()
+
+    from graph_data import get_graph_data, get_weighted_graph_data
+
+    csr = CSRGraph.from_adjacency(get_graph_data())
+    print(csr)
+    print(f"Offsets: {list(csr.offsets)}")
+    print(f"Targets: {list(csr.targets)}")
+
+    weighted_csr = CSRGraph.from_adjacency(get_weighted_graph_data())
+    print(weighted_csr)
+    print(f"Weights: {list(weighted_csr.weights)}")
+    print(f"Edge arrays: {weighted_csr.nbytes()} bytes")
+    print(f"Neighbors of A: {weighted_csr['A']}")
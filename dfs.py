@@ -4,46 +4,210 @@ Nama: Divanda Firdaus
 NIM: 32602500023
 """
 
+from array import array
 from collections import deque
+from csr_graph import CSRGraph, ensure_mutable
 from graph_data import get_graph_data, get_test_nodes
+from search_result import SearchResult
+
+# Traversal events
+DISCOVER = "discover"
+FINISH = "finish"
+
+
+class _NodeIds:
+    def __init__(self, graph, marks):
+        """
+        Integer ids for the nodes of graph: a CSRGraph keeps its own ids,
+        other nodes (all of them for dict graphs) are numbered on first use
+        marks: bytearray / array grown together with the ids
+        """
+        self.graph = graph
+        self.marks = marks
+        self.compact = isinstance(graph, CSRGraph)
+        self.base = len(graph) if self.compact else 0
+        if self.compact:
+            marks.extend(bytes(self.base) if isinstance(marks, bytearray)
+                         else array(marks.typecode, [0]) * self.base)
+        self.extra_index = {}
+        self.extra_names = []
+    
+    def id(self, node):
+        if self.compact:
+            node_id = self.graph.node_index.get(node)
+            if node_id is not None:
+                return node_id
+        node_id = self.extra_index.get(node)
+        if node_id is None:
+            node_id = self.extra_index[node] = self.base + len(self.extra_names)
+            self.extra_names.append(node)
+            self.marks.append(0)
+        return node_id
+    
+    def name(self, node_id):
+        if node_id < self.base:
+            return self.graph.node_names[node_id]
+        return self.extra_names[node_id - self.base]
+    
+    def neighbors(self, node_id):
+        if node_id < self.base:
+            return self.graph.neighbor_ids(node_id)
+        if self.compact:
+            return ()
+        return [self.id(neighbor) for neighbor in self.graph.get(self.name(node_id), ())]
+
+
+class _DepthFirstWalk:
+    def __init__(self, graph, start, max_depth=None):
+        """
+        Iterative DFS over integer node ids, in the same order as recursive DFS
+        Iterating yields (DISCOVER | FINISH, node_id); path holds the ids of the
+        current branch. Without max_depth visited is a bytearray flag per node;
+        with max_depth each node stores the depth budget it was reached with,
+        so a node reached again by a shorter branch is expanded again
+        """
+        self.max_depth = max_depth
+        marks = array('l') if max_depth is not None and max_depth >= 255 else bytearray()
+        self.nodes = _NodeIds(graph, marks)
+        self.start_id = self.nodes.id(start)
+        self.path = []
+        self.cut_off = False  # True if some unvisited node lay beyond max_depth
+    
+    def __iter__(self):
+        nodes = self.nodes
+        marks = nodes.marks
+        max_depth = self.max_depth
+        path = self.path
+        
+        marks[self.start_id] = 1 if max_depth is None else max_depth + 1
+        path.append(self.start_id)
+        yield DISCOVER, self.start_id
+        edges = [iter(nodes.neighbors(self.start_id))]
+        first_visit = [True]
+        
+        while edges:
+            node_id = next(edges[-1], None)
+            if node_id is None:
+                edges.pop()
+                finished = path.pop()
+                if first_visit.pop():
+                    yield FINISH, finished
+                continue
+            
+            if max_depth is None:
+                if marks[node_id]:
+                    continue
+                marks[node_id] = 1
+                first = True
+            else:
+                remaining = max_depth - len(path)
+                if remaining < 0:
+                    if not marks[node_id]:
+                        self.cut_off = True
+                    continue
+                if marks[node_id] > remaining:
+                    continue
+                first = not marks[node_id]
+                marks[node_id] = remaining + 1
+            
+            path.append(node_id)
+            if first:
+                yield DISCOVER, node_id
+            edges.append(iter(nodes.neighbors(node_id)))
+            first_visit.append(first)
+    
+    def result(self, expanded):
+        """SearchResult for the current branch (start ... path[-1])"""
+        names = [self.nodes.name(node_id) for node_id in self.path]
+        parents = {names[i + 1]: names[i] for i in range(len(names) - 1)}
+        return SearchResult(names[-1], len(names) - 1, parents, expanded)
+
 
 class Graph:
-    def __init__(self):
-        self.graph = get_graph_data()
+    def __init__(self, graph=None):
+        self.graph = get_graph_data() if graph is None else graph
     
     def add_edge(self, u, v):
+        ensure_mutable(self.graph)
         if u not in self.graph:
             self.graph[u] = []
         self.graph[u].append(v)
     
+    def compact(self):
+        """Convert the adjacency dict to a read-only CSRGraph to save memory"""
+        if not isinstance(self.graph, CSRGraph):
+            self.graph = CSRGraph.from_adjacency(self.graph)
+        return self
+    
     def dfs(self, start, goal):
         """
         DFS implementation using stack
         Returns path from start to goal if found, None otherwise
         """
-        visited = set()
-        stack = [(start, [start])]
-        
-        while stack:
-            (node, path) = stack.pop()
-            
-            if node not in visited:
-                visited.add(node)
-                
-                if node == goal:
-                    return path
-                
-                # Add neighbors to stack (reverse order for consistent results)
-                if node in self.graph:
-                    for neighbor in reversed(self.graph[node]):
-                        if neighbor not in visited:
-                            stack.append((neighbor, path + [neighbor]))
-        
+        result = self.search(start, goal)
+        return result.path if result is not None else None
+    
+    def search(self, start, goal):
+        """
+        Non-recursive DFS over integer node ids with a bytearray of visited flags
+        Only the current branch is kept, so memory is O(nodes) bytes plus O(depth)
+        Returns SearchResult (path is rebuilt from parent pointers), None if not found
+        """
+        walk = _DepthFirstWalk(self.graph, start)
+        goal_id = walk.nodes.id(goal)
+        expanded = 0
+        for event, node_id in walk:
+            if event == DISCOVER:
+                expanded += 1
+                if node_id == goal_id:
+                    return walk.result(expanded)
+        return None
+    
+    def traverse(self, start, max_depth=None, order="discovery"):
+        """
+        Lazy depth-first traversal from start that never recurses
+        order: 'discovery' (preorder), 'finish' (postorder) or 'both',
+        which yields (DISCOVER | FINISH, node) pairs
+        max_depth: only visit nodes within max_depth edges of start
+        Each node is reported once; stopping the generator early costs nothing extra
+        """
+        if order not in ("discovery", "finish", "both"):
+            raise ValueError(f"Unknown traversal order: {order}")
+        walk = _DepthFirstWalk(self.graph, start, max_depth)
+        name = walk.nodes.name
+        for event, node_id in walk:
+            if order == "both":
+                yield event, name(node_id)
+            elif (event == DISCOVER) == (order == "discovery"):
+                yield name(node_id)
+    
+    def iddfs(self, start, goal, max_depth=None):
+        """
+        Iterative deepening DFS: depth-limited DFS with limits 0, 1, 2, ...
+        Finds a path with the fewest edges using DFS memory
+        Stops when goal is found, max_depth is passed or no node was cut off
+        Returns SearchResult, None if goal is not reachable within max_depth
+        """
+        limit = 0
+        expanded = 0
+        while max_depth is None or limit <= max_depth:
+            walk = _DepthFirstWalk(self.graph, start, limit)
+            goal_id = walk.nodes.id(goal)
+            for event, node_id in walk:
+                if event == DISCOVER:
+                    expanded += 1
+                    if node_id == goal_id:
+                        return walk.result(expanded)
+            if not walk.cut_off:
+                return None
+            limit += 1
         return None
     
     def dfs_recursive(self, start, goal, visited=None, path=None):
         """
         Recursive DFS implementation
+        The same path list is extended and shrunk in place instead of copied per call
+        Bounded by the interpreter recursion limit; use search() or traverse() for deep graphs
         """
         if visited is None:
             visited = set()
@@ -53,12 +217,14 @@ class Graph:
         visited.add(start)
         
         if start == goal:
-            return path
+            return list(path)
         
         if start in self.graph:
             for neighbor in self.graph[start]:
                 if neighbor not in visited:
-                    result = self.dfs_recursive(neighbor, goal, visited, path + [neighbor])
+                    path.append(neighbor)
+                    result = self.dfs_recursive(neighbor, goal, visited, path)
+                    path.pop()
                     if result is not None:
                         return result
         
@@ -86,4 +252,10 @@ if __name__ == "__main__":
     
     print("\nDFS Recursive:")
     path_recursive = g.dfs_recursive(start_node, goal_node)
-    print(f"Path from {start_node} to {goal_node}: {path_recursive}")
\ No newline at end of file
+    print(f"Path from {start_node} to {goal_node}: {path_recursive}")
+    
+    print("\nLazy traversal:")
+    print(f"Discovery order: {list(g.traverse(start_node))}")
+    print(f"Finish order: {list(g.traverse(start_node, order='finish'))}")
+    print(f"Within depth 2: {list(g.traverse(start_node, max_depth=2))}")
+    print(f"IDDFS: {g.iddfs(start_node, goal_node)}")
\ No newline at end of file
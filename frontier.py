@@ -0,0 +1,283 @@
+"""
+Priority Queues for the UCS Frontier
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Semua frontier memakai antarmuka yang sama: push(item, priority) memasukkan
+item atau menurunkan prioritasnya (decrease-key), pop() mengambil item dengan
+prioritas terkecil. Setiap item hanya di-pop sekali; push untuk item yang
+sudah di-pop atau dengan prioritas yang tidak lebih kecil diabaikan, sehingga
+tidak ada entri duplikat yang perlu dilewati oleh pemanggil.
+
+- HeapFrontier  : heapq, untuk bobot sembarang (float)
+- IndexedHeap   : binary heap dengan posisi per item dan decrease-key di tempat
+- RadixHeap     : bobot integer non-negatif, prioritas monoton (Dijkstra)
+- BucketQueue   : Dial's algorithm, bobot integer 0..C dengan C kecil
+
+frontier_factory memilih salah satunya dari profil bobot graf. Dalam mode
+'auto' hanya BucketQueue yang dipilih (bobot integer kecil); selain itu UCS
+tetap memakai loop heapq biasa dengan entri duplikat, karena di CPython heapq
+(ditulis dalam C) lebih cepat daripada RadixHeap/IndexedHeap dalam Python murni.
+"""
+
+import heapq
+from csr_graph import CSRGraph
+
+# Largest integer weight for which the bucket queue is chosen automatically
+BUCKET_LIMIT = 256
+
+# Best-priority marker of popped items: compares <= any priority, so later pushes are ignored
+_SETTLED = float('-inf')
+
+
+class HeapFrontier:
+    """Binary heap from heapq, stale entries of decreased items are skipped on pop"""
+
+    def __init__(self):
+        self.heap = []
+        self.best = {}  # item -> lowest priority pushed, _SETTLED once popped
+        self.live = 0
+
+    def __len__(self):
+        return self.live
+
+    def push(self, item, priority):
+        """Insert item or lower its priority, returns False if nothing changed"""
+        best = self.best.get(item)
+        if best is not None and best <= priority:
+            return False
+        if best is None:
+            self.live += 1
+        self.best[item] = priority
+        heapq.heappush(self.heap, (priority, item))
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority"""
+        heap, best = self.heap, self.best
+        while heap:
+            priority, item = heapq.heappop(heap)
+            if best[item] == priority:
+                best[item] = _SETTLED
+                self.live -= 1
+                return priority, item
+        raise IndexError("pop from an empty frontier")
+
+
+class IndexedHeap:
+    """Binary heap that stores each item once and moves it up on decrease-key"""
+
+    def __init__(self):
+        self.priorities = []
+        self.items = []
+        self.position = {}  # item -> index in the heap, _SETTLED once popped
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, item, priority):
+        """Insert item or lower its priority, returns False if nothing changed"""
+        index = self.position.get(item)
+        if index is None:
+            index = len(self.items)
+            self.items.append(item)
+            self.priorities.append(priority)
+        elif index == _SETTLED or self.priorities[index] <= priority:
+            return False
+        self._sift_up(index, item, priority)
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority"""
+        if not self.items:
+            raise IndexError("pop from an empty frontier")
+        priorities, items = self.priorities, self.items
+        priority, item = priorities[0], items[0]
+        self.position[item] = _SETTLED
+        last_priority, last_item = priorities.pop(), items.pop()
+        if items:
+            self._sift_down(last_item, last_priority)
+        return priority, item
+
+    def _sift_up(self, index, item, priority):
+        priorities, items, position = self.priorities, self.items, self.position
+        while index:
+            parent = (index - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            priorities[index] = priorities[parent]
+            items[index] = items[parent]
+            position[items[index]] = index
+            index = parent
+        priorities[index] = priority
+        items[index] = item
+        position[item] = index
+
+    def _sift_down(self, item, priority):
+        priorities, items, position = self.priorities, self.items, self.position
+        size = len(items)
+        index = 0
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priorities[child] >= priority:
+                break
+            priorities[index] = priorities[child]
+            items[index] = items[child]
+            position[items[index]] = index
+            index = child
+        priorities[index] = priority
+        items[index] = item
+        position[item] = index
+
+
+class RadixHeap:
+    """
+    Monotone priority queue for non-negative integer priorities: every pop
+    returns a priority no smaller than the previous one, as in Dijkstra / UCS
+    Entries sit in the bucket of the highest bit where they differ from the last
+    popped priority, so each entry is moved O(log C) times in total
+    """
+
+    def __init__(self):
+        self.buckets = [[]]
+        self.last = 0
+        self.best = {}  # item -> lowest priority pushed, _SETTLED once popped
+        self.live = 0
+
+    def __len__(self):
+        return self.live
+
+    def push(self, item, priority):
+        """Insert item or lower its priority (never below the last pop), returns False if nothing changed"""
+        best = self.best.get(item)
+        if best is not None and best <= priority:
+            return False
+        if best is None:
+            self.live += 1
+        self.best[item] = priority
+        index = (priority ^ self.last).bit_length()
+        buckets = self.buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((priority, item))
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority"""
+        buckets, best = self.buckets, self.best
+        while True:
+            bucket = buckets[0]
+            while bucket:
+                priority, item = bucket.pop()
+                if best[item] == priority:
+                    best[item] = _SETTLED
+                    self.live -= 1
+                    return priority, item
+            # Refill bucket 0 from the first non-empty bucket, dropping stale entries
+            for index in range(1, len(buckets)):
+                if buckets[index]:
+                    break
+            else:
+                raise IndexError("pop from an empty frontier")
+            entries = [(priority, item) for priority, item in buckets[index] if best[item] == priority]
+            buckets[index] = []
+            if not entries:
+                continue
+            self.last = last = min(priority for priority, _ in entries)
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for integer edge weights 0..max_weight: a ring of
+    max_weight + 1 buckets indexed by priority modulo the ring size
+    Pushes are O(1); pops move a cursor forward, priorities must be monotone
+    """
+
+    def __init__(self, max_weight):
+        self.size = max_weight + 1
+        self.buckets = [[] for _ in range(self.size)]
+        self.cursor = 0  # smallest priority that can still be in the queue
+        self.best = {}   # item -> lowest priority pushed, _SETTLED once popped
+        self.live = 0
+
+    def __len__(self):
+        return self.live
+
+    def push(self, item, priority):
+        """Insert item or lower its priority (within max_weight of the last pop), returns False if nothing changed"""
+        best = self.best.get(item)
+        if best is not None and best <= priority:
+            return False
+        if best is None:
+            self.live += 1
+        self.best[item] = priority
+        self.buckets[priority % self.size].append(item)
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority"""
+        if not self.live:
+            raise IndexError("pop from an empty frontier")
+        buckets, best, size = self.buckets, self.best, self.size
+        cursor = self.cursor
+        while True:
+            bucket = buckets[cursor % size]
+            while bucket:
+                item = bucket.pop()
+                # Live items within the ring all have distinct residues, others are stale
+                if best[item] == cursor:
+                    best[item] = _SETTLED
+                    self.live -= 1
+                    self.cursor = cursor
+                    return cursor, item
+            cursor += 1
+
+
+FRONTIERS = ("auto", "heap", "indexed", "radix", "bucket")
+
+
+def weight_profile(graph):
+    """(all weights are non-negative integers, largest weight) of a weighted adjacency"""
+    if isinstance(graph, CSRGraph):
+        return graph.weight_profile()
+
+    max_weight = 0
+    for edges in graph.values():
+        for _, weight in edges:
+            if not isinstance(weight, int) or weight < 0:
+                return False, None
+            if weight > max_weight:
+                max_weight = weight
+    return True, max_weight
+
+
+def frontier_factory(graph, kind="auto"):
+    """
+    Callable returning a new empty frontier for searches on graph
+    kind: 'heap', 'indexed', 'radix', 'bucket' or 'auto' (bucket queue for
+    integer weights up to BUCKET_LIMIT, None otherwise: the caller keeps its
+    heapq loop)
+    """
+    if kind not in FRONTIERS:
+        raise ValueError(f"Unknown frontier: {kind}")
+    if kind == "heap":
+        return HeapFrontier
+    if kind == "indexed":
+        return IndexedHeap
+
+    integral, max_weight = weight_profile(graph)
+    if kind == "auto":
+        if not integral or max_weight > BUCKET_LIMIT:
+            return None
+        kind = "bucket"
+    elif not integral:
+        raise ValueError(f"The {kind} frontier needs non-negative integer weights")
+    if kind == "radix":
+        return RadixHeap
+    return lambda: BucketQueue(max_weight)
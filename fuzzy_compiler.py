@@ -0,0 +1,220 @@
+"""
+Rule-Base Compiler for FuzzySystem
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Untuk model dengan banyak variabel dan ratusan aturan, pencarian nama
+variabel/himpunan lewat dict di setiap FuzzyRule.evaluate menjadi mahal.
+CompiledFuzzySystem meng-intern variabel dan himpunan menjadi indeks integer,
+mengelompokkan aturan berdasarkan consequent, dan hanya mengevaluasi aturan
+yang memiliki antecedent dengan keanggotaan tidak nol. Titik segitiga setiap
+himpunan input dan nilai keanggotaan setiap himpunan output pada 101 titik
+sampel dihitung sekali saat kompilasi, sehingga fuzzifikasi dan defuzzifikasi
+tidak lagi memanggil FuzzySet.membership. Perhitungannya sama persis dengan
+FuzzySystem sehingga hasilnya identik (defuzzifikasi analitik tetap memakai
+FuzzySystem asli).
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, calculate_tips then returns a list
+    np = None
+
+# Sample points of the output universe, as in FuzzySystem.defuzzify
+SAMPLES = 100
+
+
+class CompiledFuzzySystem:
+    def __init__(self, system):
+        """Compile the variables and rules of a Mamdani FuzzySystem"""
+        if system.inference != "mamdani":
+            raise ValueError("Only Mamdani systems can be compiled")
+        self.system = system
+        self.input_names = system.input_variables()
+        self.output_names = system.output_variables()
+
+        # Every (input variable, set) pair gets one slot in a flat membership list;
+        # the last slot is always 0 and stands for unknown variables / sets
+        self.slot_index = {}
+        self.input_sets = []  # per input variable: list of (slot, a, b, c)
+        for var_name in self.input_names:
+            sets = []
+            for set_name, fuzzy_set in system.variables[var_name].sets.items():
+                slot = len(self.slot_index)
+                self.slot_index[(var_name, set_name)] = slot
+                sets.append((slot, fuzzy_set.a, fuzzy_set.b, fuzzy_set.c))
+            self.input_sets.append(sets)
+        self.zero_slot = len(self.slot_index)
+        self.slot_count = self.zero_slot + 1
+
+        # Output sets: (output index, set name) -> group index
+        self.groups = []  # (output index, set name)
+        group_index = {}
+        for out_idx, var_name in enumerate(self.output_names):
+            for set_name in system.variables[var_name].sets:
+                group_index[(var_name, set_name)] = len(self.groups)
+                self.groups.append((out_idx, set_name))
+
+        # Sampled output universe: x per sample and, per group, the run of
+        # samples where its set is non-zero as (first sample, memberships)
+        self.sample_points = []
+        for var_name in self.output_names:
+            variable = system.variables[var_name]
+            step = (variable.max_val - variable.min_val) / SAMPLES
+            self.sample_points.append([variable.min_val + i * step for i in range(SAMPLES + 1)])
+        self.group_samples = []
+        for out_idx, set_name in self.groups:
+            fuzzy_set = system.variables[self.output_names[out_idx]].sets[set_name]
+            values = [fuzzy_set.membership(x) for x in self.sample_points[out_idx]]
+            nonzero = [i for i, value in enumerate(values) if value > 0]
+            first = nonzero[0] if nonzero else 0
+            last = nonzero[-1] + 1 if nonzero else 0
+            self.group_samples.append((first, values[first:last]))
+
+        # Rules as (antecedent slots, is_and, group index), grouped by consequent
+        self.rules = []
+        self.rules_by_slot = [[] for _ in range(self.slot_count)]
+        for rule in system.rules:
+            if rule.operator not in ('AND', 'OR'):
+                continue  # FuzzyRule.evaluate returns 0.0 for unknown operators
+            group = group_index.get(tuple(rule.consequent))
+            if group is None:
+                continue
+            slots = tuple(self.slot_index.get(tuple(a), self.zero_slot) for a in rule.antecedents)
+            rule_idx = len(self.rules)
+            self.rules.append((slots, rule.operator == 'AND', group))
+            for slot in set(slots):
+                self.rules_by_slot[slot].append(rule_idx)
+
+    def memberships(self, values):
+        """Flat membership list for input values given in input_names order"""
+        mu = [0.0] * self.slot_count
+        for sets, x in zip(self.input_sets, values):
+            if x is None:
+                continue
+            # FuzzySet.membership inlined
+            for slot, a, b, c in sets:
+                if x <= a or x >= c:
+                    continue
+                if x == b:
+                    mu[slot] = 1.0
+                elif x < b:
+                    mu[slot] = (x - a) / (b - a)
+                else:
+                    mu[slot] = (c - x) / (c - b)
+        return mu
+
+    def rule_strengths(self, mu):
+        """Max firing strength per output group, skipping rules with no active antecedent"""
+        strengths = [0.0] * len(self.groups)
+        seen = set()
+        rules = self.rules
+        for slot in range(self.zero_slot):
+            if mu[slot] == 0.0:
+                continue
+            for rule_idx in self.rules_by_slot[slot]:
+                if rule_idx in seen:
+                    continue
+                seen.add(rule_idx)
+                slots, is_and, group = rules[rule_idx]
+                if is_and:
+                    strength = min(mu[s] for s in slots)
+                else:
+                    strength = max(mu[s] for s in slots)
+                if strength > strengths[group]:
+                    strengths[group] = strength
+        return strengths
+
+    def evaluate(self, values):
+        """
+        values: crisp inputs in input_names order
+        Returns list of crisp outputs in output_names order
+        """
+        strengths = self.rule_strengths(self.memberships(values))
+        if self.system.analytic:
+            output_memberships = [{} for _ in self.output_names]
+            for (out_idx, set_name), strength in zip(self.groups, strengths):
+                output_memberships[out_idx][set_name] = strength
+            return [
+                self.system.defuzzify(memberships, var_name)
+                for var_name, memberships in zip(self.output_names, output_memberships)
+            ]
+
+        envelopes = [[0.0] * (SAMPLES + 1) for _ in self.output_names]
+        for (out_idx, _), strength, (first, samples) in zip(self.groups, strengths, self.group_samples):
+            if strength <= 0:
+                continue
+            envelope = envelopes[out_idx]
+            for i, value in enumerate(samples, first):
+                if value > strength:
+                    value = strength
+                if value > envelope[i]:
+                    envelope[i] = value
+        return [self._defuzzify(points, envelope)
+                for points, envelope in zip(self.sample_points, envelopes)]
+
+    def _defuzzify(self, points, envelope):
+        """FuzzySystem.defuzzify / defuzzify_sampled on the sampled aggregate envelope"""
+        method = self.system.defuzzification
+        if method == "centroid":
+            numerator = 0.0
+            denominator = 0.0
+            for x, mu in zip(points, envelope):
+                if mu:
+                    numerator += x * mu
+                    denominator += mu
+            return numerator / denominator if denominator else 0.0
+
+        total = sum(envelope)
+        if total == 0:
+            return 0.0
+        if method == "mom":
+            height = max(envelope)
+            maxima = [x for x, mu in zip(points, envelope) if mu == height]
+            return sum(maxima) / len(maxima)
+        cumulative = 0.0
+        for x, mu in zip(points, envelope):
+            cumulative += mu
+            if cumulative >= total / 2:
+                return x
+        return sum(x * mu for x, mu in zip(points, envelope)) / total
+
+    def infer(self, inputs):
+        """Same interface as FuzzySystem.infer: {name: value} -> {output name: value}"""
+        values = [inputs.get(name) for name in self.input_names]
+        return dict(zip(self.output_names, self.evaluate(values)))
+
+    def calculate_tip(self, food_quality, service_quality):
+        """Compiled equivalent of FuzzySystem.calculate_tip for the tip model"""
+        return self.infer({"Food Quality": food_quality, "Service Quality": service_quality})["Tip"]
+
+    def calculate_tips(self, food_qualities, service_qualities):
+        """
+        calculate_tip for many pairs
+        Returns a NumPy array of tips if NumPy is installed, a list otherwise
+        """
+        tips = [self.calculate_tip(food, service) for food, service in zip(food_qualities, service_qualities)]
+        return tips if np is None else np.array(tips, dtype=float)
+
+
+# Example usage and test
+if __name__ == "__main__":
+    from fuzzy_tip_system import FuzzySystemBuilder
+
+    # The restaurant tip model written with the generic builder
+    builder = FuzzySystemBuilder()
+    builder.variable("Food Quality", 0, 10, Bad=(0, 0, 5), Good=(5, 10, 10))
+    builder.variable("Service Quality", 0, 10, Poor=(0, 0, 5), Excellent=(5, 10, 10))
+    builder.variable("Tip", 0, 20, Low=(0, 0, 10), High=(10, 20, 20))
+    builder.rule([("Service Quality", "Poor"), ("Food Quality", "Bad")], ("Tip", "Low"), "OR")
+    builder.rule([("Service Quality", "Excellent"), ("Food Quality", "Good")], ("Tip", "High"), "AND")
+    system = builder.build()
+    compiled = system.compile()
+
+    print("Compiled Fuzzy System Test")
+    print("=" * 60)
+    print(f"Inputs: {compiled.input_names}, Outputs: {compiled.output_names}")
+    for food, service in [(7, 3), (2, 2), (8, 8), (5, 5), (9, 1), (1, 9)]:
+        inputs = {"Food Quality": food, "Service Quality": service}
+        print(f"Food Quality: {food}, Service Quality: {service} -> "
+              f"Tip: {compiled.infer(inputs)['Tip']:.2f}% (interpreted: {system.infer(inputs)['Tip']:.2f}%)")
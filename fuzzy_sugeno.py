@@ -0,0 +1,157 @@
+"""
+Mamdani to Sugeno Fitting
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Inferensi Takagi-Sugeno jauh lebih murah daripada Mamdani karena tidak ada
+agregasi dan defuzzifikasi centroid: output = sum(w_i * z_i) / sum(w_i).
+Modul ini membangun sistem Sugeno dengan antecedent yang sama persis seperti
+sistem Mamdani, lalu mencari consequent tiap aturan (konstanta untuk orde 0,
+fungsi linear input untuk orde 1) dengan least squares terhadap output
+Mamdani pada titik-titik sampel. Error RMS dan maksimum dilaporkan sehingga
+bisa diputuskan apakah hasilnya cukup dekat untuk menggantikan jalur utama.
+"""
+
+import random
+from fuzzy_tip_system import FuzzySystem, FuzzyVariable, FuzzyRule
+
+
+def _sample_points(variables, samples, max_points, seed):
+    """Full grid with samples points per input if it fits in max_points, random points otherwise"""
+    axes = []
+    for variable in variables:
+        step = (variable.max_val - variable.min_val) / (samples - 1)
+        axes.append([variable.min_val + k * step for k in range(samples)])
+
+    if samples ** len(variables) <= max_points:
+        points = [[]]
+        for axis in axes:
+            points = [point + [value] for point in points for value in axis]
+        return points
+
+    rng = random.Random(seed)
+    return [[rng.uniform(v.min_val, v.max_val) for v in variables] for _ in range(max_points)]
+
+
+def _solve_least_squares(rows, targets, ridge):
+    """Solve (A^T A + ridge * I) x = A^T b with Gaussian elimination (partial pivoting)"""
+    size = len(rows[0])
+    normal = [[0.0] * size for _ in range(size)]
+    rhs = [0.0] * size
+    for row, target in zip(rows, targets):
+        for i, a in enumerate(row):
+            if a == 0.0:
+                continue
+            rhs[i] += a * target
+            normal_i = normal[i]
+            for j, b in enumerate(row):
+                normal_i[j] += a * b
+    for i in range(size):
+        normal[i][i] += ridge
+
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(normal[r][col]))
+        normal[col], normal[pivot] = normal[pivot], normal[col]
+        rhs[col], rhs[pivot] = rhs[pivot], rhs[col]
+        diagonal = normal[col][col]
+        if diagonal == 0.0:
+            continue
+        for r in range(col + 1, size):
+            factor = normal[r][col] / diagonal
+            if factor == 0.0:
+                continue
+            normal_r = normal[r]
+            normal_c = normal[col]
+            for j in range(col, size):
+                normal_r[j] -= factor * normal_c[j]
+            rhs[r] -= factor * rhs[col]
+
+    solution = [0.0] * size
+    for i in range(size - 1, -1, -1):
+        total = rhs[i] - sum(normal[i][j] * solution[j] for j in range(i + 1, size))
+        solution[i] = total / normal[i][i] if normal[i][i] else 0.0
+    return solution
+
+
+def fit_sugeno(mamdani_system, order=1, samples=21, max_points=20000, ridge=1e-9, seed=0):
+    """
+    Fit a Sugeno system that approximates mamdani_system
+    order: 0 (constant consequents) or 1 (linear in the inputs)
+    samples: points per input axis of the fitting grid
+    max_points: above this many grid points, random points are used instead
+    Returns (sugeno_system, report) where report[output] = {'rmse', 'max_error', 'points'}
+    """
+    if order not in (0, 1):
+        raise ValueError("order must be 0 or 1")
+    if samples < 2:
+        raise ValueError("samples must be at least 2")
+
+    sugeno = FuzzySystem(mamdani_system.defuzzification, mamdani_system.analytic,
+                         tip_system=False, inference="sugeno")
+    input_names = mamdani_system.input_variables()
+    output_names = mamdani_system.output_variables()
+    for name in input_names:
+        sugeno.add_variable(mamdani_system.variables[name])
+
+    points = _sample_points([mamdani_system.variables[name] for name in input_names],
+                            samples, max_points, seed)
+    inputs_list = [dict(zip(input_names, point)) for point in points]
+    memberships_list = [mamdani_system.fuzzify(inputs) for inputs in inputs_list]
+
+    report = {}
+    for output_name in output_names:
+        source = mamdani_system.variables[output_name]
+        output_variable = FuzzyVariable(output_name, source.min_val, source.max_val)
+        sugeno.add_variable(output_variable)
+        rules = [rule for rule in mamdani_system.rules if rule.consequent[0] == output_name]
+        width = 1 + (len(input_names) if order == 1 else 0)
+
+        # Design matrix: normalized strength of each rule times [1, x1, ..., xn]
+        rows, targets = [], []
+        for inputs, point, memberships in zip(inputs_list, points, memberships_list):
+            strengths = [rule.evaluate(memberships) for rule in rules]
+            total = sum(strengths)
+            if total == 0:
+                continue  # Sugeno output is 0 here regardless of the consequents
+            features = [1.0] + point if order == 1 else [1.0]
+            row = []
+            for strength in strengths:
+                weight = strength / total
+                row.extend(weight * feature for feature in features)
+            rows.append(row)
+            targets.append(mamdani_system.infer(inputs)[output_name])
+
+        coefficients = _solve_least_squares(rows, targets, ridge) if rows else [0.0] * (width * len(rules))
+        for index, rule in enumerate(rules):
+            params = coefficients[index * width:(index + 1) * width]
+            function_name = f"{rule.consequent[1]}_{index}"
+            output_variable.add_function(function_name, params[0], dict(zip(input_names, params[1:])))
+            sugeno.add_rule(FuzzyRule(rule.antecedents, (output_name, function_name), rule.operator))
+
+        errors = [sugeno.infer(inputs)[output_name] - mamdani_system.infer(inputs)[output_name]
+                  for inputs in inputs_list]
+        report[output_name] = {
+            "rmse": (sum(e * e for e in errors) / len(errors)) ** 0.5 if errors else 0.0,
+            "max_error": max((abs(e) for e in errors), default=0.0),
+            "points": len(errors),
+        }
+    return sugeno, report
+
+
+# Example usage and test
+if __name__ == "__main__":
+    mamdani = FuzzySystem()
+
+    print("Mamdani to Sugeno Fitting Test")
+    print("=" * 60)
+    for order in (0, 1):
+        sugeno, report = fit_sugeno(mamdani, order=order)
+        tip_report = report["Tip"]
+        print(f"Order {order}: RMSE = {tip_report['rmse']:.4f}, "
+              f"max error = {tip_report['max_error']:.4f} over {tip_report['points']} points")
+        for function in sugeno.variables["Tip"].functions.values():
+            print(f"  {function}")
+
+    for food, service in [(7, 3), (2, 2), (8, 8), (5, 5), (9, 1), (1, 9)]:
+        print(f"Food Quality: {food}, Service Quality: {service} -> "
+              f"Tip: {sugeno.calculate_tip(food, service):.2f}% (Mamdani: {mamdani.calculate_tip(food, service):.2f}%)")
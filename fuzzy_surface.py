@@ -0,0 +1,225 @@
+"""
+Precomputed Control Surface for the Fuzzy Tip System
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Sistem tip hanya memiliki dua input terbatas (Food Quality dan Service
+Quality, 0-10), sehingga seluruh output-nya adalah permukaan 2 dimensi.
+Permukaan ini ditabulasi sekali pada grid, lalu query dijawab dengan
+interpolasi bilinear.
+
+Output sistem tidak kontinu di ujung support himpunan input (misalnya
+Food = 5: tip melompat dari sekitar 5% ke 15%, dan tepat di garis itu
+bernilai 0). Interpolasi di sel yang memuat garis seperti itu selalu salah
+berapa pun resolusinya, sehingga query di sel tersebut dihitung dengan mesin
+fuzzy asli. sampled_error adalah selisih terbesar yang ditemukan pada titik
+tengah sel dan tepi grid; ini hasil sampling, bukan batas error yang dijamin.
+"""
+
+import json
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, lookups fall back to a Python loop
+    np = None
+
+
+class TipSurface:
+    def __init__(self, food_range, service_range, resolution, values, sampled_error=None, system=None,
+                 food_breaks=(), service_breaks=()):
+        """
+        food_range, service_range: (min, max) of each input
+        resolution: number of grid points per axis
+        values: row-major tip values, values[i * resolution + j] at (food_i, service_j)
+        sampled_error: largest deviation from the exact engine at the sampled points
+        system: FuzzySystem used for inputs outside the tabulated range and for
+                cells that contain a discontinuity (without it those are interpolated)
+        food_breaks, service_breaks: input values where the output may jump
+        """
+        self.food_range = tuple(food_range)
+        self.service_range = tuple(service_range)
+        self.resolution = resolution
+        self.values = values
+        self.sampled_error = sampled_error
+        self.system = system
+        self.food_breaks = tuple(food_breaks)
+        self.service_breaks = tuple(service_breaks)
+        # Per cell index: True if the cell contains a break line
+        self.exact_food = _break_cells(self.food_breaks, self.food_range, resolution - 1)
+        self.exact_service = _break_cells(self.service_breaks, self.service_range, resolution - 1)
+
+    @classmethod
+    def compile(cls, system, resolution=101, validate=True):
+        """Tabulate system over a resolution x resolution grid"""
+        if resolution < 2:
+            raise ValueError("resolution must be at least 2")
+        food_var = system.variables["Food Quality"]
+        service_var = system.variables["Service Quality"]
+        food_range = (food_var.min_val, food_var.max_val)
+        service_range = (service_var.min_val, service_var.max_val)
+
+        foods = _axis(food_range, resolution)
+        services = _axis(service_range, resolution)
+        grid_foods = [food for food in foods for _ in services]
+        grid_services = [service for _ in foods for service in services]
+        values = array('d', system.calculate_tips(grid_foods, grid_services))
+
+        surface = cls(food_range, service_range, resolution, values, system=system,
+                      food_breaks=_support_ends(food_var), service_breaks=_support_ends(service_var))
+        if validate:
+            surface.sampled_error = surface.measure_error(system)
+        return surface
+
+    def measure_error(self, system):
+        """
+        Max |surface - exact| over the cell centers and edge midpoints of the grid
+        A sampled estimate: the error between these points can be larger
+        """
+        foods = _axis(self.food_range, 2 * self.resolution - 1)
+        services = _axis(self.service_range, 2 * self.resolution - 1)
+        # Only points that are not grid nodes themselves
+        points = [(f, s) for i, f in enumerate(foods) for j, s in enumerate(services)
+                  if i % 2 or j % 2]
+        if not points:
+            return 0.0
+        exact = system.calculate_tips([f for f, _ in points], [s for _, s in points])
+        approx = self.calculate_tips([f for f, _ in points], [s for _, s in points])
+        return max(abs(a - b) for a, b in zip(exact, approx))
+
+    def calculate_tip(self, food_quality, service_quality):
+        """Tip by bilinear interpolation of the tabulated surface"""
+        if self.system is not None and not self._in_range(food_quality, service_quality):
+            return self.system.infer({"Food Quality": food_quality, "Service Quality": service_quality})["Tip"]
+
+        n = self.resolution - 1
+        u = _grid_position(food_quality, self.food_range, n)
+        v = _grid_position(service_quality, self.service_range, n)
+        i = min(int(u), n - 1)
+        j = min(int(v), n - 1)
+        if self.system is not None and (self.exact_food[i] or self.exact_service[j]):
+            return self.system.infer({"Food Quality": food_quality, "Service Quality": service_quality})["Tip"]
+        du = u - i
+        dv = v - j
+
+        values = self.values
+        row = i * self.resolution
+        next_row = row + self.resolution
+        top = values[row + j] * (1 - dv) + values[row + j + 1] * dv
+        bottom = values[next_row + j] * (1 - dv) + values[next_row + j + 1] * dv
+        return top * (1 - du) + bottom * du
+
+    def calculate_tips(self, food_qualities, service_qualities):
+        """Vectorized calculate_tip for arrays of inputs"""
+        if np is None:
+            return [self.calculate_tip(f, s) for f, s in zip(food_qualities, service_qualities)]
+
+        foods = np.asarray(food_qualities, dtype=float).ravel()
+        services = np.asarray(service_qualities, dtype=float).ravel()
+        n = self.resolution - 1
+        table = np.frombuffer(self.values, dtype=float).reshape(self.resolution, self.resolution)
+        u = _grid_position_array(foods, self.food_range, n)
+        v = _grid_position_array(services, self.service_range, n)
+        i = np.minimum(u.astype(int), n - 1)
+        j = np.minimum(v.astype(int), n - 1)
+        du = u - i
+        dv = v - j
+        top = table[i, j] * (1 - dv) + table[i, j + 1] * dv
+        bottom = table[i + 1, j] * (1 - dv) + table[i + 1, j + 1] * dv
+        tips = top * (1 - du) + bottom * du
+
+        if self.system is not None:
+            exact = ((foods < self.food_range[0]) | (foods > self.food_range[1])
+                     | (services < self.service_range[0]) | (services > self.service_range[1])
+                     | np.array(self.exact_food)[i] | np.array(self.exact_service)[j])
+            if exact.any():
+                tips[exact] = self.system.calculate_tips(foods[exact], services[exact])
+        return tips
+
+    def _in_range(self, food_quality, service_quality):
+        return (self.food_range[0] <= food_quality <= self.food_range[1]
+                and self.service_range[0] <= service_quality <= self.service_range[1])
+
+    def save(self, filename):
+        """Persist the surface as JSON"""
+        data = {
+            "food_range": self.food_range,
+            "service_range": self.service_range,
+            "resolution": self.resolution,
+            "sampled_error": self.sampled_error,
+            "food_breaks": self.food_breaks,
+            "service_breaks": self.service_breaks,
+            "values": list(self.values),
+        }
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, filename, system=None):
+        """Load a surface written with save()"""
+        with open(filename) as f:
+            data = json.load(f)
+        # Files written before the break lines were stored: no exact cells
+        return cls(data["food_range"], data["service_range"], data["resolution"],
+                   array('d', data["values"]), data.get("sampled_error", data.get("max_error")), system,
+                   data.get("food_breaks", ()), data.get("service_breaks", ()))
+
+
+def _axis(value_range, points):
+    lo, hi = value_range
+    if points == 1:
+        return [lo]
+    step = (hi - lo) / (points - 1)
+    return [lo + k * step for k in range(points)]
+
+
+def _support_ends(variable):
+    """Input values where a set of variable drops to zero, the only places the output can jump"""
+    ends = set()
+    for fuzzy_set in variable.sets.values():
+        ends.update((fuzzy_set.a, fuzzy_set.c))
+    return sorted(x for x in ends if variable.min_val <= x <= variable.max_val)
+
+
+def _break_cells(breaks, value_range, n):
+    """Per cell index 0..n-1: True if the cell (boundaries included) contains a break"""
+    cells = [False] * n
+    lo, hi = value_range
+    for x in breaks:
+        position = (x - lo) / (hi - lo) * n
+        # A break on a grid line belongs to the cells on both sides
+        first = max(math.floor(position - 1e-9), 0)
+        last = min(math.ceil(position + 1e-9) - 1, n - 1)
+        for cell in range(first, last + 1):
+            cells[cell] = True
+    return cells
+
+
+def _grid_position(value, value_range, n):
+    """Continuous grid coordinate of value, clamped to [0, n]"""
+    lo, hi = value_range
+    position = (value - lo) / (hi - lo) * n
+    return min(max(position, 0.0), float(n))
+
+
+def _grid_position_array(values, value_range, n):
+    lo, hi = value_range
+    return np.clip((values - lo) / (hi - lo) * n, 0.0, float(n))
+
+
+# Example usage and test
+if __name__ == "__main__":
+    from fuzzy_tip_system import FuzzySystem
+
+    fuzzy_system = FuzzySystem()
+    print("Compiled Tip Surface Test")
+    print("=" * 60)
+    for resolution in (11, 101, 201):
+        surface = TipSurface.compile(fuzzy_system, resolution)
+        interpolated = (1 - sum(surface.exact_food) / (resolution - 1)) * (1 - sum(surface.exact_service) / (resolution - 1))
+        print(f"Resolution {resolution}x{resolution}: sampled error = {surface.sampled_error:.4f}, "
+              f"exact cells = {1 - interpolated:.1%}")
+
+    for food, service in [(7, 3), (2, 2), (8, 8), (5, 5), (9, 1), (1, 9)]:
+        print(f"Food Quality: {food}, Service Quality: {service} -> Tip: {surface.calculate_tip(food, service):.2f}%")
@@ -0,0 +1,212 @@
+"""
+Streaming Command-Line Tip Scoring
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Membaca baris (food, service) dari CSV atau JSONL (file atau stdin) secara
+streaming, menghitung tip per chunk di beberapa proses, lalu menulis hasil
+sesuai urutan input. Jumlah chunk yang sedang diproses dibatasi sehingga
+memori tetap konstan berapa pun besar file input.
+
+Contoh:
+    python fuzzy_tip_cli.py transactions.csv -o tips.csv --workers 8
+    cat rows.jsonl | python fuzzy_tip_cli.py --format jsonl --engine compiled
+"""
+
+import argparse
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fuzzy_sugeno import fit_sugeno
+from fuzzy_tip_system import FuzzySystem
+
+# mamdani: FuzzySystem, compiled: CompiledFuzzySystem, sugeno: fit_sugeno model,
+# surface: interpolated TipSurface
+ENGINES = ("mamdani", "compiled", "sugeno", "surface")
+
+_worker_system = None
+
+
+def build_engine(engine="mamdani", defuzzification="centroid", analytic=False):
+    """Tip system for engine, built from the Mamdani tip model"""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    system = FuzzySystem(defuzzification, analytic)
+    if engine == "compiled":
+        return system.compile()
+    if engine == "sugeno":
+        return fit_sugeno(system)[0]
+    if engine == "surface":
+        return system.compile_surface(validate=False)
+    return system
+
+
+def _init_worker(defuzzification, analytic, engine="mamdani"):
+    """Build one tip system per worker process from the shared definition"""
+    global _worker_system
+    _worker_system = build_engine(engine, defuzzification, analytic)
+
+
+def _is_number(field):
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def score_lines(lines, fmt, food_key, service_key, name="-", first_line=1):
+    """
+    Parse, score and format one chunk of raw input lines (runs in a worker)
+    CSV rows get the tip appended as an extra column, JSONL records get a 'tip' field
+    name, first_line: input name and line number of lines[0], for error messages
+    Raises ValueError "name:line: ..." for the first row that cannot be scored
+    """
+    if fmt == "jsonl":
+        parsed = ((number, line) for number, line in enumerate(lines, first_line) if line.strip())
+    else:
+        parsed = ((number, row) for number, row in enumerate(csv.reader(lines), first_line) if row)
+        width = max(food_key, service_key) + 1
+
+    rows, foods, services = [], [], []
+    for number, row in parsed:
+        try:
+            if fmt == "jsonl":
+                row = json.loads(row)
+                if not isinstance(row, dict) or food_key not in row or service_key not in row:
+                    raise ValueError(f"expected an object with '{food_key}' and '{service_key}' fields")
+            elif len(row) < width:
+                raise ValueError(f"expected at least {width} columns, got {len(row)}")
+            foods.append(float(row[food_key]))
+            services.append(float(row[service_key]))
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"{name}:{number}: {error}") from None
+        rows.append(row)
+    tips = _worker_system.calculate_tips(foods, services)
+
+    out = io.StringIO()
+    if fmt == "jsonl":
+        for record, tip in zip(rows, tips):
+            record["tip"] = float(tip)
+            out.write(json.dumps(record) + "\n")
+    else:
+        writer = csv.writer(out, lineterminator="\n")
+        for row, tip in zip(rows, tips):
+            writer.writerow(row + [f"{tip:.6f}"])
+    return out.getvalue()
+
+
+def score_stream(stream, output, fmt="csv", workers=1, chunk_size=50000,
+                 defuzzification="centroid", analytic=False,
+                 food_column="food", service_column="service", pool=None,
+                 engine="mamdani", write_header=True, name="-"):
+    """
+    Score one input stream chunk by chunk and write results in input order
+    Raw lines are parsed in the workers; at most 2 * workers chunks are in flight,
+    so memory stays bounded (CSV fields must not contain embedded newlines)
+    write_header: copy the CSV header (plus a tip column) to output; pass False
+                  for every input after the first so the header appears once
+    name: input name used in error messages
+    Raises ValueError "name:line: ..." if the first CSV row is a header without the
+    named columns or a row cannot be scored; output already written is kept
+    """
+    food_key, service_key = food_column, service_column
+    line = 1
+    if fmt == "csv":
+        food_key, service_key = 0, 1
+        first = stream.readline()
+        header = next(csv.reader([first]), [])
+        if food_column in header and service_column in header:
+            food_key, service_key = header.index(food_column), header.index(service_column)
+            if write_header:
+                output.write(first.rstrip("\r\n") + ",tip\n")
+            first = ""
+            line = 2
+        elif header and not all(_is_number(field) for field in header[:2]):
+            raise ValueError(f"{name}:1: CSV header {header} has no '{food_column}' and '{service_column}' "
+                             f"columns (use --food-column / --service-column)")
+        stream = itertools.chain([first] if first else [], stream)
+
+    chunks = iter(lambda: list(itertools.islice(stream, chunk_size)), [])
+
+    if pool is None:
+        _init_worker(defuzzification, analytic, engine)
+        for lines in chunks:
+            output.write(score_lines(lines, fmt, food_key, service_key, name, line))
+            line += len(lines)
+        return
+
+    pending = deque()
+    try:
+        for lines in chunks:
+            pending.append(pool.submit(score_lines, lines, fmt, food_key, service_key, name, line))
+            line += len(lines)
+            if len(pending) >= 2 * workers:
+                output.write(pending.popleft().result())
+        while pending:
+            output.write(pending.popleft().result())
+    finally:
+        # A failed chunk stops the input: drop the chunks queued behind it
+        for future in pending:
+            future.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score (food, service) rows with the fuzzy tip system")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="CSV/JSONL files (.gz allowed), '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, '-' for stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="input/output format (default: from extension)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=50000, help="lines per chunk")
+    parser.add_argument("--food-column", default="food")
+    parser.add_argument("--service-column", default="service")
+    parser.add_argument("--defuzzification", choices=FuzzySystem.DEFUZZIFICATION_METHODS, default="centroid")
+    parser.add_argument("--analytic", action="store_true", help="exact defuzzification")
+    parser.add_argument("--engine", choices=ENGINES, default="mamdani",
+                        help="inference engine (compiled: same results, faster; sugeno / surface: approximations)")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "jsonl" if any(name.endswith((".jsonl", ".jsonl.gz")) for name in args.inputs) else "csv"
+
+    pool = None
+    if args.workers > 1:
+        pool = ProcessPoolExecutor(args.workers, initializer=_init_worker,
+                                   initargs=(args.defuzzification, args.analytic, args.engine))
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        for index, name in enumerate(args.inputs):
+            if name == "-":
+                stream = sys.stdin
+            elif name.endswith(".gz"):
+                stream = gzip.open(name, "rt", newline="")
+            else:
+                stream = open(name, newline="")
+            try:
+                score_stream(stream, output, fmt, args.workers, args.chunk_size,
+                             args.defuzzification, args.analytic,
+                             args.food_column, args.service_column, pool,
+                             args.engine, write_header=index == 0,
+                             name="<stdin>" if name == "-" else name)
+            except ValueError as error:
+                # Bad input data, not a bad command line: no usage message
+                sys.exit(str(error))
+            finally:
+                if stream is not sys.stdin:
+                    stream.close()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
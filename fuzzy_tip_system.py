@@ -13,6 +13,14 @@ Rules:
 2. IF Service is Excellent AND Food is Good THEN Tip is High
 """
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, batch inference falls back to a Python loop
+    np = None
+
+from fuzzy_compiler import CompiledFuzzySystem
+from fuzzy_surface import TipSurface
+
 class FuzzySet:
     def __init__(self, name, a, b, c):
         """
@@ -36,21 +44,71 @@ class FuzzySet:
         else:  # self.b < x < self.c
             return (self.c - x) / (self.c - self.b)
     
+    def line_at(self, x):
+        """(slope, intercept) of the linear piece of the triangle around x"""
+        if x < self.a or x > self.c:
+            return 0.0, 0.0
+        if x < self.b:
+            slope = 1.0 / (self.b - self.a)
+            return slope, -self.a * slope
+        if x > self.b:
+            slope = -1.0 / (self.c - self.b)
+            return slope, -self.c * slope
+        return 0.0, 1.0
+    
+    def membership_array(self, x):
+        """Vectorized membership() for a NumPy array x"""
+        result = np.zeros(x.shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rising = (x > self.a) & (x < self.b)
+            result[rising] = (x[rising] - self.a) / (self.b - self.a)
+            falling = (x > self.b) & (x < self.c)
+            result[falling] = (self.c - x[falling]) / (self.c - self.b)
+        result[(x == self.b) & (x > self.a) & (x < self.c)] = 1.0
+        return result
+    
     def __str__(self):
         return f"{self.name}: ({self.a}, {self.b}, {self.c})"
 
 
+class SugenoFunction:
+    def __init__(self, name, constant=0.0, coefficients=None):
+        """
+        Takagi-Sugeno consequent: constant + sum(coefficient * input value)
+        coefficients: {input_variable_name: coefficient}, empty for zero-order
+        """
+        self.name = name
+        self.constant = constant
+        self.coefficients = dict(coefficients or {})
+    
+    def evaluate(self, inputs):
+        """inputs: {variable_name: value}, values may also be NumPy arrays"""
+        value = self.constant
+        for var_name, coefficient in self.coefficients.items():
+            value = value + coefficient * inputs.get(var_name, 0.0)
+        return value
+    
+    def __str__(self):
+        terms = " + ".join(f"{c:.4g}*{v}" for v, c in self.coefficients.items())
+        return f"{self.name}: {self.constant:.4g}" + (f" + {terms}" if terms else "")
+
+
 class FuzzyVariable:
     def __init__(self, name, min_val, max_val):
         self.name = name
         self.min_val = min_val
         self.max_val = max_val
         self.sets = {}
+        self.functions = {}
     
     def add_set(self, set_name, a, b, c):
         """Add a fuzzy set to this variable"""
         self.sets[set_name] = FuzzySet(set_name, a, b, c)
     
+    def add_function(self, function_name, constant=0.0, coefficients=None):
+        """Add a Sugeno consequent function to this (output) variable"""
+        self.functions[function_name] = SugenoFunction(function_name, constant, coefficients)
+    
     def fuzzify(self, value):
         """Convert crisp value to fuzzy memberships"""
         memberships = {}
@@ -88,11 +146,201 @@ class FuzzyRule:
             return 0.0
 
 
+class TraceListener:
+    """
+    Observer for FuzzySystem.calculate_tip; override the events you need
+    Events are only produced while a listener is attached to the system
+    """
+    def on_start(self, inputs):
+        """inputs: {variable_name: crisp value}"""
+    
+    def on_fuzzify(self, input_memberships):
+        """input_memberships: {variable_name: {set_name: membership}}"""
+    
+    def on_rules(self, rules, strengths):
+        """rules: the FuzzyRules of the Tip output, strengths: firing strength of each of them"""
+    
+    def on_output(self, output_memberships):
+        """output_memberships: aggregated {set_name: strength}"""
+    
+    def on_result(self, value):
+        """value: defuzzified crisp output"""
+
+
+class ConsoleTracer(TraceListener):
+    """Prints every inference step to stdout"""
+    def on_start(self, inputs):
+        food_quality = inputs["Food Quality"]
+        service_quality = inputs["Service Quality"]
+        print(f"Calculating tip for Food Quality: {food_quality}, Service Quality: {service_quality}")
+        print("=" * 60)
+    
+    def on_fuzzify(self, input_memberships):
+        print("Step 1: Fuzzification")
+        for var_name, memberships in input_memberships.items():
+            print(f"{var_name}:")
+            for set_name, membership in memberships.items():
+                print(f"  {set_name}: {membership:.3f}")
+    
+    def on_rules(self, rules, strengths):
+        print("\nStep 2: Rule Evaluation")
+        for i, rule_strength in enumerate(strengths, 1):
+            print(f"Rule {i}: {rule_strength:.3f}")
+    
+    def on_output(self, output_memberships):
+        print(f"\nOutput memberships:")
+        for set_name, membership in output_memberships.items():
+            print(f"  {set_name}: {membership:.3f}")
+    
+    def on_result(self, value):
+        print("\nStep 3: Defuzzification")
+        print(f"Final tip percentage: {value:.2f}%")
+
+
+def aggregate_segments(fuzzy_sets, strengths, lo, hi):
+    """
+    Exact piecewise-linear form of max_k min(set_k(x), strength_k) on [lo, hi]
+    Returns list of (x0, x1, slope, intercept) segments
+    """
+    if not fuzzy_sets:
+        return []
+    points = {lo, hi}
+    for fuzzy_set, strength in zip(fuzzy_sets, strengths):
+        points.update((fuzzy_set.a, fuzzy_set.b, fuzzy_set.c))
+        # Where the rising / falling edge crosses the clipping level
+        if fuzzy_set.b > fuzzy_set.a:
+            points.add(fuzzy_set.a + strength * (fuzzy_set.b - fuzzy_set.a))
+        if fuzzy_set.c > fuzzy_set.b:
+            points.add(fuzzy_set.c - strength * (fuzzy_set.c - fuzzy_set.b))
+    points = sorted(p for p in points if lo <= p <= hi)
+    
+    def clipped_lines(x):
+        lines = []
+        for fuzzy_set, strength in zip(fuzzy_sets, strengths):
+            slope, intercept = fuzzy_set.line_at(x)
+            if slope * x + intercept >= strength:
+                slope, intercept = 0.0, strength
+            lines.append((slope, intercept))
+        return lines
+    
+    segments = []
+    for x0, x1 in zip(points, points[1:]):
+        if x1 <= x0:
+            continue
+        lines = clipped_lines((x0 + x1) / 2)
+        # The upper envelope can only switch lines where two of them cross
+        cuts = {x0, x1}
+        for i in range(len(lines)):
+            for j in range(i + 1, len(lines)):
+                (m1, q1), (m2, q2) = lines[i], lines[j]
+                if m1 != m2:
+                    x = (q2 - q1) / (m1 - m2)
+                    if x0 < x < x1:
+                        cuts.add(x)
+        cuts = sorted(cuts)
+        for s0, s1 in zip(cuts, cuts[1:]):
+            mid = (s0 + s1) / 2
+            slope, intercept = max(lines, key=lambda line: line[0] * mid + line[1])
+            segments.append((s0, s1, slope, intercept))
+    return segments
+
+
+def segments_centroid(segments):
+    area = 0.0
+    moment = 0.0
+    for x0, x1, m, q in segments:
+        area += (m * (x0 + x1) / 2 + q) * (x1 - x0)
+        moment += m * (x1 ** 3 - x0 ** 3) / 3 + q * (x1 ** 2 - x0 ** 2) / 2
+    if area == 0:
+        return 0.0
+    return moment / area
+
+
+def segments_bisector(segments):
+    areas = [(m * (x0 + x1) / 2 + q) * (x1 - x0) for x0, x1, m, q in segments]
+    remaining = sum(areas) / 2
+    if remaining == 0:
+        return 0.0
+    for (x0, x1, m, q), area in zip(segments, areas):
+        if area < remaining:
+            remaining -= area
+            continue
+        # Solve m/2 u^2 + f0 u = remaining for u = x - x0 (stable form)
+        f0 = m * x0 + q
+        denominator = f0 + (max(f0 * f0 + 2 * m * remaining, 0.0)) ** 0.5
+        return x0 + (2 * remaining / denominator if denominator > 0 else 0.0)
+    return segments[-1][1]
+
+
+def segments_mean_of_maximum(segments, tolerance=1e-9):
+    height = 0.0
+    for x0, x1, m, q in segments:
+        height = max(height, m * x0 + q, m * x1 + q)
+    if height == 0:
+        return 0.0
+    
+    # Tolerance absorbs rounding where an edge meets its clipping level
+    level = height - tolerance
+    plateau_length = 0.0
+    plateau_moment = 0.0
+    peaks = set()
+    for x0, x1, m, q in segments:
+        if m == 0 and q >= level:
+            plateau_length += x1 - x0
+            plateau_moment += (x1 ** 2 - x0 ** 2) / 2
+        else:
+            for x in (x0, x1):
+                if m * x + q >= level:
+                    peaks.add(x)
+    if plateau_length > 0:
+        return plateau_moment / plateau_length
+    return sum(peaks) / len(peaks)
+
+
 class FuzzySystem:
-    def __init__(self):
+    DEFUZZIFICATION_METHODS = ("centroid", "bisector", "mom")
+    INFERENCE_METHODS = ("mamdani", "sugeno")
+    
+    def __init__(self, defuzzification="centroid", analytic=False, tip_system=True, inference="mamdani"):
+        """
+        defuzzification: 'centroid', 'bisector' or 'mom' (mean of maximum)
+        analytic: compute the result exactly for triangular output sets
+        instead of sampling the output universe at 101 points
+        tip_system: set up the restaurant tip model (False gives an empty system)
+        inference: 'mamdani' (fuzzy output sets) or 'sugeno' (rule consequents are
+        SugenoFunction and the output is the strength-weighted average)
+        """
+        if defuzzification not in self.DEFUZZIFICATION_METHODS:
+            raise ValueError(f"Unknown defuzzification method: {defuzzification}")
+        if inference not in self.INFERENCE_METHODS:
+            raise ValueError(f"Unknown inference method: {inference}")
+        self.defuzzification = defuzzification
+        self.analytic = analytic
+        self.inference = inference
         self.variables = {}
         self.rules = []
-        self.setup_tip_system()
+        self.listeners = []
+        if tip_system:
+            self.setup_tip_system()
+    
+    def add_variable(self, variable):
+        """Add a FuzzyVariable (input or output)"""
+        self.variables[variable.name] = variable
+    
+    def add_rule(self, rule):
+        self.rules.append(rule)
+    
+    def output_variables(self):
+        """Names of the variables used as rule consequents"""
+        names = []
+        for rule in self.rules:
+            if rule.consequent[0] not in names:
+                names.append(rule.consequent[0])
+        return names
+    
+    def input_variables(self):
+        outputs = set(self.output_variables())
+        return [name for name in self.variables if name not in outputs]
     
     def setup_tip_system(self):
         """Setup the restaurant tip fuzzy system"""
@@ -137,20 +385,98 @@ class FuzzySystem:
         
         return input_memberships
     
-    def apply_rules(self, input_memberships):
-        """Apply fuzzy rules to get output memberships"""
-        output_memberships = {"Low": 0.0, "High": 0.0}
+    def fuzzify(self, inputs):
+        """Convert {variable_name: crisp value} to fuzzy memberships"""
+        return {var_name: self.variables[var_name].fuzzify(value) for var_name, value in inputs.items()}
+    
+    def infer(self, inputs):
+        """
+        Generic inference for any model built with add_variable / add_rule
+        inputs: {variable_name: crisp value}
+        Returns {output_variable_name: crisp value}
+        """
+        input_memberships = self.fuzzify(inputs)
+        if self.inference == "sugeno":
+            return {
+                output_variable: self.sugeno_output(input_memberships, inputs, output_variable)
+                for output_variable in self.output_variables()
+            }
+        return {
+            output_variable: self.defuzzify(self.apply_rules(input_memberships, output_variable=output_variable),
+                                            output_variable)
+            for output_variable in self.output_variables()
+        }
+    
+    def compile(self):
+        """Compile the rule base to integer indices for fast evaluation (see fuzzy_compiler.py)"""
+        return CompiledFuzzySystem(self)
+    
+    def add_listener(self, listener):
+        """Attach a TraceListener that receives every inference step"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+    
+    def apply_rules(self, input_memberships, strengths=None, output_variable="Tip"):
+        """
+        Apply fuzzy rules to get output memberships of output_variable
+        strengths: optional list that receives the firing strength of each rule
+        """
+        output_memberships = {set_name: 0.0 for set_name in self.variables[output_variable].sets}
         
         for rule in self.rules:
+            if rule.consequent[0] != output_variable:
+                continue
             rule_strength = rule.evaluate(input_memberships)
+            if strengths is not None:
+                strengths.append(rule_strength)
             output_set = rule.consequent[1]
             output_memberships[output_set] = max(output_memberships[output_set], rule_strength)
         
         return output_memberships
     
-    def defuzzify(self, output_memberships):
-        """Convert fuzzy output to crisp value using centroid method"""
-        tip_var = self.variables["Tip"]
+    def sugeno_output(self, input_memberships, inputs, output_variable="Tip", strengths=None):
+        """
+        Takagi-Sugeno output: sum(w_i * z_i) / sum(w_i) over the rules of output_variable
+        strengths: optional list that receives the firing strength of each rule
+        """
+        functions = self.variables[output_variable].functions
+        numerator = 0.0
+        denominator = 0.0
+        for rule in self.rules:
+            if rule.consequent[0] != output_variable:
+                continue
+            rule_strength = rule.evaluate(input_memberships)
+            if strengths is not None:
+                strengths.append(rule_strength)
+            if rule_strength > 0:
+                numerator += rule_strength * functions[rule.consequent[1]].evaluate(inputs)
+                denominator += rule_strength
+        if denominator == 0:
+            return 0.0
+        return numerator / denominator
+    
+    def defuzzify(self, output_memberships, output_variable="Tip"):
+        """Convert fuzzy output to crisp value using the configured method"""
+        tip_var = self.variables[output_variable]
+        
+        # Exact piecewise-linear computation when every output set is a plain triangle
+        if self.analytic and all(type(s) is FuzzySet for s in tip_var.sets.values()):
+            names = [name for name, strength in output_memberships.items() if strength > 0]
+            segments = aggregate_segments(
+                [tip_var.sets[name] for name in names],
+                [output_memberships[name] for name in names],
+                tip_var.min_val, tip_var.max_val
+            )
+            if self.defuzzification == "bisector":
+                return segments_bisector(segments)
+            if self.defuzzification == "mom":
+                return segments_mean_of_maximum(segments)
+            return segments_centroid(segments)
+        
+        if self.defuzzification != "centroid":
+            return self.defuzzify_sampled(output_memberships, output_variable)
         
         # Sample points for centroid calculation
         samples = 100
@@ -177,44 +503,215 @@ class FuzzySystem:
         
         return numerator / denominator
     
-    def calculate_tip(self, food_quality, service_quality):
-        """Main method to calculate tip percentage"""
-        print(f"Calculating tip for Food Quality: {food_quality}, Service Quality: {service_quality}")
-        print("=" * 60)
+    def defuzzify_sampled(self, output_memberships, output_variable="Tip", samples=100):
+        """Sampled bisector / mean-of-maximum, used for shapes without a closed form"""
+        tip_var = self.variables[output_variable]
+        step = (tip_var.max_val - tip_var.min_val) / samples
+        points = []
+        for i in range(samples + 1):
+            x = tip_var.min_val + i * step
+            max_membership = 0.0
+            for set_name, membership_strength in output_memberships.items():
+                if membership_strength > 0:
+                    set_membership = tip_var.sets[set_name].membership(x)
+                    max_membership = max(max_membership, min(set_membership, membership_strength))
+            points.append((x, max_membership))
         
-        # Step 1: Fuzzification
-        print("Step 1: Fuzzification")
-        input_memberships = self.fuzzify_inputs(food_quality, service_quality)
+        total = sum(mu for _, mu in points)
+        if total == 0:
+            return 0.0
+        if self.defuzzification == "mom":
+            height = max(mu for _, mu in points)
+            maxima = [x for x, mu in points if mu == height]
+            return sum(maxima) / len(maxima)
+        if self.defuzzification == "bisector":
+            cumulative = 0.0
+            for x, mu in points:
+                cumulative += mu
+                if cumulative >= total / 2:
+                    return x
+        return sum(x * mu for x, mu in points) / total
+    
+    def calculate_tips(self, food_qualities, service_qualities, chunk_size=65536):
+        """
+        Batch inference for many (food, service) pairs at once
+        Uses NumPy array operations when available (analytic / non-centroid
+        Mamdani systems are evaluated one pair at a time)
+        Returns a NumPy array of tips if NumPy is installed, a list otherwise
+        """
+        mamdani = self.inference == "mamdani"
+        if np is None or (mamdani and (self.analytic or self.defuzzification != "centroid")):
+            tips = [
+                self.infer({"Food Quality": food, "Service Quality": service})["Tip"]
+                for food, service in zip(food_qualities, service_qualities)
+            ]
+            return tips if np is None else np.array(tips, dtype=float)
         
-        for var_name, memberships in input_memberships.items():
-            print(f"{var_name}:")
-            for set_name, membership in memberships.items():
-                print(f"  {set_name}: {membership:.3f}")
+        food = np.asarray(food_qualities, dtype=float).ravel()
+        service = np.asarray(service_qualities, dtype=float).ravel()
+        tips = np.empty(len(food))
+        for lo in range(0, len(food), chunk_size):
+            hi = lo + chunk_size
+            tips[lo:hi] = self._calculate_tips_chunk(food[lo:hi], service[lo:hi])
+        return tips
+    
+    def _calculate_tips_chunk(self, food, service):
+        """Fuzzify, evaluate rules and defuzzify one chunk of inputs as arrays"""
+        # Step 1: Fuzzification -> {variable: {set: array}}
+        input_memberships = {}
+        for var_name, values in (("Food Quality", food), ("Service Quality", service)):
+            variable = self.variables[var_name]
+            input_memberships[var_name] = {
+                set_name: fuzzy_set.membership_array(values)
+                for set_name, fuzzy_set in variable.sets.items()
+            }
         
-        # Step 2: Rule Evaluation
-        print("\nStep 2: Rule Evaluation")
-        output_memberships = self.apply_rules(input_memberships)
+        # Step 2: Rule evaluation (min for AND, max for OR), aggregated with max
+        tip_var = self.variables["Tip"]
+        output_memberships = {set_name: np.zeros(len(food)) for set_name in tip_var.sets}
+        inputs = {"Food Quality": food, "Service Quality": service}
+        numerator = np.zeros(len(food))
+        denominator = np.zeros(len(food))
+        for rule in self.rules:
+            if rule.consequent[0] != "Tip":
+                continue
+            strengths = []
+            for var_name, set_name in rule.antecedents:
+                strengths.append(input_memberships.get(var_name, {}).get(set_name, np.zeros(len(food))))
+            if rule.operator == 'AND':
+                strength = np.minimum.reduce(strengths)
+            elif rule.operator == 'OR':
+                strength = np.maximum.reduce(strengths)
+            else:
+                strength = np.zeros(len(food))
+            output_set = rule.consequent[1]
+            if self.inference == "sugeno":
+                numerator += strength * tip_var.functions[output_set].evaluate(inputs)
+                denominator += strength
+            else:
+                np.maximum(output_memberships[output_set], strength, out=output_memberships[output_set])
         
-        for i, rule in enumerate(self.rules, 1):
-            rule_strength = rule.evaluate(input_memberships)
-            print(f"Rule {i}: {rule_strength:.3f}")
+        if self.inference == "sugeno":
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(denominator == 0, 0.0, numerator / denominator)
         
-        print(f"\nOutput memberships:")
-        for set_name, membership in output_memberships.items():
-            print(f"  {set_name}: {membership:.3f}")
+        # Step 3: Centroid defuzzification on the same 101 sample points as defuzzify()
+        samples = 100
+        step = (tip_var.max_val - tip_var.min_val) / samples
+        xs = np.array([tip_var.min_val + i * step for i in range(samples + 1)])
+        aggregated = np.zeros((len(food), len(xs)))
+        for set_name, strength in output_memberships.items():
+            set_membership = tip_var.sets[set_name].membership_array(xs)
+            np.maximum(aggregated, np.minimum(set_membership[None, :], strength[:, None]), out=aggregated)
         
-        # Step 3: Defuzzification
-        print("\nStep 3: Defuzzification")
-        tip_percentage = self.defuzzify(output_memberships)
-        print(f"Final tip percentage: {tip_percentage:.2f}%")
+        numerator = aggregated @ xs
+        denominator = aggregated.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator == 0, 0.0, numerator / denominator)
+    
+    def compile_surface(self, resolution=101, validate=True):
+        """Tabulate the tip surface once for fast interpolated lookups (see fuzzy_surface.py)"""
+        return TipSurface.compile(self, resolution, validate)
+    
+    def calculate_tip(self, food_quality, service_quality):
+        """
+        Main method to calculate tip percentage
+        Silent by default; attach a TraceListener (e.g. ConsoleTracer) to see each step
+        """
+        inputs = {"Food Quality": food_quality, "Service Quality": service_quality}
+        if not self.listeners:
+            input_memberships = self.fuzzify_inputs(food_quality, service_quality)
+            if self.inference == "sugeno":
+                return self.sugeno_output(input_memberships, inputs)
+            return self.defuzzify(self.apply_rules(input_memberships))
+        
+        listeners = self.listeners
+        for listener in listeners:
+            listener.on_start(inputs)
+        
+        # Step 1: Fuzzification
+        input_memberships = self.fuzzify_inputs(food_quality, service_quality)
+        for listener in listeners:
+            listener.on_fuzzify(input_memberships)
+        
+        # Step 2: Rule Evaluation (each rule is evaluated once)
+        # strengths only cover the Tip rules, in the order of this list
+        rules = [rule for rule in self.rules if rule.consequent[0] == "Tip"]
+        strengths = []
+        if self.inference == "sugeno":
+            tip_percentage = self.sugeno_output(input_memberships, inputs, strengths=strengths)
+            output_memberships = {}
+            for rule, rule_strength in zip(rules, strengths):
+                name = rule.consequent[1]
+                output_memberships[name] = max(output_memberships.get(name, 0.0), rule_strength)
+        else:
+            output_memberships = self.apply_rules(input_memberships, strengths)
+        for listener in listeners:
+            listener.on_rules(rules, strengths)
+            listener.on_output(output_memberships)
+        
+        # Step 3: Defuzzification (Sugeno output is already crisp)
+        if self.inference == "mamdani":
+            tip_percentage = self.defuzzify(output_memberships)
+        for listener in listeners:
+            listener.on_result(tip_percentage)
         
         return tip_percentage
 
 
+class FuzzySystemBuilder:
+    """
+    Builds a general FuzzySystem, for example:
+        builder = FuzzySystemBuilder()
+        builder.variable("Food", 0, 10, Bad=(0, 0, 5), Good=(5, 10, 10))
+        builder.variable("Tip", 0, 20, Low=(0, 0, 10), High=(10, 20, 20))
+        builder.rule([("Food", "Bad")], ("Tip", "Low"))
+        system = builder.build()
+    """
+    def __init__(self):
+        self.variables = []
+        self.rules = []
+    
+    def variable(self, name, min_val, max_val, **sets):
+        """Add a variable with triangular sets given as set_name=(a, b, c)"""
+        variable = FuzzyVariable(name, min_val, max_val)
+        for set_name, (a, b, c) in sets.items():
+            variable.add_set(set_name, a, b, c)
+        self.variables.append(variable)
+        return self
+    
+    def output_functions(self, name, min_val, max_val, **functions):
+        """
+        Add a Sugeno output variable; each function is given as a constant
+        or as (constant, {input_variable_name: coefficient})
+        """
+        variable = FuzzyVariable(name, min_val, max_val)
+        for function_name, spec in functions.items():
+            if isinstance(spec, tuple):
+                variable.add_function(function_name, spec[0], spec[1])
+            else:
+                variable.add_function(function_name, spec)
+        self.variables.append(variable)
+        return self
+    
+    def rule(self, antecedents, consequent, operator='AND'):
+        self.rules.append(FuzzyRule(antecedents, consequent, operator))
+        return self
+    
+    def build(self, defuzzification="centroid", analytic=False, inference="mamdani"):
+        system = FuzzySystem(defuzzification, analytic, tip_system=False, inference=inference)
+        for variable in self.variables:
+            system.add_variable(variable)
+        for rule in self.rules:
+            system.add_rule(rule)
+        return system
+
+
 # Test the system
 if __name__ == "__main__":
-    # Create fuzzy system
+    # Create fuzzy system and print every inference step
     fuzzy_system = FuzzySystem()
+    fuzzy_system.add_listener(ConsoleTracer())
     
     # Test case from the problem
     food_quality = 7
@@ -243,4 +740,21 @@ if __name__ == "__main__":
     
     for food, service in test_cases:
         tip = fuzzy_system.calculate_tip(food, service)
-        print(f"\nFood Quality: {food}, Service Quality: {service} -> Tip: {tip:.2f}%")
\ No newline at end of file
+        print(f"\nFood Quality: {food}, Service Quality: {service} -> Tip: {tip:.2f}%")
+    
+    # Batch inference for many inputs at once
+    print("\n" + "=" * 60)
+    print("Batch Inference:")
+    foods = [food for food, _ in test_cases]
+    services = [service for _, service in test_cases]
+    tips = fuzzy_system.calculate_tips(foods, services)
+    for food, service, tip in zip(foods, services, tips):
+        print(f"Food Quality: {food}, Service Quality: {service} -> Tip: {tip:.2f}%")
+    
+    # Exact defuzzification for the triangular output sets
+    print("\n" + "=" * 60)
+    print("Analytic Defuzzification (Food Quality = 7, Service Quality = 3):")
+    for method in FuzzySystem.DEFUZZIFICATION_METHODS:
+        exact_system = FuzzySystem(defuzzification=method, analytic=True)
+        output_memberships = exact_system.apply_rules(exact_system.fuzzify_inputs(7, 3))
+        print(f"  {method}: {exact_system.defuzzify(output_memberships):.4f}%")
\ No newline at end of file
@@ -0,0 +1,304 @@
+"""
+Grid Pathfinding with A* and Jump Point Search (JPS)
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Mesin pencarian khusus grid (occupancy map). Grid disimpan sebagai bytearray
+datar, tetangga dibangkitkan secara implisit (4 atau 8 arah) dan heuristik
+dihitung langsung dari koordinat, sehingga tidak perlu membuat dict node
+seperti contoh grid di astar.py. Untuk grid dengan biaya seragam tersedia
+Jump Point Search yang melompati node-node simetris.
+
+Koordinat yang dipakai adalah (row, col).
+"""
+
+import heapq
+import math
+from array import array
+from search_result import SearchResult, path_parents
+
+SQRT2 = math.sqrt(2)
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+def grid_distance(a, b, diagonal):
+    """Manhattan (4-directional) or octile (8-directional) distance between cells"""
+    dr = abs(a[0] - b[0])
+    dc = abs(a[1] - b[1])
+    if diagonal:
+        return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+    return dr + dc
+
+
+class GridGraph:
+    def __init__(self, grid, costs=None, diagonal=False):
+        """
+        grid: 2-D array (NumPy array or list of lists), truthy cells are blocked
+        costs: optional 2-D array with the cost of entering each cell
+        diagonal: allow 8-directional movement (no corner cutting)
+        """
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows else 0
+        self.diagonal = diagonal
+
+        if hasattr(grid, 'astype') and hasattr(grid, 'tobytes'):
+            self.blocked = bytearray(grid.astype(bool).tobytes())
+        else:
+            self.blocked = bytearray(1 if cell else 0 for row in grid for cell in row)
+
+        self.costs = None
+        self.min_cost = 1
+        if costs is not None:
+            self.costs = array('d', (float(cell) for row in costs for cell in row))
+            free_costs = [cost for i, cost in enumerate(self.costs) if not self.blocked[i]]
+            self.min_cost = min(free_costs) if free_costs else 1
+
+    @classmethod
+    def from_costs(cls, costs, diagonal=False):
+        """Build a grid from a cost array; cells with cost <= 0 or inf are blocked"""
+        blocked = [[not (0 < cell < float('inf')) for cell in row] for row in costs]
+        return cls(blocked, costs, diagonal)
+
+    def is_free(self, r, c):
+        return 0 <= r < self.rows and 0 <= c < self.cols and not self.blocked[r * self.cols + c]
+
+    def neighbors(self, r, c):
+        """Yield (row, col, step_cost) of the cells reachable from (r, c)"""
+        is_free = self.is_free
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            if is_free(r + dr, c + dc):
+                yield r + dr, c + dc, self.step_cost(r + dr, c + dc, 1)
+        if self.diagonal:
+            for dr, dc in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                # No corner cutting: both orthogonal cells must be free
+                if is_free(r + dr, c + dc) and is_free(r + dr, c) and is_free(r, c + dc):
+                    yield r + dr, c + dc, self.step_cost(r + dr, c + dc, SQRT2)
+
+    def step_cost(self, r, c, distance):
+        if self.costs is None:
+            return distance
+        return self.costs[r * self.cols + c] * distance
+
+    def heuristic(self, a, b):
+        """Grid distance scaled by the cheapest cell cost (admissible)"""
+        return grid_distance(a, b, self.diagonal) * self.min_cost
+
+    def astar(self, start, goal, jump_points=False):
+        """
+        A* on the grid, optionally with Jump Point Search (uniform cost grids only)
+        start, goal: (row, col) tuples
+        Returns SearchResult whose path is a list of (row, col), None if not found
+        """
+        if jump_points and self.costs is not None:
+            raise ValueError("Jump Point Search requires a uniform-cost grid")
+        if not self.is_free(*start) or not self.is_free(*goal):
+            return None
+
+        successors = self._jump_successors if jump_points else self._successors
+        # Priority queue: (f_cost, g_cost, cell)
+        pq = [(self.heuristic(start, goal), 0, start)]
+        g_costs = {start: 0}
+        came_from = {}
+        closed = set()
+
+        while pq:
+            (f_cost, g_cost, cell) = heapq.heappop(pq)
+
+            if cell in closed:
+                continue
+            closed.add(cell)
+
+            if cell == goal:
+                path = self._expand_path(came_from, goal) if jump_points else None
+                result = SearchResult(goal, g_cost, path_parents(came_from, goal), len(closed))
+                if path is not None:
+                    result._path = path
+                return result
+
+            for neighbor, edge_cost in successors(cell, came_from.get(cell), goal):
+                if neighbor in closed:
+                    continue
+                new_g_cost = g_cost + edge_cost
+                if new_g_cost < g_costs.get(neighbor, float('inf')):
+                    g_costs[neighbor] = new_g_cost
+                    came_from[neighbor] = cell
+                    heapq.heappush(pq, (new_g_cost + self.heuristic(neighbor, goal), new_g_cost, neighbor))
+
+        return None
+
+    def _successors(self, cell, parent, goal):
+        for r, c, cost in self.neighbors(*cell):
+            yield (r, c), cost
+
+    def _expand_path(self, came_from, goal):
+        """Fill in the cells between consecutive jump points"""
+        jump_path = [goal]
+        while jump_path[-1] in came_from:
+            jump_path.append(came_from[jump_path[-1]])
+        jump_path.reverse()
+
+        path = [jump_path[0]]
+        for (r1, c1) in jump_path[1:]:
+            r, c = path[-1]
+            dr, dc = _sign(r1 - r), _sign(c1 - c)
+            while (r, c) != (r1, c1):
+                r, c = r + dr, c + dc
+                path.append((r, c))
+        return path
+
+    # ---------------- Jump Point Search ----------------
+
+    def _jump_successors(self, cell, parent, goal):
+        r, c = cell
+        for nr, nc in self._pruned_neighbors(r, c, parent):
+            jump_point = self._jump(nr, nc, nr - r, nc - c, goal)
+            if jump_point is not None:
+                yield jump_point, grid_distance(cell, jump_point, self.diagonal)
+
+    def _pruned_neighbors(self, r, c, parent):
+        """Natural and forced neighbors given the direction we arrived from"""
+        is_free = self.is_free
+        if parent is None:
+            return [(nr, nc) for nr, nc, _ in self.neighbors(r, c)]
+
+        dr = _sign(r - parent[0])
+        dc = _sign(c - parent[1])
+        result = []
+        if not self.diagonal:
+            if dc:
+                candidates = ((r - 1, c), (r + 1, c), (r, c + dc))
+            else:
+                candidates = ((r, c - 1), (r, c + 1), (r + dr, c))
+            return [cell for cell in candidates if is_free(*cell)]
+
+        if dr and dc:
+            vertical = is_free(r + dr, c)
+            horizontal = is_free(r, c + dc)
+            if vertical:
+                result.append((r + dr, c))
+            if horizontal:
+                result.append((r, c + dc))
+            if vertical and horizontal:
+                result.append((r + dr, c + dc))
+        elif dc:
+            ahead = is_free(r, c + dc)
+            down = is_free(r + 1, c)
+            up = is_free(r - 1, c)
+            if ahead:
+                result.append((r, c + dc))
+                if down:
+                    result.append((r + 1, c + dc))
+                if up:
+                    result.append((r - 1, c + dc))
+            if down:
+                result.append((r + 1, c))
+            if up:
+                result.append((r - 1, c))
+        else:
+            ahead = is_free(r + dr, c)
+            left = is_free(r, c - 1)
+            right = is_free(r, c + 1)
+            if ahead:
+                result.append((r + dr, c))
+                if left:
+                    result.append((r + dr, c - 1))
+                if right:
+                    result.append((r + dr, c + 1))
+            if left:
+                result.append((r, c - 1))
+            if right:
+                result.append((r, c + 1))
+        return result
+
+    def _jump(self, r, c, dr, dc, goal):
+        """Follow direction (dr, dc) from (r, c) until a jump point, iteratively"""
+        if not self.diagonal:
+            return self._jump_orthogonal(r, c, dr, dc, goal)
+        if dr and dc:
+            return self._jump_diagonal(r, c, dr, dc, goal)
+        return self._jump_straight(r, c, dr, dc, goal)
+
+    def _jump_straight(self, r, c, dr, dc, goal):
+        """Straight jump for 8-directional grids"""
+        is_free = self.is_free
+        while True:
+            if not is_free(r, c):
+                return None
+            if (r, c) == goal:
+                return (r, c)
+            if dc:
+                if (is_free(r - 1, c) and not is_free(r - 1, c - dc)) or \
+                        (is_free(r + 1, c) and not is_free(r + 1, c - dc)):
+                    return (r, c)
+            else:
+                if (is_free(r, c - 1) and not is_free(r - dr, c - 1)) or \
+                        (is_free(r, c + 1) and not is_free(r - dr, c + 1)):
+                    return (r, c)
+            r += dr
+            c += dc
+
+    def _jump_diagonal(self, r, c, dr, dc, goal):
+        """Diagonal jump for 8-directional grids"""
+        is_free = self.is_free
+        while True:
+            if not is_free(r, c):
+                return None
+            if (r, c) == goal:
+                return (r, c)
+            if self._jump_straight(r, c + dc, 0, dc, goal) is not None or \
+                    self._jump_straight(r + dr, c, dr, 0, goal) is not None:
+                return (r, c)
+            # Moving on diagonally requires both orthogonal cells to be free
+            if not (is_free(r, c + dc) and is_free(r + dr, c)):
+                return None
+            r += dr
+            c += dc
+
+    def _jump_orthogonal(self, r, c, dr, dc, goal):
+        """Jump for 4-directional grids"""
+        is_free = self.is_free
+        while True:
+            if not is_free(r, c):
+                return None
+            if (r, c) == goal:
+                return (r, c)
+            if dc:
+                if (is_free(r - 1, c) and not is_free(r - 1, c - dc)) or \
+                        (is_free(r + 1, c) and not is_free(r + 1, c - dc)):
+                    return (r, c)
+            else:
+                if (is_free(r, c - 1) and not is_free(r - dr, c - 1)) or \
+                        (is_free(r, c + 1) and not is_free(r - dr, c + 1)):
+                    return (r, c)
+                # Moving vertically, stop where a horizontal jump finds something
+                if self._jump_orthogonal(r, c + 1, 0, 1, goal) is not None or \
+                        self._jump_orthogonal(r, c - 1, 0, -1, goal) is not None:
+                    return (r, c)
+            r += dr
+            c += dc
+
+
+# Example usage and test
+if __name__ == "__main__":
+    occupancy = [
+        [0, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 0],
+        [0, 0, 0, 0, 0, 1, 0],
+        [1, 1, 1, 1, 0, 1, 0],
+        [0, 0, 0, 0, 0, 0, 0],
+    ]
+    start, goal = (0, 0), (4, 0)
+
+    print("Grid A* / Jump Point Search Test")
+    print("=" * 50)
+    for diagonal in (False, True):
+        grid = GridGraph(occupancy, diagonal=diagonal)
+        label = "8-directional" if diagonal else "4-directional"
+        for jump_points in (False, True):
+            result = grid.astar(start, goal, jump_points=jump_points)
+            name = "JPS" if jump_points else "A*"
+            print(f"{label} {name}: cost = {result.cost:.3f}, expanded = {result.expanded}")
+        print(f"  Path: {result.path}")
@@ -0,0 +1,211 @@
+"""
+Incremental Replanning (LPA*)
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Lifelong Planning A* menyimpan g (cost terbaik yang sudah diketahui) dan rhs
+(cost satu langkah dari predecessor) untuk setiap node. Setelah bobot edge
+berubah, hanya node yang nilai g dan rhs-nya tidak lagi sama yang masuk ke
+priority queue, sehingga replanning cukup mengekspansi node yang terdampak
+perubahan, bukan mengulang seluruh A*.
+
+Start dan goal tetap; bobot edge harus positif (siklus ber-cost 0 dapat
+mempertahankan nilai g yang sudah usang) dan heuristik harus tetap
+konsisten setelah perubahan (misalnya tabel heuristik yang tidak pernah
+melebihi jarak sebenarnya).
+"""
+
+import heapq
+import itertools
+from collections import deque
+from search_result import SearchResult
+
+INF = float('inf')
+
+
+class LPAStarPlanner:
+    def __init__(self, graph, start, goal, heuristic=None):
+        """
+        graph: AStarGraph or WeightedGraph with a dict adjacency; change edges
+               through the planner, or call edge_changed after changing them
+        heuristic: h(node) estimating the cost to goal
+                   (default: the graph's heuristics table, 0 if it has none)
+        """
+        if heuristic is None:
+            table = getattr(graph, "heuristics", None) or {}
+            heuristic = lambda node: table.get(node, 0)
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.reverse_graph = graph.get_reverse_graph()  # kept in sync by the graph's edge methods
+        self.g = {}
+        self.rhs = {start: 0}
+        self.queue = []    # heap of (k1, k2, seq, node), entries not in queued are stale
+        self.queued = {}   # node -> seq of its live heap entry
+        self.seq = itertools.count()
+        self.expanded = 0  # expansions of the last plan()
+        self._push(start)
+
+    def _key(self, node):
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + self.heuristic(node), best)
+
+    def _push(self, node):
+        seq = next(self.seq)
+        self.queued[node] = seq
+        heapq.heappush(self.queue, self._key(node) + (seq, node))
+
+    def _update_node(self, node):
+        """Recompute rhs(node) from its predecessors and (re)queue node if it is inconsistent"""
+        if node != self.start:
+            best = INF
+            for predecessor, cost in self.reverse_graph.get(node, ()):
+                candidate = self.g.get(predecessor, INF) + cost
+                if candidate < best:
+                    best = candidate
+            self.rhs[node] = best
+        self.queued.pop(node, None)
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self._push(node)
+
+    def _top(self):
+        """(key, node) of the smallest live queue entry, ((inf, inf), None) if empty"""
+        queue = self.queue
+        while queue:
+            k1, k2, seq, node = queue[0]
+            if self.queued.get(node) == seq:
+                return (k1, k2), node
+            heapq.heappop(queue)
+        return (INF, INF), None
+
+    def plan(self):
+        """
+        Bring g up to date after the changes since the last call
+        Returns SearchResult (expanded counts this call only), None if goal is unreachable
+        """
+        g, rhs, goal = self.g, self.rhs, self.goal
+        graph = self.graph.graph
+        expanded = 0
+
+        while True:
+            top_key, node = self._top()
+            if node is None or not (top_key < self._key(goal) or rhs.get(goal, INF) != g.get(goal, INF)):
+                break
+            heapq.heappop(self.queue)
+            del self.queued[node]
+            expanded += 1
+
+            if g.get(node, INF) > rhs.get(node, INF):
+                # Overconsistent: g drops to rhs, successors may get cheaper
+                g[node] = cost = rhs[node]
+                for successor, edge_cost in graph.get(node, ()):
+                    if successor != self.start and cost + edge_cost < rhs.get(successor, INF):
+                        rhs[successor] = cost + edge_cost
+                        self.queued.pop(successor, None)
+                        if g.get(successor, INF) != rhs[successor]:
+                            self._push(successor)
+            else:
+                # Underconsistent: forget g and recompute everything that relied on it
+                del g[node]
+                self._update_node(node)
+                for successor, _ in graph.get(node, ()):
+                    self._update_node(successor)
+
+        self.expanded = expanded
+        return self.result()
+
+    def result(self):
+        """SearchResult for the current g values, None if goal is unreachable"""
+        g = self.g
+        if g.get(self.goal, INF) == INF:
+            return None
+        # Walk back from goal over edges that are tight (g(p) + c == g(node)) until start
+        next_hop = {}
+        frontier = deque([self.goal])
+        while frontier:
+            node = frontier.popleft()
+            if node == self.start:
+                break
+            for predecessor, cost in self.reverse_graph.get(node, ()):
+                if predecessor not in next_hop and predecessor != self.goal \
+                        and g.get(predecessor, INF) + cost == g[node]:
+                    next_hop[predecessor] = node
+                    frontier.append(predecessor)
+
+        parents = {}
+        node = self.start
+        while node != self.goal:
+            parents[next_hop[node]] = node
+            node = next_hop[node]
+        return SearchResult(self.goal, g[self.goal], parents, self.expanded)
+
+    def edge_changed(self, u, v):
+        """Report that the edge u -> v was added, reweighted or removed in the graph"""
+        self._update_node(v)
+
+    def add_edge(self, u, v, weight):
+        self.graph.add_edge(u, v, weight)
+        self.edge_changed(u, v)
+
+    def update_edge(self, u, v, weight):
+        self.graph.update_edge(u, v, weight)
+        self.edge_changed(u, v)
+
+    def remove_edge(self, u, v):
+        self.graph.remove_edge(u, v)
+        self.edge_changed(u, v)
+
+
+# Example usage and test
+if __name__ == "__main__":
+    import random
+    from astar import AStarGraph
+    from graph_data import get_test_nodes
+    from ucs import WeightedGraph
+
+    start_node, goal_node = get_test_nodes()
+    ag = AStarGraph()
+    other = WeightedGraph().enable_tree_cache(build_after=1)
+    other.ucs(start_node, goal_node)
+    planner = ag.incremental_planner(start_node, goal_node)
+
+    print("Incremental Replanning (LPA*) Test")
+    print("=" * 50)
+    print(f"Initial plan: {planner.plan()}")
+    planner.update_edge('F', 'G', 10)
+    print(f"After F->G costs 10: {planner.plan()}")
+    print(f"Fresh A*: {ag.astar(start_node, goal_node)}")
+    planner.remove_edge('C', 'F')
+    print(f"After removing C->F: {planner.plan()}")
+    print(f"Fresh A*: {ag.astar(start_node, goal_node)}")
+    print(f"Other default-built graph (unchanged, cached tree): {other.ucs(start_node, goal_node)}")
+    print(f"New AStarGraph (unchanged): {AStarGraph().astar(start_node, goal_node)}")
+
+    # Congestion on a 100 x 100 grid with weights 1..9: random edges change weight,
+    # one of them on the current path
+    size = 100
+    rng = random.Random(0)
+    grid = {}
+    for x in range(size):
+        for y in range(size):
+            grid[(x, y)] = [((x + dx, y + dy), rng.randint(1, 9)) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                            if 0 <= x + dx < size and 0 <= y + dy < size]
+    grid_graph = AStarGraph(grid)
+    grid_graph.heuristics = {(x, y): (size - 1 - x) + (size - 1 - y) for (x, y) in grid}
+    planner = grid_graph.incremental_planner((0, 0), (size - 1, size - 1))
+    result = planner.plan()
+    print(f"\nGrid {size}x{size}: cost {result.cost}, initial expansions {planner.expanded}")
+
+    for step in range(3):
+        path = result.path
+        i = rng.randrange(len(path) - 1)
+        planner.update_edge(path[i], path[i + 1], rng.randint(10, 20))
+        for _ in range(5):
+            node = rng.choice(list(grid))
+            neighbor, _ = rng.choice(grid[node])
+            planner.update_edge(node, neighbor, rng.randint(1, 9))
+        result = planner.plan()
+        fresh = grid_graph.astar((0, 0), (size - 1, size - 1))
+        print(f"Update {step + 1}: cost {result.cost} (A*: {fresh.cost}), "
+              f"replan expansions {planner.expanded} vs A* {fresh.expanded}")
@@ -0,0 +1,125 @@
+"""
+Landmark (ALT) Heuristics for A*
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Beberapa node dipilih sebagai landmark L, lalu jarak dari dan ke setiap
+landmark dihitung sekali dengan UCS. Dengan ketidaksamaan segitiga:
+
+    d(u, v) >= d(L, v) - d(L, u)
+    d(u, v) >= d(u, L) - d(v, L)
+
+sehingga diperoleh heuristik yang admissible dan konsisten untuk pasangan
+(node, goal) mana pun, tidak hanya untuk goal di HEURISTICS_DATA.
+"""
+
+import heapq
+from array import array
+
+INF = float('inf')
+
+
+def shortest_distances(graph, source, node_index):
+    """
+    One-to-all UCS from source
+    Returns array of distances aligned with node_index (inf if unreachable)
+    """
+    dist = array('d', [INF]) * len(node_index)
+    dist[node_index[source]] = 0
+    pq = [(0, source)]
+
+    while pq:
+        (cost, node) = heapq.heappop(pq)
+        if cost > dist[node_index[node]]:
+            continue
+        if node in graph:
+            for neighbor, edge_cost in graph[node]:
+                new_cost = cost + edge_cost
+                idx = node_index[neighbor]
+                if new_cost < dist[idx]:
+                    dist[idx] = new_cost
+                    heapq.heappush(pq, (new_cost, neighbor))
+    return dist
+
+
+def _difference(a, b):
+    """a - b where inf - finite means unreachable and anything else with inf gives no bound"""
+    if a == INF:
+        return INF if b != INF else 0
+    if b == INF:
+        return 0
+    return a - b
+
+
+class LandmarkHeuristic:
+    def __init__(self, graph, reverse_graph, num_landmarks=4, landmarks=None):
+        """
+        graph / reverse_graph: forward and reverse adjacency ({node: [(neighbor, weight)]})
+        num_landmarks: how many landmarks to pick (ignored if landmarks is given)
+        landmarks: explicit list of landmark nodes
+        """
+        nodes = list(graph)
+        for node in reverse_graph:
+            if node not in graph:
+                nodes.append(node)
+        self.node_index = {node: i for i, node in enumerate(nodes)}
+        self.graph = graph
+        self.reverse_graph = reverse_graph
+        self.landmarks = []
+        self.from_landmark = []  # d(L, node)
+        self.to_landmark = []    # d(node, L)
+
+        if landmarks is None:
+            landmarks = self.select_landmarks(nodes, num_landmarks)
+        else:
+            for landmark in landmarks:
+                self.add_landmark(landmark)
+
+    def add_landmark(self, landmark):
+        """Precompute distances from and to a landmark"""
+        self.landmarks.append(landmark)
+        self.from_landmark.append(shortest_distances(self.graph, landmark, self.node_index))
+        self.to_landmark.append(shortest_distances(self.reverse_graph, landmark, self.node_index))
+
+    def select_landmarks(self, nodes, num_landmarks):
+        """Farthest selection: each new landmark is the node farthest from the chosen ones"""
+        if not nodes:
+            return self.landmarks
+        self.add_landmark(nodes[0])
+        while len(self.landmarks) < min(num_landmarks, len(nodes)):
+            best_node, best_score = None, -1
+            for node, idx in self.node_index.items():
+                if node in self.landmarks:
+                    continue
+                score = min(
+                    min(dist_from[idx], dist_to[idx])
+                    for dist_from, dist_to in zip(self.from_landmark, self.to_landmark)
+                )
+                if score > best_score:
+                    best_node, best_score = node, score
+            if best_node is None:
+                break
+            self.add_landmark(best_node)
+        return self.landmarks
+
+    def lower_bound(self, u, v):
+        """Admissible lower bound of the shortest distance from u to v"""
+        iu = self.node_index.get(u)
+        iv = self.node_index.get(v)
+        if iu is None or iv is None:
+            return 0
+        best = 0
+        for dist_from, dist_to in zip(self.from_landmark, self.to_landmark):
+            bound = max(_difference(dist_from[iv], dist_from[iu]),
+                        _difference(dist_to[iu], dist_to[iv]))
+            if bound > best:
+                best = bound
+        return best
+
+    def heuristic_to(self, goal):
+        """Heuristic function h(node) estimating the cost from node to goal"""
+        return lambda node: self.lower_bound(node, goal)
+
+    def heuristic_from(self, start):
+        """Heuristic function h(node) estimating the cost from start to node"""
+        return lambda node: self.lower_bound(start, node)
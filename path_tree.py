@@ -0,0 +1,127 @@
+"""
+Shortest-Path Trees and Tree Cache
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Satu UCS tanpa goal dari sebuah start menghasilkan pohon jalur terpendek:
+jarak dan parent untuk semua node yang tercapai (atau semua node dalam
+radius tertentu). Query berikutnya dari start yang sama cukup membaca
+pohon tersebut. TreeCache menyimpan pohon-pohon ini per start dengan
+kebijakan LRU dan batas memori.
+"""
+
+import sys
+from collections import OrderedDict
+from search_result import SearchResult, path_parents
+
+# Rough extra bytes per settled node besides the two dict slots (the cost object)
+_ENTRY_BYTES = 32
+
+
+class ShortestPathTree:
+    def __init__(self, source, distances, parents, radius=None, complete=True):
+        """
+        source: start node of the tree
+        distances: {node: cost from source} for every settled node
+        parents: predecessor map {node: parent}, source has no entry
+        radius: only nodes within this cost were settled (None: no limit)
+        complete: False if the search stopped early (targets found), so a
+                  missing node may still be reachable
+        """
+        self.source = source
+        self.distances = distances
+        self.parents = parents
+        self.radius = radius
+        self.complete = complete
+
+    def __contains__(self, node):
+        return node in self.distances
+
+    def __len__(self):
+        return len(self.distances)
+
+    def covers(self, node):
+        """True if the tree answers a query for node (reached, or known to be out of reach)"""
+        return node in self.distances or (self.complete and self.radius is None)
+
+    def distance(self, node):
+        """Cost from source to node, None if not in the tree"""
+        return self.distances.get(node)
+
+    def result(self, goal):
+        """
+        SearchResult for source -> goal, None if goal is not in the tree
+        Only the parent pointers on the path are copied so the result does not keep the tree alive
+        """
+        if goal not in self.distances:
+            return None
+        return SearchResult(goal, self.distances[goal], path_parents(self.parents, goal), len(self.distances))
+
+    def nbytes(self):
+        """Approximate memory used by the tree"""
+        return (sys.getsizeof(self.distances) + sys.getsizeof(self.parents)
+                + _ENTRY_BYTES * len(self.distances))
+
+
+class TreeCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, build_after=2):
+        """
+        LRU cache of ShortestPathTree keyed by source
+        max_bytes: least recently used trees are evicted above this estimate
+        build_after: a source gets a tree on its build_after-th query
+        (1 builds on the first query; 2 skips sources that are queried once)
+        """
+        self.max_bytes = max_bytes
+        self.build_after = build_after
+        self.trees = OrderedDict()
+        self.sizes = {}
+        self.nbytes = 0
+        self.misses = OrderedDict()  # source -> queries seen without a tree
+
+    def __len__(self):
+        return len(self.trees)
+
+    def __contains__(self, source):
+        return source in self.trees
+
+    def get(self, source):
+        """Cached tree for source (marked as recently used), None if absent"""
+        tree = self.trees.get(source)
+        if tree is not None:
+            self.trees.move_to_end(source)
+        return tree
+
+    def is_hot(self, source):
+        """Count a query from source without a tree, True once it deserves one"""
+        count = self.misses.pop(source, 0) + 1
+        if count >= self.build_after:
+            return True
+        self.misses[source] = count
+        # Keep the miss counters bounded by dropping the oldest ones
+        while len(self.misses) > 4 * max(len(self.trees), 1024):
+            self.misses.popitem(last=False)
+        return False
+
+    def put(self, tree):
+        """Store tree, evicting least recently used trees to stay within max_bytes"""
+        self.discard(tree.source)
+        size = tree.nbytes()
+        if size > self.max_bytes:
+            return
+        self.trees[tree.source] = tree
+        self.sizes[tree.source] = size
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            source, _ = self.trees.popitem(last=False)
+            self.nbytes -= self.sizes.pop(source)
+
+    def discard(self, source):
+        if self.trees.pop(source, None) is not None:
+            self.nbytes -= self.sizes.pop(source)
+
+    def clear(self):
+        """Drop every tree (the graph changed)"""
+        self.trees.clear()
+        self.sizes.clear()
+        self.misses.clear()
+        self.nbytes = 0
@@ -0,0 +1,198 @@
+"""
+Async Shortest-Path Query Server
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Server lokal berbasis asyncio dengan protokol JSON per baris di atas TCP.
+Graf dimuat sekali, search dijalankan di process pool (BatchQueryExecutor)
+sehingga event loop tidak pernah terblokir. Request identik yang sedang
+diproses digabung menjadi satu search, dan jawaban disimpan di cache LRU.
+
+Contoh:
+    python query_server.py roads.csrg --port 8765 --workers 8
+
+    $ echo '{"id": 1, "start": "A", "goal": "I", "algorithm": "astar"}' | nc localhost 8765
+    {"path": ["A", "C", "F", "G", "I"], "cost": 7, "expanded": 5, "id": 1}
+
+Request: {"id": opsional, "start": node, "goal": node, "algorithm": "ucs" | "astar"}
+atau {"op": "stats"} untuk statistik cache dan coalescing.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from astar import AStarGraph
+from batch_query import BatchQueryExecutor
+from csr_graph import load_graph
+
+
+def _answer(result):
+    """JSON-ready payload for a SearchResult (or None)"""
+    if result is None:
+        return {"path": None, "cost": None, "expanded": 0}
+    return {"path": result.path, "cost": result.cost, "expanded": result.expanded}
+
+
+class QueryServer:
+    ALGORITHMS = BatchQueryExecutor.METHODS
+
+    def __init__(self, graph=None, workers=None, heuristics=None, cache_size=100000,
+                 max_pending=None, max_pipeline=64):
+        """
+        graph: anything BatchQueryExecutor accepts (default: the AStarGraph demo data)
+        workers: search processes, 1 runs searches on a background thread
+        cache_size: answers kept in the LRU result cache (0 disables it)
+        max_pending: searches queued on the pool at once (default: 4 per worker),
+                     further requests wait here so queues stay short
+        max_pipeline: requests in progress per connection before reading more lines
+        """
+        if graph is None:
+            graph = AStarGraph()
+        self.executor = BatchQueryExecutor(graph, workers, heuristics)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (start, goal, algorithm) -> answer
+        self.in_flight = {}  # (start, goal, algorithm) -> task running the search
+        self.pending = asyncio.Semaphore(max_pending or 4 * self.executor.workers)
+        self.max_pipeline = max_pipeline
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "searches": 0, "errors": 0}
+
+    async def query(self, start, goal, algorithm="ucs"):
+        """
+        Answer one query: from the cache, by joining an identical search in
+        progress, or by running a new search on the pool
+        Returns {"path", "cost", "expanded"} (path None if goal is unreachable)
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        key = (start, goal, algorithm)
+        self.stats["requests"] += 1
+
+        answer = self.cache.get(key)
+        if answer is not None:
+            self.cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return answer
+
+        task = self.in_flight.get(key)
+        if task is None:
+            task = self.in_flight[key] = asyncio.ensure_future(self._search(key))
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.stats["coalesced"] += 1
+        # A client that disconnects must not cancel the search other clients wait for
+        return await asyncio.shield(task)
+
+    async def _search(self, key):
+        async with self.pending:
+            self.stats["searches"] += 1
+            result = await asyncio.wrap_future(self.executor.submit(*key))
+        answer = _answer(result)
+        if self.cache_size:
+            self.cache[key] = answer
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return answer
+
+    def _finished(self, key, task):
+        del self.in_flight[key]
+        # Retrieve the exception so it is not reported when every waiter went away
+        if not task.cancelled() and task.exception() is not None:
+            self.stats["errors"] += 1
+
+    async def _respond(self, line, writer, lock):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                response = dict(self.stats, cached=len(self.cache), in_flight=len(self.in_flight))
+            else:
+                response = await self.query(request["start"], request["goal"],
+                                            request.get("algorithm", "ucs"))
+        except Exception as error:
+            response = {"error": f"{type(error).__name__}: {error}"}
+        if request_id is not None:
+            response = dict(response, id=request_id)
+        async with lock:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+    async def handle_client(self, reader, writer):
+        """
+        One connection: every line is a request, answered as soon as it is done
+        (possibly out of order, match them by "id")
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                if len(tasks) >= self.max_pipeline:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(self._respond(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutdown: just close the connection
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host="127.0.0.1", port=8765):
+        """Start listening, returns the asyncio Server"""
+        return await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+    async def serve_forever(self, host="127.0.0.1", port=8765):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        """Stop the search workers"""
+        self.executor.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve shortest-path queries as line-delimited JSON over TCP")
+    parser.add_argument("graph", nargs="?", help="graph file from CSRGraph.save or an edge list (default: demo data)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-size", type=int, default=100000, help="answers kept in the result cache")
+    parser.add_argument("--max-pending", type=int, help="searches queued on the workers at once")
+    args = parser.parse_args(argv)
+
+    graph = load_graph(args.graph) if args.graph is not None else None
+
+    async def serve():
+        server = QueryServer(graph, args.workers, cache_size=args.cache_size, max_pending=args.max_pending)
+        try:
+            print(f"Listening on {args.host}:{args.port}")
+            await server.serve_forever(args.host, args.port)
+        finally:
+            server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
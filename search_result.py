@@ -0,0 +1,74 @@
+"""
+Search Result with Parent Pointers
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Algoritma search hanya menyimpan parent pointer (node -> node sebelumnya)
+selama pencarian. Path lengkap baru dibangun saat dibutuhkan dari parent
+pointer tersebut, sehingga memori tetap linear terhadap jumlah node.
+Hasil hanya menyimpan parent pointer di sepanjang path (untuk graf dict
+maupun CSRGraph); pohon jalur lengkap tersedia lewat shortest_path_tree.
+"""
+
+
+def reconstruct_path(came_from, current):
+    """Reconstruct path from a came_from (parent pointer) dictionary"""
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    return path[::-1]  # Reverse to get from start to goal
+
+
+def path_parents(parents, goal):
+    """The entries of a predecessor map along the path that ends at goal"""
+    chain = {}
+    node = goal
+    while node in parents:
+        chain[node] = parents[node]
+        node = parents[node]
+    return chain
+
+
+class SearchResult:
+    def __init__(self, goal, cost, parents, expanded=0):
+        """
+        goal: node where the search stopped
+        cost: total cost from start to goal
+        parents: predecessor map {node: parent} of the path, start has no entry;
+                 nodes off the path are not guaranteed to be present
+        expanded: number of nodes expanded during the search
+        """
+        self.goal = goal
+        self.cost = cost
+        self.parents = parents
+        self.expanded = expanded
+        self._path = None
+
+    @property
+    def path(self):
+        """Path from start to goal, built lazily from the parent pointers"""
+        if self._path is None:
+            self._path = reconstruct_path(self.parents, self.goal)
+        return self._path
+
+    # Behave like the old (path, cost) tuple so existing callers keep working
+    def __iter__(self):
+        yield self.path
+        yield self.cost
+
+    def __getitem__(self, index):
+        return (self.path, self.cost)[index]
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        if isinstance(other, SearchResult):
+            return self.path == other.path and self.cost == other.cost
+        if isinstance(other, tuple):
+            return (self.path, self.cost) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SearchResult(path={self.path}, cost={self.cost}, expanded={self.expanded})"
@@ -0,0 +1,201 @@
+"""
+Search Instrumentation
+Nama: Divanda Firdaus
+NIM: 32602500023
+
+Listener untuk WeightedGraph.ucs dan AStarGraph.astar. Tanpa listener,
+search berjalan di jalur cepat tanpa hook sama sekali. Dengan listener,
+search yang sama dijalankan oleh traced_search (loop heapq) atau, untuk
+frontier decrease-key UCS (lihat frontier.py), oleh loop frontier yang sama
+dengan hook aktif. Listener menerima setiap push, pop (termasuk entri
+duplikat yang dilewati), penurunan prioritas, ekspansi dan goal.
+SearchStats mengumpulkan statistik per query (node diekspansi, push/pop
+heap, stale pop, penurunan prioritas, ukuran frontier maksimum, waktu) dan
+total per algoritma yang dapat diekspor sebagai dict/JSON atau format teks
+Prometheus.
+"""
+
+import heapq
+import time
+from search_result import SearchResult, path_parents
+
+STAT_FIELDS = ("expanded", "pushes", "pops", "stale_pops", "decreases", "peak_frontier", "wall_time")
+
+
+class SearchListener:
+    """
+    Observer for ucs / astar searches; override the events you need
+    Events are only produced while a listener is attached to the graph
+    """
+    def on_start(self, algorithm, start, goal):
+        """algorithm: 'ucs' or 'astar'"""
+
+    def on_push(self, node, priority):
+        """node entered the frontier with priority (cost, or f_cost for astar)"""
+
+    def on_decrease(self, node, priority):
+        """node, already in a decrease-key frontier, got the lower priority (ucs only)"""
+
+    def on_pop(self, node, priority, stale):
+        """stale: node was already expanded, the entry is a skipped duplicate"""
+
+    def on_expand(self, node, cost):
+        """node is expanded with its final cost from start"""
+
+    def on_goal(self, result):
+        """result: SearchResult of the search, only called when goal was reached"""
+
+    def on_finish(self, result):
+        """result: SearchResult, or None if goal was not reached"""
+
+
+class SearchStats(SearchListener):
+    def __init__(self):
+        """
+        Counters for the last query (last) and totals per algorithm (totals)
+        Attach one instance to any number of graphs to aggregate them
+        """
+        self.last = None
+        self.totals = {}
+        self._current = None
+        self._frontier = 0
+        self._started = 0.0
+
+    def on_start(self, algorithm, start, goal):
+        self._current = dict.fromkeys(STAT_FIELDS, 0)
+        self._current.update(algorithm=algorithm, start=start, goal=goal)
+        self._frontier = 0
+        self._started = time.perf_counter()
+
+    def on_push(self, node, priority):
+        current = self._current
+        current["pushes"] += 1
+        self._frontier += 1
+        if self._frontier > current["peak_frontier"]:
+            current["peak_frontier"] = self._frontier
+
+    def on_decrease(self, node, priority):
+        self._current["decreases"] += 1
+
+    def on_pop(self, node, priority, stale):
+        self._current["pops"] += 1
+        self._frontier -= 1
+        if stale:
+            self._current["stale_pops"] += 1
+
+    def on_expand(self, node, cost):
+        self._current["expanded"] += 1
+
+    def on_finish(self, result):
+        current = self._current
+        current["wall_time"] = time.perf_counter() - self._started
+        current["found"] = result is not None
+        current["cost"] = result.cost if result is not None else None
+        self.last = current
+        self._current = None
+
+        totals = self.totals.setdefault(current["algorithm"], dict(
+            dict.fromkeys(STAT_FIELDS, 0), queries=0, found=0, max_peak_frontier=0, max_wall_time=0.0))
+        totals["queries"] += 1
+        totals["found"] += current["found"]
+        for field in STAT_FIELDS:
+            totals[field] += current[field]
+        totals["max_peak_frontier"] = max(totals["max_peak_frontier"], current["peak_frontier"])
+        totals["max_wall_time"] = max(totals["max_wall_time"], current["wall_time"])
+
+    def reset(self):
+        self.last = None
+        self.totals = {}
+
+    def snapshot(self):
+        """Totals per algorithm as plain dicts (JSON-serializable)"""
+        return {algorithm: dict(totals) for algorithm, totals in self.totals.items()}
+
+    def to_prometheus(self, prefix="search"):
+        """Totals in the Prometheus text exposition format"""
+        lines = []
+        for name in ("queries", "found") + STAT_FIELDS + ("max_peak_frontier", "max_wall_time"):
+            metric = f"{prefix}_{name}" + ("_seconds" if name.endswith("wall_time") else "")
+            kind = "gauge" if name.startswith("max_") else "counter"
+            lines.append(f"# TYPE {metric} {kind}")
+            for algorithm, totals in sorted(self.totals.items()):
+                lines.append(f'{metric}{{algorithm="{algorithm}"}} {totals[name]}')
+        return "\n".join(lines) + "\n"
+
+
+def traced_search(graph, start, goal, listeners, heuristic=None):
+    """
+    The search of WeightedGraph.ucs (heuristic None) or AStarGraph.astar,
+    reporting every step to listeners; same heap entries, same result
+    Returns SearchResult if found, None otherwise
+    """
+    algorithm = "ucs" if heuristic is None else "astar"
+    for listener in listeners:
+        listener.on_start(algorithm, start, goal)
+
+    start_priority = 0 if heuristic is None else heuristic(start)
+    # Priority queue: (f_cost, g_cost, node, parent); f_cost == g_cost for ucs
+    pq = [(start_priority, 0, start, None)]
+    for listener in listeners:
+        listener.on_push(start, start_priority)
+    visited = set()
+    came_from = {}
+    result = None
+
+    while pq:
+        (f_cost, g_cost, node, parent) = heapq.heappop(pq)
+        stale = node in visited
+        for listener in listeners:
+            listener.on_pop(node, f_cost, stale)
+        if stale:
+            continue
+
+        visited.add(node)
+        if parent is not None:
+            came_from[node] = parent
+        for listener in listeners:
+            listener.on_expand(node, g_cost)
+
+        if node == goal:
+            result = SearchResult(goal, g_cost, path_parents(came_from, goal), len(visited))
+            for listener in listeners:
+                listener.on_goal(result)
+            break
+
+        if node in graph:
+            for neighbor, edge_cost in graph[node]:
+                if neighbor not in visited:
+                    new_g_cost = g_cost + edge_cost
+                    new_f_cost = new_g_cost if heuristic is None else new_g_cost + heuristic(neighbor)
+                    heapq.heappush(pq, (new_f_cost, new_g_cost, neighbor, node))
+                    for listener in listeners:
+                        listener.on_push(neighbor, new_f_cost)
+
+    for listener in listeners:
+        listener.on_finish(result)
+    return result
+
+
+# Example usage and test
+if __name__ == "__main__":
+    import json
+    from astar import AStarGraph
+    from graph_data import get_test_nodes
+    from ucs import WeightedGraph
+
+    start_node, goal_node = get_test_nodes()
+    stats = SearchStats()
+    wg = WeightedGraph()
+    ag = AStarGraph()
+    wg.add_listener(stats)
+    ag.add_listener(stats)
+
+    print("Search Instrumentation Test")
+    print("=" * 50)
+    print(f"UCS: {wg.ucs(start_node, goal_node)}")
+    print(f"Stats: {stats.last}")
+    print(f"A*: {ag.astar(start_node, goal_node)}")
+    print(f"Stats: {stats.last}")
+    print("\nTotals:")
+    print(json.dumps(stats.snapshot(), indent=2))
+    print(stats.to_prometheus(), end="")
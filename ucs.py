@@ -5,73 +5,484 @@ NIM: 32602500023
 """
 
 import heapq
+from bidirectional import add_reverse_edge, bidirectional_search, build_reverse_graph, set_edge_weight
+from csr_graph import CSRGraph, ensure_mutable
+from frontier import frontier_factory
 from graph_data import get_weighted_graph_data, get_test_nodes
+from path_tree import ShortestPathTree, TreeCache
+from search_result import SearchResult, path_parents
+from search_stats import traced_search
 
 class WeightedGraph:
-    def __init__(self):
-        self.graph = get_weighted_graph_data()
+    def __init__(self, graph=None, frontier="auto"):
+        """
+        frontier: priority queue used by ucs (see frontier.py): 'heap', 'indexed',
+        'radix', 'bucket' or 'auto' (bucket queue for small integer weights,
+        the plain heapq loop otherwise)
+        """
+        if graph is None:
+            # Private copy: edge updates must not leak into graph_data or other instances
+            graph = {node: list(edges) for node, edges in get_weighted_graph_data().items()}
+        self.graph = graph
+        self.reverse_graph = None
+        self.tree_cache = None
+        self.listeners = []
+        self.frontier = frontier
+        self._frontier_factory = None
     
     def add_edge(self, u, v, weight):
+        ensure_mutable(self.graph)
         if u not in self.graph:
             self.graph[u] = []
         self.graph[u].append((v, weight))
+        if self.reverse_graph is not None:
+            add_reverse_edge(self.reverse_graph, u, v, weight)
+        self._edges_changed()
+    
+    def update_edge(self, u, v, weight):
+        """Change the weight of the edge u -> v (every parallel copy), KeyError if there is none"""
+        ensure_mutable(self.graph)
+        if not set_edge_weight(self.graph, u, v, weight):
+            raise KeyError((u, v))
+        if self.reverse_graph is not None:
+            set_edge_weight(self.reverse_graph, v, u, weight)
+        self._edges_changed()
+    
+    def remove_edge(self, u, v):
+        """Delete the edge u -> v (every parallel copy), KeyError if there is none"""
+        ensure_mutable(self.graph)
+        if not set_edge_weight(self.graph, u, v):
+            raise KeyError((u, v))
+        if self.reverse_graph is not None:
+            set_edge_weight(self.reverse_graph, v, u)
+        self._edges_changed()
+    
+    def _edges_changed(self):
+        """Drop state derived from the edge weights"""
+        if self.tree_cache is not None:
+            self.tree_cache.clear()
+        self._frontier_factory = None
     
-    def ucs(self, start, goal):
+    def new_frontier(self):
+        """
+        Empty priority queue for ucs, chosen from the weight profile on first use
+        None means the plain heapq loop with duplicate entries
+        """
+        if self._frontier_factory is None:
+            self._frontier_factory = frontier_factory(self.graph, self.frontier) or (lambda: None)
+        return self._frontier_factory()
+    
+    def enable_tree_cache(self, max_bytes=64 * 1024 * 1024, build_after=2):
+        """
+        Answer ucs() queries from cached shortest-path trees
+        A source gets a full tree on its build_after-th query; trees are evicted
+        least recently used first once they take more than max_bytes
+        """
+        self.tree_cache = TreeCache(max_bytes, build_after)
+        return self
+    
+    def compact(self):
+        """Convert the adjacency dict to a read-only CSRGraph to save memory"""
+        if not isinstance(self.graph, CSRGraph):
+            self.graph = CSRGraph.from_adjacency(self.graph)
+            self.reverse_graph = None
+            self._frontier_factory = None
+        return self
+    
+    def add_listener(self, listener):
+        """Attach a SearchListener (e.g. SearchStats) that receives every step of ucs()"""
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+    
+    def get_reverse_graph(self):
+        """Reverse adjacency used by the backward half of bidirectional search"""
+        if self.reverse_graph is None:
+            self.reverse_graph = build_reverse_graph(self.graph)
+        return self.reverse_graph
+    
+    def ucs(self, start, goal, bidirectional=False):
         """
         UCS implementation using priority queue
-        Returns (path, total_cost) from start to goal if found, None otherwise
+        bidirectional: search from both start and goal and stop where they meet
+        Attached listeners see every step of the one-directional search
+        Returns SearchResult (unpacks as (path, total_cost)) if found, None otherwise
+        """
+        if bidirectional:
+            return bidirectional_search(self.graph, self.get_reverse_graph(), start, goal)
+        
+        if self.tree_cache is not None:
+            tree = self.tree_cache.get(start)
+            if tree is None and self.tree_cache.is_hot(start):
+                tree = self.shortest_path_tree(start)
+            if tree is not None and tree.covers(goal):
+                return tree.result(goal)
+        
+        if self.listeners:
+            # Trace the same search the untraced call runs
+            frontier = self.new_frontier()
+            if frontier is not None:
+                return self._ucs_with_frontier(frontier, start, goal, (), (), self.listeners)
+            return traced_search(self.graph, start, goal, self.listeners)
+        return self._ucs(start, goal)
+    
+    def shortest_path_tree(self, start, radius=None, targets=None):
         """
-        # Priority queue: (cumulative_cost, node, path)
-        pq = [(0, start, [start])]
+        UCS from start without a single goal: cost and parent of every node it settles
+        radius: only settle nodes whose cost is at most radius
+        targets: stop as soon as all of these nodes are settled
+        Full trees (no radius, no targets) are stored in the tree cache if enabled
+        Returns ShortestPathTree
+        """
+        full = radius is None and targets is None
+        if full and self.tree_cache is not None:
+            tree = self.tree_cache.get(start)
+            if tree is not None:
+                return tree
+        
+        remaining = set(targets) if targets is not None else None
+        frontier = self.new_frontier()
+        if frontier is not None:
+            distances, parents = self._settle_with_frontier(frontier, start, radius, remaining)
+        elif isinstance(self.graph, CSRGraph) and start in self.graph.node_index:
+            distances, parents = self._settle_ids(start, radius, remaining)
+        else:
+            distances = {}
+            parents = {}
+            pq = [(0, start, None)]
+            
+            while pq:
+                (cost, node, parent) = heapq.heappop(pq)
+                
+                if node in distances:
+                    continue
+                if radius is not None and cost > radius:
+                    break
+                
+                distances[node] = cost
+                if parent is not None:
+                    parents[node] = parent
+                
+                if remaining is not None:
+                    remaining.discard(node)
+                    if not remaining:
+                        break
+                
+                if node in self.graph:
+                    for neighbor, edge_cost in self.graph[node]:
+                        if neighbor not in distances:
+                            heapq.heappush(pq, (cost + edge_cost, neighbor, node))
+        
+        # Stopping because every target was settled leaves the rest of the graph unexplored
+        complete = remaining is None or bool(remaining)
+        tree = ShortestPathTree(start, distances, parents, radius, complete)
+        if full and self.tree_cache is not None:
+            self.tree_cache.put(tree)
+        return tree
+    
+    def _settle_ids(self, start, radius, remaining):
+        """
+        The heapq loop of shortest_path_tree on the integer ids of a CSRGraph,
+        settled nodes are translated back to names at the end
+        """
+        graph = self.graph
+        names = graph.node_names
+        neighbors = graph.weighted_neighbor_ids
+        remaining_ids = None
+        if remaining is not None:
+            remaining_ids = graph.node_ids(remaining)
+            if len(remaining_ids) < len(remaining):
+                remaining_ids.add(-1)       # unknown targets are never settled
+        
+        distances = {}
+        parents = {}
+        pq = [(0, graph.node_index[start], -1)]
+        while pq:
+            (cost, node, parent) = heapq.heappop(pq)
+            if node in distances:
+                continue
+            if radius is not None and cost > radius:
+                break
+            
+            distances[node] = cost
+            if parent >= 0:
+                parents[node] = parent
+            
+            if remaining_ids is not None:
+                remaining_ids.discard(node)
+                if not remaining_ids:
+                    remaining.clear()
+                    break
+            
+            for neighbor, edge_cost in neighbors(node):
+                if neighbor not in distances:
+                    heapq.heappush(pq, (cost + edge_cost, neighbor, node))
+        
+        return ({names[node]: cost for node, cost in distances.items()},
+                {names[node]: names[parent] for node, parent in parents.items()})
+    
+    def _settle_with_frontier(self, frontier, start, radius, remaining):
+        """The loop of shortest_path_tree on a decrease-key frontier, returns (distances, parents)"""
+        graph = self.graph
+        names = None
+        if isinstance(graph, CSRGraph) and start in graph.node_index:
+            # Integer ids, translated back to names at the end
+            names = graph.node_names
+            targets = remaining
+            if remaining is not None:
+                remaining = graph.node_ids(targets)
+                if len(remaining) < len(targets):
+                    remaining.add(-1)       # unknown targets are never settled
+            start = graph.node_index[start]
+            neighbors = graph.weighted_neighbor_ids
+        else:
+            neighbors = lambda node: graph[node] if node in graph else ()
+        
+        distances = {}
+        parents = {}
+        frontier.push(start, 0)
+        stopped = False
+        
+        while frontier:
+            (cost, node) = frontier.pop()
+            if radius is not None and cost > radius:
+                stopped = True
+                break
+            
+            distances[node] = cost
+            
+            if remaining is not None:
+                remaining.discard(node)
+                if not remaining:
+                    stopped = True
+                    break
+            
+            for neighbor, edge_cost in neighbors(node):
+                if frontier.push(neighbor, cost + edge_cost):
+                    parents[neighbor] = node
+        
+        if stopped:
+            # Stopped early: drop the parents of nodes that were never settled
+            parents = {node: parent for node, parent in parents.items() if node in distances}
+        if names is not None:
+            if remaining is not None and not remaining:
+                targets.clear()
+            distances = {names[node]: cost for node, cost in distances.items()}
+            parents = {names[node]: names[parent] for node, parent in parents.items()}
+        return distances, parents
+    
+    def _ucs(self, start, goal, blocked_nodes=(), blocked_edges=()):
+        """
+        UCS that never enters blocked_nodes and never uses an edge (u, v) in
+        blocked_edges (used for the spur searches of k_shortest_paths)
+        """
+        if start in blocked_nodes:
+            return None
+        
+        frontier = self.new_frontier()
+        if frontier is not None:
+            return self._ucs_with_frontier(frontier, start, goal, blocked_nodes, blocked_edges)
+        
+        graph = self.graph
+        if isinstance(graph, CSRGraph) and start in graph.node_index and goal in graph.node_index:
+            index = graph.node_index
+            goal_id = index[goal]
+            blocked_edge_ids = {(index[u], index[v]) for u, v in blocked_edges if u in index and v in index}
+            found = self._ucs_ids(index[start], goal_id, graph.node_ids(blocked_nodes), blocked_edge_ids)
+            if found is None:
+                return None
+            cost, parent_ids, expanded = found
+            return SearchResult(goal, cost, graph.parent_names(parent_ids, goal_id), expanded)
+        
+        # Priority queue: (cumulative_cost, node, parent)
+        pq = [(0, start, None)]
         visited = set()
+        parents = {}
         
         while pq:
-            (cost, node, path) = heapq.heappop(pq)
+            (cost, node, parent) = heapq.heappop(pq)
             
             if node in visited:
                 continue
             
             visited.add(node)
+            if parent is not None:
+                parents[node] = parent
             
             if node == goal:
-                return (path, cost)
+                return SearchResult(goal, cost, path_parents(parents, goal), len(visited))
             
             if node in self.graph:
                 for neighbor, edge_cost in self.graph[node]:
-                    if neighbor not in visited:
-                        new_cost = cost + edge_cost
-                        heapq.heappush(pq, (new_cost, neighbor, path + [neighbor]))
+                    if neighbor in visited or neighbor in blocked_nodes:
+                        continue
+                    if blocked_edges and (node, neighbor) in blocked_edges:
+                        continue
+                    new_cost = cost + edge_cost
+                    heapq.heappush(pq, (new_cost, neighbor, node))
         
         return None
     
-    def get_all_paths_cost(self, start, goal):
+    def _ucs_ids(self, start, goal, blocked_nodes, blocked_edges):
         """
-        Alternative implementation to find all paths with their costs
-        Returns list of (path, cost) tuples
+        The heapq loop of _ucs on the integer ids of a CSRGraph, without building
+        (name, weight) lists; returns (cost, parent ids, expanded) or None
         """
-        paths = []
+        neighbors = self.graph.weighted_neighbor_ids
+        visited = bytearray(self.graph.node_count())
+        parents = {}
+        expanded = 0
+        pq = [(0, start, -1)]
         
-        def dfs(current, goal, path, cost, visited):
-            if current == goal:
-                paths.append((path.copy(), cost))
-                return
+        while pq:
+            (cost, node, parent) = heapq.heappop(pq)
+            if visited[node]:
+                continue
             
-            if current in visited:
-                return
+            visited[node] = 1
+            expanded += 1
+            if parent >= 0:
+                parents[node] = parent
+            if node == goal:
+                return cost, parents, expanded
             
-            visited.add(current)
+            for neighbor, edge_cost in neighbors(node):
+                if visited[neighbor] or neighbor in blocked_nodes:
+                    continue
+                if blocked_edges and (node, neighbor) in blocked_edges:
+                    continue
+                heapq.heappush(pq, (cost + edge_cost, neighbor, node))
+        
+        return None
+    
+    def _ucs_with_frontier(self, frontier, start, goal, blocked_nodes=(), blocked_edges=(), listeners=()):
+        """
+        The loop of _ucs on a decrease-key frontier: priorities are lowered instead
+        of queueing duplicates, so every pop is a new node and parents holds the
+        best parent found so far
+        listeners: SearchListeners told about every step (lowered priorities via on_decrease)
+        """
+        graph = self.graph
+        names = None
+        if isinstance(graph, CSRGraph) and not listeners and start in graph.node_index:
+            # Integer ids, translated back to names in the result
+            index = graph.node_index
+            names = graph.node_names
+            blocked_edges = {(index[u], index[v]) for u, v in blocked_edges if u in index and v in index}
+            blocked_nodes = graph.node_ids(blocked_nodes)
+            start, goal = index[start], index.get(goal, -1)
+            neighbors = graph.weighted_neighbor_ids
+        else:
+            neighbors = lambda node: graph[node] if node in graph else ()
+        
+        for listener in listeners:
+            listener.on_start("ucs", start, goal)
+        push, pop = frontier.push, frontier.pop
+        push(start, 0)
+        for listener in listeners:
+            listener.on_push(start, 0)
+        parents = {}
+        expanded = 0
+        result = None
+        
+        while frontier:
+            (cost, node) = pop()
+            expanded += 1
+            if listeners:
+                for listener in listeners:
+                    listener.on_pop(node, cost, False)
+                for listener in listeners:
+                    listener.on_expand(node, cost)
             
-            if current in self.graph:
-                for neighbor, edge_cost in self.graph[current]:
-                    if neighbor not in visited:
-                        path.append(neighbor)
-                        dfs(neighbor, goal, path, cost + edge_cost, visited)
-                        path.pop()
+            if node == goal:
+                if names is not None:
+                    result = SearchResult(names[goal], cost, graph.parent_names(parents, goal), expanded)
+                else:
+                    result = SearchResult(goal, cost, path_parents(parents, goal), expanded)
+                for listener in listeners:
+                    listener.on_goal(result)
+                break
             
-            visited.remove(current)
+            for neighbor, edge_cost in neighbors(node):
+                if neighbor in blocked_nodes:
+                    continue
+                if blocked_edges and (node, neighbor) in blocked_edges:
+                    continue
+                new_cost = cost + edge_cost
+                if push(neighbor, new_cost):
+                    if listeners:
+                        # A node with a parent is already queued: its priority was lowered
+                        queued = neighbor in parents
+                        for listener in listeners:
+                            if queued:
+                                listener.on_decrease(neighbor, new_cost)
+                            else:
+                                listener.on_push(neighbor, new_cost)
+                    parents[neighbor] = node
+        
+        for listener in listeners:
+            listener.on_finish(result)
+        return result
+    
+    def edge_cost(self, u, v):
+        """Cost of the cheapest edge u -> v"""
+        return min(cost for neighbor, cost in self.graph[u] if neighbor == v)
+    
+    def k_shortest_paths(self, start, goal, k=None):
+        """
+        Yen's algorithm: yield simple paths from start to goal in increasing cost order
+        Each new path costs at most len(previous path) spur searches with _ucs,
+        so taking the first few alternatives is cheap; k=None yields every simple path
+        Parallel edges count once (the cheapest), paths are node sequences
+        Yields SearchResult (unpacks as (path, total_cost)); expanded counts the
+        nodes expanded by the searches that produced it
+        """
+        first = self._ucs(start, goal)
+        if first is None or k == 0:
+            return
+        found = [first.path]
+        yield first
         
-        dfs(start, goal, [start], 0, set())
-        return sorted(paths, key=lambda x: x[1])  # Sort by cost
+        candidates = []  # heap of (cost, counter, path)
+        seen = {tuple(first.path)}
+        counter = 0
+        while k is None or len(found) < k:
+            previous = found[-1]
+            prefix_costs = [0]
+            for u, v in zip(previous, previous[1:]):
+                prefix_costs.append(prefix_costs[-1] + self.edge_cost(u, v))
+            
+            expanded = 0
+            for i in range(len(previous) - 1):
+                spur_node = previous[i]
+                root = previous[:i + 1]
+                # Edges leaving the root that an accepted path already takes
+                blocked_edges = {(path[i], path[i + 1]) for path in found
+                                 if len(path) > i + 1 and path[:i + 1] == root}
+                spur = self._ucs(spur_node, goal, set(root[:-1]), blocked_edges)
+                if spur is None:
+                    continue
+                expanded += spur.expanded
+                path = root[:-1] + spur.path
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    counter += 1
+                    heapq.heappush(candidates, (prefix_costs[i] + spur.cost, counter, path))
+            
+            if not candidates:
+                return
+            (cost, _, path) = heapq.heappop(candidates)
+            found.append(path)
+            parents = {path[j + 1]: path[j] for j in range(len(path) - 1)}
+            yield SearchResult(goal, cost, parents, expanded)
+    
+    def get_all_paths_cost(self, start, goal, k=None):
+        """
+        All simple paths (or the best k) with their costs, cheapest first
+        Returns list of (path, cost) tuples
+        """
+        return [(result.path, result.cost) for result in self.k_shortest_paths(start, goal, k)]
 
 
 # Example usage and test
@@ -99,8 +510,18 @@ if __name__ == "__main__":
     else:
         print(f"No path found from {start_node} to {goal_node}")
     
+    print("\nBidirectional UCS:")
+    print(f"Result: {wg.ucs(start_node, goal_node, bidirectional=True)}")
+    
     # Show all possible paths with costs for comparison
     print("\nAll possible paths (sorted by cost):")
     all_paths = wg.get_all_paths_cost(start_node, goal_node)
     for i, (path, cost) in enumerate(all_paths, 1):
-        print(f"Path {i}: {path} - Cost: {cost}")
\ No newline at end of file
+        print(f"Path {i}: {path} - Cost: {cost}")    
+    print("\nShortest-path tree:")
+    tree = wg.shortest_path_tree(start_node)
+    print(f"Distances from {start_node}: {tree.distances}")
+    print(f"Within cost 4: {sorted(wg.shortest_path_tree(start_node, radius=4).distances)}")
+    wg.enable_tree_cache(build_after=1)
+    for goal in ('G', 'I'):
+        print(f"Cached query {start_node} -> {goal}: {wg.ucs(start_node, goal)}")